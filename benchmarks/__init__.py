@@ -0,0 +1,26 @@
+#  Copyright (c) 2025 Coyote3 Project Authors
+#  All rights reserved.
+#
+#  This source file is part of the Coyote3 codebase.
+#  The Coyote3 project provides a framework for genomic data analysis,
+#  interpretation, reporting, and clinical diagnostics.
+#
+#  Unauthorized use, distribution, or modification of this software or its
+#  components is strictly prohibited without prior written permission from
+#  the copyright holders.
+#
+
+"""
+Coyote3 Benchmarks
+=====================================
+
+Performance benchmarks for the DNA and coverage hot paths.
+
+- `benchmarks.synthetic` generates a reproducible synthetic dataset (samples, variants,
+  annotations, blacklist, coverage, CNVs and the assay configuration) at panel, exome or
+  WGS scale.
+- `benchmarks.run` loads it into a local mongod or mongomock, times the hot paths and
+  writes the results as JSON, so runs can be compared.
+
+Run with `python -m benchmarks --help`.
+"""
@@ -0,0 +1,320 @@
+#  Copyright (c) 2025 Coyote3 Project Authors
+#  All rights reserved.
+#
+#  This source file is part of the Coyote3 codebase.
+#  The Coyote3 project provides a framework for genomic data analysis,
+#  interpretation, reporting, and clinical diagnostics.
+#
+#  Unauthorized use, distribution, or modification of this software or its
+#  components is strictly prohibited without prior written permission from
+#  the copyright holders.
+#
+
+"""
+Coyote3 Benchmark Checks
+=====================================
+
+Correctness checks run by the benchmark before timing. The timed paths fetch projected
+documents, resolve annotations in bulk and page lists, so each check compares such a path
+with the straightforward one it replaces on the loaded `SyntheticDataset`:
+
+- `annotations.projection`: `add_global_annotations` on `list` and `report` projected
+  variants gives the same annotations and classifications as on full documents
+- `annotations.bulk`: the bulk annotation resolvers agree with the per-variant ones
+- `dna.snv_list`: `get_snv_list` with a small first page agrees with `get_filtered_snvs`
+- `dna.variant_pages`: walking `get_variant_page` with its cursors lists every variant once
+- `home.samples_pages`: walking `get_samples` with its cursors matches the unlimited list
+- `sections.request_state`: `SectionLoader` sections share the request cache and `flask.g`
+  with the view that runs them
+
+A check returns the differences it found; an empty list means it passed, and an exception
+fails it.
+"""
+
+# -------------------------------------------------------------------------
+# Imports
+# -------------------------------------------------------------------------
+from typing import Callable
+
+# Fields set by `DNAUtility.add_global_annotations`
+ANNOTATED_FIELDS = (
+    "global_annotations",
+    "classification",
+    "other_classification",
+    "annotations_interesting",
+    "additional_classification",
+)
+
+# Differences reported per failed check
+MAX_DIFFERENCES = 5
+
+
+def snv_settings(sample: dict) -> dict:
+    """
+    Return the `build_query` settings of a sample with its own filters and no gene filter.
+    """
+    from coyote.extensions import util
+
+    filters = sample["filters"]
+    return {
+        "id": str(sample["_id"]),
+        "max_freq": filters["max_freq"],
+        "min_freq": filters["min_freq"],
+        "max_control_freq": filters["max_control_freq"],
+        "min_depth": filters["min_depth"],
+        "min_alt_reads": filters["min_alt_reads"],
+        "max_popfreq": filters["max_popfreq"],
+        "filter_conseq": util.dna.get_filter_conseq_terms(filters["vep_consequences"]),
+        "filter_genes": [],
+        "disp_pos": [],
+    }
+
+
+def _ids(documents: list) -> list[str]:
+    return [str(doc["_id"]) for doc in documents]
+
+
+def check_projection(dataset, settings: dict) -> list[str]:
+    """
+    Compare `add_global_annotations` on projected and on full variant documents.
+    """
+    from coyote.blueprints.dna.varqueries import build_query
+    from coyote.extensions import store, util
+
+    query = build_query(dataset.assay_group, settings)
+    full = list(store.variant_handler.get_case_variants(query))
+    expected, expected_tiers = util.dna.add_global_annotations(full, dataset.assay_group, None)
+    expected = {str(var["_id"]): var for var in expected}
+
+    differences = []
+    for profile in ("list", "report"):
+        projected = list(store.variant_handler.get_case_variants(query, profile=profile))
+        annotated, tiers = util.dna.add_global_annotations(projected, dataset.assay_group, None)
+        if sorted(_ids(tiers)) != sorted(_ids(expected_tiers)):
+            differences.append(f"{profile}: tiered variants differ")
+        if sorted(_ids(annotated)) != sorted(expected):
+            differences.append(f"{profile}: variant ids differ")
+            continue
+        for var in annotated:
+            for field in ANNOTATED_FIELDS:
+                if var.get(field) != expected[str(var["_id"])].get(field):
+                    differences.append(f"{profile}: {field} differs for {var['_id']}")
+    return differences
+
+
+def check_bulk(dataset, settings: dict) -> list[str]:
+    """
+    Compare the bulk annotation resolvers with one lookup per variant.
+    """
+    from coyote.blueprints.dna.varqueries import build_query
+    from coyote.extensions import store
+
+    handler = store.annotation_handler
+    variants = list(
+        store.variant_handler.get_case_variants(
+            build_query(dataset.assay_group, settings), profile="list"
+        )
+    )
+    global_bulk = handler.get_global_annotations_bulk(variants, dataset.assay_group, None)
+    additional_bulk = handler.get_additional_classifications_bulk(
+        variants, dataset.assay_group, None
+    )
+
+    differences = []
+    for index, var in enumerate(variants):
+        if global_bulk[index] != handler.get_global_annotations(var, dataset.assay_group, None):
+            differences.append(f"global annotations differ for {var['_id']}")
+        single = handler.get_additional_classifications(var, dataset.assay_group, None)
+        if _ids(additional_bulk[index]) != _ids(single):
+            differences.append(f"additional classifications differ for {var['_id']}")
+    return differences
+
+
+def check_snv_list(dataset, settings: dict) -> list[str]:
+    """
+    Compare the first page of `get_snv_list` with the whole enriched list.
+    """
+    from coyote.extensions import util
+
+    full, full_tiers = util.dna.get_filtered_snvs(dataset.assay_group, None, settings)
+    ordered = sorted(
+        full, key=lambda var: (util.dna.variant_sort_value(var, "af"), var["_id"]), reverse=True
+    )
+    expected = {str(var["_id"]): var for var in full}
+
+    differences = []
+    # A first page of a long list, and a list that fits on the page
+    for page_size in (max(1, len(full) // 4), max(1, len(full))):
+        rows, tiers, total, next_cursor = util.dna.get_snv_list(
+            dataset.assay_group, None, settings, page_size
+        )
+        if total != len(full):
+            differences.append(f"{page_size}: total {total} != {len(full)} filtered variants")
+        if sorted(_ids(tiers)) != sorted(_ids(full_tiers)):
+            differences.append(f"{page_size}: tiered variants differ")
+        if [tier["classification"] for tier in sorted(tiers, key=lambda var: var["_id"])] != [
+            tier["classification"] for tier in sorted(full_tiers, key=lambda var: var["_id"])
+        ]:
+            differences.append(f"{page_size}: tier classifications differ")
+        if _ids(rows) != _ids(ordered[:page_size]):
+            differences.append(f"{page_size}: first page differs from the AF ordered list")
+        if (len(full) > page_size) != (next_cursor is not None):
+            differences.append(f"{page_size}: next page cursor does not match the total")
+        for var in rows:
+            for field in ANNOTATED_FIELDS:
+                if var.get(field) != expected[str(var["_id"])].get(field):
+                    differences.append(f"{page_size}: {field} differs for {var['_id']}")
+    return differences
+
+
+def check_variant_pages(dataset, settings: dict) -> list[str]:
+    """
+    Walk every sort order of `get_variant_page` and compare with the whole filtered list.
+    """
+    from coyote.extensions import util
+
+    full, _ = util.dna.get_filtered_snvs(dataset.assay_group, None, settings)
+    page_size = max(1, len(full) // 5)
+    differences = []
+    for sort in ("gene", "af", "depth", "tier"):
+        for direction in (1, -1):
+            seen = []
+            after = None
+            while True:
+                page, has_more = util.dna.get_variant_page(
+                    dataset.assay_group,
+                    None,
+                    settings,
+                    sort=sort,
+                    direction=direction,
+                    after=after,
+                    limit=page_size,
+                )
+                seen.extend(_ids(page))
+                if not has_more or not page:
+                    break
+                token = util.dna.encode_variant_cursor(page[-1], sort, direction)
+                after = util.dna.decode_variant_cursor(token, sort, direction)
+            if sorted(seen) != sorted(_ids(full)):
+                differences.append(f"{sort}/{direction}: pages do not list every variant once")
+    return differences
+
+
+def check_samples_pages(dataset, settings: dict) -> list[str]:
+    """
+    Walk the samples home lists with their cursors and compare with the unlimited lists.
+    """
+    from coyote.extensions import store
+
+    handler = store.sample_handler
+    differences = []
+    for report in (False, True):
+        options = {
+            "user_assays": [dataset.assay],
+            "user_envs": ["production"],
+            "report": report,
+            "use_cache": False,
+        }
+        expected = _ids(handler.get_samples(**options))
+        page_size = max(1, len(expected) // 3)
+        seen = []
+        after = None
+        while True:
+            page = handler.get_samples(**options, limit=page_size, after=after)
+            seen.extend(_ids(page))
+            if len(page) < page_size:
+                break
+            after = handler.list_cursor(page[-1])
+        if seen != expected:
+            differences.append(f"report={report}: paged list differs from the unlimited list")
+    return differences
+
+
+def check_section_state(dataset, settings: dict) -> list[str]:
+    """
+    Run two sections on the section pool and check they share the view's request state.
+    """
+    from flask import g
+    from coyote.extensions import store
+    from coyote.util.section_loader import SectionLoader
+
+    cache = store.request_cache
+    loads = []
+
+    def loader(value: str) -> Callable[[], str]:
+        def load() -> str:
+            loads.append(value)
+            return value
+
+        return load
+
+    cache.get_or_load("benchmark", "view", loader("view"))
+    g.benchmark_marker = "view"
+
+    def section(name: str) -> tuple:
+        return (
+            cache.get_or_load("benchmark", "view", loader(f"{name}:view")),
+            cache.get_or_load("benchmark", name, loader(name)),
+            g.get("benchmark_marker"),
+        )
+
+    sections = SectionLoader("benchmark")
+    for name in ("first", "second"):
+        sections.add(name, section, name)
+    results = sections.run()
+
+    differences = []
+    for name, (view_value, _, marker) in results.items():
+        if view_value != "view" or f"{name}:view" in loads:
+            differences.append(f"{name}: the view's request cache entry was reloaded")
+        if marker != "view":
+            differences.append(f"{name}: flask.g of the view is not visible")
+    for name in results:
+        if cache.get_or_load("benchmark", name, loader(f"view:{name}")) != name:
+            differences.append(f"the view reloaded the request cache entry of {name}")
+    if len(loads) != 3:
+        differences.append(f"expected 3 loads, got {loads}")
+    return differences
+
+
+CHECKS: list[tuple[str, Callable[..., list[str]]]] = [
+    ("annotations.projection", check_projection),
+    ("annotations.bulk", check_bulk),
+    ("dna.snv_list", check_snv_list),
+    ("dna.variant_pages", check_variant_pages),
+    ("home.samples_pages", check_samples_pages),
+    ("sections.request_state", check_section_state),
+]
+
+
+def run_checks(app, dataset) -> list[dict]:
+    """
+    Run every check on the target sample of the dataset, each in its own request context.
+
+    Args:
+        app: The Flask application.
+        dataset (SyntheticDataset): The loaded dataset.
+
+    Returns:
+        list[dict]: Per check its name, whether it passed and the first differences found.
+    """
+    from coyote.extensions import store
+
+    with app.test_request_context():
+        settings = snv_settings(store.sample_handler.get_sample(dataset.target["name"]))
+
+    results = []
+    for name, check in CHECKS:
+        with app.test_request_context(f"/benchmark/check/{name}"):
+            try:
+                differences = check(dataset, settings)
+            except Exception as exc:
+                differences = [f"{type(exc).__name__}: {exc}"]
+        results.append(
+            {
+                "name": name,
+                "passed": not differences,
+                "differences": differences[:MAX_DIFFERENCES],
+            }
+        )
+    return results
@@ -0,0 +1,328 @@
+#  Copyright (c) 2025 Coyote3 Project Authors
+#  All rights reserved.
+#
+#  This source file is part of the Coyote3 codebase.
+#  The Coyote3 project provides a framework for genomic data analysis,
+#  interpretation, reporting, and clinical diagnostics.
+#
+#  Unauthorized use, distribution, or modification of this software or its
+#  components is strictly prohibited without prior written permission from
+#  the copyright holders.
+#
+
+"""
+Coyote3 Benchmark Runner
+=====================================
+
+Loads a `SyntheticDataset` into the `coyote3_benchmark` database and times the DNA and
+coverage hot paths on its target sample:
+
+- `dna.snv_query`: `build_query` + `VariantsHandler.get_case_variants` (list projection)
+- `dna.add_global_annotations`: `DNAUtility.add_global_annotations` on the fetched variants
+- `dna.report_payload`: `DNAUtility.build_dna_report_payload`, the full report HTML
+- `coverage.filter`: the coverage view steps of `CoverageUtility`
+- `home.samples`: the live and reported samples home queries (`SampleHandler.get_samples`)
+
+Every run executes in its own request context, like a request to the app. Before timing,
+the correctness checks of `benchmarks.checks` compare the optimized paths with the
+straightforward ones; the runner exits with status 1 if one of them fails. Results are
+written as JSON (check outcomes, timings in milliseconds, plus the MongoDB command count per
+run when the query statistics listener is attached); `--compare` adds the median ratio
+against an earlier result file.
+
+Example Commands
+
+python -m benchmarks --backend mongomock --scale panel
+
+FLASK_MONGO_HOST=localhost python -m benchmarks --backend mongod --scale exome --output exome.json
+
+python -m benchmarks --backend mongod --scale exome --compare exome.json --skip-load
+"""
+
+# -------------------------------------------------------------------------
+# Imports
+# -------------------------------------------------------------------------
+from copy import deepcopy
+from datetime import datetime, timezone
+from statistics import mean, median
+from typing import Any, Callable
+import argparse
+import json
+import logging
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+BENCHMARK_DB_NAME = "coyote3_benchmark"
+
+# The benchmark always writes to its own database, never to a configured one
+os.environ["COYOTE3_DB_NAME"] = BENCHMARK_DB_NAME
+os.environ.setdefault("CACHE_TYPE", "SimpleCache")
+sys.path.insert(0, str(ROOT))
+
+from benchmarks.checks import run_checks, snv_settings  # noqa: E402
+from benchmarks.synthetic import SCALES, SyntheticDataset  # noqa: E402
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """
+    Return the `pct` percentile (0-100) of a list of numbers (nearest rank).
+    """
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def time_case(
+    app,
+    name: str,
+    func: Callable[[Any], Any],
+    setup: Callable[[], Any] | None = None,
+    repeat: int = 10,
+    warmup: int = 2,
+) -> dict:
+    """
+    Time a hot path; every run gets its own request context.
+
+    Args:
+        app: The Flask application.
+        name (str): Name of the case in the results.
+        func (Callable): The timed call; gets the result of `setup` and returns the items it
+            produced (a list or a count).
+        setup (Callable | None): Untimed preparation per run, e.g. copying input documents.
+        repeat (int): Timed runs.
+        warmup (int): Untimed runs before the timed ones.
+
+    Returns:
+        dict: Timing summary of the case.
+    """
+    from coyote.db.query_stats import QueryStats
+    from flask import request
+
+    timings = []
+    commands = []
+    items = None
+    for run in range(warmup + repeat):
+        with app.test_request_context(f"/benchmark/{name}"):
+            arg = setup() if setup else None
+            start = time.perf_counter()
+            result = func(arg)
+            elapsed = (time.perf_counter() - start) * 1000
+            queries = request.environ.get(QueryStats.ENVIRON_KEY)
+        if run < warmup:
+            continue
+        timings.append(elapsed)
+        if queries is not None:
+            commands.append(queries.commands)
+        items = result if isinstance(result, int) else len(result)
+
+    summary = {
+        "name": name,
+        "runs": repeat,
+        "items": items,
+        "min_ms": round(min(timings), 3),
+        "median_ms": round(median(timings), 3),
+        "mean_ms": round(mean(timings), 3),
+        "p95_ms": round(percentile(timings, 95), 3),
+        "max_ms": round(max(timings), 3),
+    }
+    if commands:
+        summary["mongo_commands"] = median(commands)
+    return summary
+
+
+def run_cases(app, dataset: SyntheticDataset, repeat: int, warmup: int) -> list[dict]:
+    """
+    Time every hot path on the target sample of the dataset.
+    """
+    from coyote.blueprints.dna.varqueries import build_query
+    from coyote.extensions import store, util
+    from coyote.util.misc import get_sample_and_assay_config
+
+    sample_name = dataset.target["name"]
+    assay_group = dataset.assay_group
+    page_size = app.config.get("SAMPLES_HOME_PAGE_SIZE", 500)
+
+    def snv_query(_) -> list:
+        sample = store.sample_handler.get_sample(sample_name)
+        query = build_query(assay_group, snv_settings(sample))
+        return list(store.variant_handler.get_case_variants(query, profile="list"))
+
+    with app.test_request_context():
+        list_variants = store.blacklist_handler.add_blacklist_data(snv_query(None), assay_group)
+
+    def global_annotations(variants: list) -> list:
+        variants, _ = util.dna.add_global_annotations(variants, assay_group, None)
+        return variants
+
+    def report_payload(_) -> int:
+        sample, assay_config, _schema = get_sample_and_assay_config(sample_name)
+        html, _rows = util.dna.build_dna_report_payload(sample, assay_config)
+        return len(html)
+
+    def coverage_filter(_) -> dict:
+        sample = store.sample_handler.get_sample(sample_name)
+        assay_panel_doc = store.asp_handler.get_asp(asp_name=sample["assay"])
+        cov_dict = store.coverage2_handler.get_sample_coverage(str(sample["_id"]))
+        del cov_dict["_id"]
+        blacklist = util.coverage.load_blacklist(assay_group)
+        filtered = util.coverage.filter_genes_from_form(
+            cov_dict, assay_panel_doc.get("covered_genes", []), assay_group, blacklist
+        )
+        filtered = util.coverage.find_low_covered_genes(filtered, 500, assay_group, blacklist)
+        util.coverage.coverage_table(filtered, 500)
+        return util.coverage.organize_data_for_d3(filtered)["genes"]
+
+    def samples_home(_) -> list:
+        lists = [
+            store.sample_handler.get_samples(
+                user_assays=[dataset.assay],
+                user_envs=["production"],
+                report=report,
+                limit=page_size,
+                use_cache=False,
+            )
+            for report in (False, True)
+        ]
+        return lists[0] + lists[1]
+
+    cases = [
+        ("dna.snv_query", snv_query, None),
+        ("dna.add_global_annotations", global_annotations, lambda: deepcopy(list_variants)),
+        ("dna.report_payload", report_payload, None),
+        ("coverage.filter", coverage_filter, None),
+        ("home.samples", samples_home, None),
+    ]
+    return [
+        time_case(app, name, func, setup, repeat=repeat, warmup=warmup)
+        for name, func, setup in cases
+    ]
+
+
+def compare(results: list[dict], baseline_path: str) -> list[dict]:
+    """
+    Return the median ratio (current / baseline) of every case found in a baseline file.
+    """
+    with open(baseline_path) as handle:
+        baseline = {case["name"]: case for case in json.load(handle)["results"]}
+    comparison = []
+    for case in results:
+        before = baseline.get(case["name"])
+        if before and before["median_ms"]:
+            comparison.append(
+                {
+                    "name": case["name"],
+                    "baseline_median_ms": before["median_ms"],
+                    "median_ms": case["median_ms"],
+                    "ratio": round(case["median_ms"] / before["median_ms"], 3),
+                }
+            )
+    return comparison
+
+
+def git_revision() -> str | None:
+    """
+    Return the commit the benchmark runs on, if available.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the DNA and coverage hot paths.")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="panel")
+    parser.add_argument(
+        "--backend",
+        choices=["mongomock", "mongod"],
+        default="mongomock",
+        help="mongod uses FLASK_MONGO_HOST / FLASK_MONGO_PORT, database coyote3_benchmark",
+    )
+    parser.add_argument("--assay-group", default="myeloid", help="Decides the variant query")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=10, help="Timed runs per case")
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed runs per case")
+    parser.add_argument(
+        "--skip-load", action="store_true", help="Reuse data loaded by an earlier mongod run"
+    )
+    parser.add_argument("--output", help="Write the JSON results to this file (default stdout)")
+    parser.add_argument("--compare", help="Earlier result file to compare medians against")
+    parser.add_argument(
+        "--skip-checks", action="store_true", help="Time the cases without the correctness checks"
+    )
+    parser.add_argument("--verbose", action="store_true", help="Show the application logs")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING)
+    logging.getLogger("coyote").setLevel(logging.INFO if args.verbose else logging.WARNING)
+
+    from coyote import init_app
+
+    mongo_client = None
+    if args.backend == "mongomock":
+        import mongomock
+
+        mongo_client = mongomock.MongoClient()
+    app = init_app(mongo_client=mongo_client)
+    if not args.verbose:
+        app.logger.setLevel(logging.WARNING)
+
+    from coyote.extensions import store
+
+    dataset = SyntheticDataset(args.scale, args.assay_group, args.seed)
+    loaded = {}
+    load_seconds = 0.0
+    checks = []
+    with app.app_context():
+        if not (args.skip_load and args.backend == "mongod"):
+            start = time.perf_counter()
+            loaded = dataset.load(store)
+            load_seconds = round(time.perf_counter() - start, 3)
+        if not args.skip_checks:
+            checks = run_checks(app, dataset)
+        results = run_cases(app, dataset, repeat=args.repeat, warmup=args.warmup)
+
+    import pymongo
+
+    report = {
+        "benchmark": "coyote3",
+        "created": datetime.now(timezone.utc).isoformat(),
+        "git": git_revision(),
+        "app_version": app.config.get("APP_VERSION"),
+        "python": platform.python_version(),
+        "pymongo": pymongo.version,
+        "backend": args.backend,
+        "scale": args.scale,
+        "params": SCALES[args.scale],
+        "assay_group": args.assay_group,
+        "seed": args.seed,
+        "loaded": loaded,
+        "load_seconds": load_seconds,
+        "checks": checks,
+        "results": results,
+    }
+    if args.compare:
+        report["comparison"] = compare(results, args.compare)
+
+    output = json.dumps(report, indent=2, default=str)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(output + "\n")
+    else:
+        print(output)
+    failed = [check["name"] for check in checks if not check["passed"]]
+    if failed:
+        print(f"Correctness checks failed: {', '.join(failed)}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
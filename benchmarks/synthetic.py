@@ -0,0 +1,654 @@
+#  Copyright (c) 2025 Coyote3 Project Authors
+#  All rights reserved.
+#
+#  This source file is part of the Coyote3 codebase.
+#  The Coyote3 project provides a framework for genomic data analysis,
+#  interpretation, reporting, and clinical diagnostics.
+#
+#  Unauthorized use, distribution, or modification of this software or its
+#  components is strictly prohibited without prior written permission from
+#  the copyright holders.
+#
+
+"""
+Coyote3 Synthetic Benchmark Data
+=====================================
+
+This module generates a reproducible synthetic DNA dataset shaped like the documents the
+pipeline loads into Coyote3:
+
+- `samples` for the samples home lists, one of them (`target`) with all its data loaded,
+- `variants` with `INFO.CSQ` transcripts, a `selected_CSQ`, case/control `GT` arrays,
+  population frequencies and COSMIC hotspots,
+- `annotation` classifications and texts matching part of the variants,
+- `blacklist` positions, `panel_cov` coverage (CDS, probes and exons per gene) and a
+  `group_coverage` blacklist,
+- `cnvs`,
+- the assay configuration (`assay_specific_panels`, `asp_configs`, the DNA schema from
+  `schemas/dna_aspc.json`, an in-silico gene list and the VEP metadata).
+
+The same seed and scale always give the same documents. `SCALES` defines the panel,
+exome and WGS presets.
+"""
+
+# -------------------------------------------------------------------------
+# Imports
+# -------------------------------------------------------------------------
+from datetime import datetime, timedelta
+from hashlib import md5
+from pathlib import Path
+from typing import Iterator
+import json
+import random
+from bson import ObjectId
+
+
+# Dataset sizes per preset
+SCALES: dict[str, dict[str, int]] = {
+    "panel": {
+        "genes": 200,
+        "samples": 500,
+        "variant_samples": 10,
+        "variants_per_sample": 400,
+        "cnvs_per_sample": 20,
+        "annotations": 2000,
+        "blacklist": 1000,
+        "exons_per_gene": 12,
+        "probes_per_gene": 24,
+    },
+    "exome": {
+        "genes": 2000,
+        "samples": 2000,
+        "variant_samples": 10,
+        "variants_per_sample": 4000,
+        "cnvs_per_sample": 200,
+        "annotations": 10000,
+        "blacklist": 10000,
+        "exons_per_gene": 10,
+        "probes_per_gene": 20,
+    },
+    "wgs": {
+        "genes": 5000,
+        "samples": 5000,
+        "variant_samples": 5,
+        "variants_per_sample": 30000,
+        "cnvs_per_sample": 1000,
+        "annotations": 20000,
+        "blacklist": 50000,
+        "exons_per_gene": 10,
+        "probes_per_gene": 0,
+    },
+}
+
+# asp_family per preset, decides how gene lists are matched against the panel
+ASP_FAMILIES = {"panel": "panel-dna", "exome": "wes", "wgs": "wgs"}
+
+# Well-known genes first, so hotspot, FLT3 and promoter rules of the queries are exercised
+KNOWN_GENES = [
+    "FLT3", "NPM1", "DNMT3A", "TET2", "ASXL1", "IDH1", "IDH2", "RUNX1", "TP53", "CEBPA",
+    "KRAS", "NRAS", "KIT", "JAK2", "CALR", "MPL", "SF3B1", "SRSF2", "U2AF1", "EZH2",
+    "BRAF", "EGFR", "PIK3CA", "PTEN", "BRCA1", "BRCA2", "ERBB2", "ALK", "TERT", "NFKBIE",
+]  # fmt: skip
+
+CHROMOSOMES = [str(c) for c in range(1, 23)] + ["X"]
+
+VEP_VERSION = 103
+
+# Consequences with their relative frequency among synthetic variants
+CONSEQUENCES = [
+    ("missense_variant", 40),
+    ("synonymous_variant", 20),
+    ("intron_variant", 12),
+    ("frameshift_variant", 6),
+    ("stop_gained", 5),
+    ("splice_region_variant", 5),
+    ("inframe_deletion", 3),
+    ("splice_acceptor_variant", 2),
+    ("3_prime_UTR_variant", 5),
+    ("regulatory_region_variant", 2),
+]
+
+AMINO_ACIDS = ["Ala", "Arg", "Asn", "Asp", "Cys", "Gln", "Glu", "Gly", "His", "Ile", "Leu", "Lys"]
+BASES = "ACGT"
+
+DNA_SCHEMA_PATH = Path(__file__).resolve().parents[1] / "schemas" / "dna_aspc.json"
+
+
+# -------------------------------------------------------------------------
+# Class Definition
+# -------------------------------------------------------------------------
+class SyntheticDataset:
+    """
+    A reproducible synthetic DNA dataset for one assay.
+
+    Documents are generated lazily per collection; `load` writes all of them to the
+    collections of a `MongoAdapter`.
+    """
+
+    def __init__(self, scale: str = "panel", assay_group: str = "myeloid", seed: int = 1):
+        """
+        Args:
+            scale (str): One of `SCALES`.
+            assay_group (str): Assay group of the synthetic assay; decides the variant query.
+            seed (int): Random seed; equal seeds give equal datasets.
+
+        Raises:
+            ValueError: If `scale` is not a known preset.
+        """
+        if scale not in SCALES:
+            raise ValueError(f"Unknown benchmark scale: {scale}")
+        self.scale = scale
+        self.params = SCALES[scale]
+        self.assay_group = assay_group
+        self.assay = f"bench_{assay_group}_{scale}"
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.now = datetime(2025, 1, 1)
+
+        self.genes = self._gene_layout()
+        self.schema = self._load_schema()
+        self.aspc = self._aspc()
+        self.samples = self._samples()
+        self.target = self.samples[0]
+        self.variants_by_sample = {
+            str(sample["_id"]): self._variants(sample)
+            for sample in self.samples[: self.params["variant_samples"]]
+        }
+
+    # ---------------------------------------------------------------------
+    # Layout and configuration
+    # ---------------------------------------------------------------------
+    def _gene_layout(self) -> list[dict]:
+        """
+        Place every gene on a chromosome with a transcript and exon coordinates.
+        """
+        count = self.params["genes"]
+        names = KNOWN_GENES[:count] + [f"BG{i:05d}" for i in range(count - len(KNOWN_GENES))]
+        genes = []
+        for index, name in enumerate(names):
+            chrom = CHROMOSOMES[index % len(CHROMOSOMES)]
+            start = 1_000_000 + index * 250_000
+            exons = []
+            pos = start
+            for nbr in range(1, self.params["exons_per_gene"] + 1):
+                length = self.rng.randint(80, 300)
+                exons.append({"nbr": nbr, "start": pos, "end": pos + length})
+                pos += length + self.rng.randint(500, 5000)
+            genes.append(
+                {
+                    "name": name,
+                    "chrom": chrom,
+                    "transcript": f"ENST{index + 1:011d}",
+                    "refseq": f"NM_{index + 1:06d}",
+                    "exons": exons,
+                }
+            )
+        return genes
+
+    def _oid(self) -> ObjectId:
+        """
+        Return an ObjectId drawn from the dataset random generator.
+        """
+        return ObjectId(self.rng.getrandbits(96).to_bytes(12, "big"))
+
+    @staticmethod
+    def _load_schema() -> dict:
+        """
+        Return the DNA assay configuration schema shipped with the repository.
+        """
+        with open(DNA_SCHEMA_PATH) as handle:
+            return json.load(handle)
+
+    def _aspc(self) -> dict:
+        """
+        Return the assay configuration, built from the schema defaults.
+        """
+        fields = self.schema["fields"]
+        sections = self.schema["sections"]
+        aspc = {
+            key: fields.get(key, {}).get("default")
+            for key in sections["filters"] + sections["reporting"]
+        }
+        aspc.update(
+            {
+                "_id": f"{self.assay}:production",
+                "assay_name": self.assay,
+                "display_name": f"Benchmark {self.scale}",
+                "asp_group": self.assay_group,
+                "asp_category": "DNA",
+                "platform": "illumina",
+                "environment": "production",
+                "profile": "production",
+                "schema_name": self.schema["schema_name"],
+                "is_active": True,
+                "version": 1,
+                "use_diagnosis_genelist": False,
+                "analysis_types": ["SNV", "CNV"],
+                "verification_samples": {},
+                "max_freq": 1.0,
+                "report_header": f"Benchmark {self.scale} report",
+                "report_sections": ["SNV", "CNV"],
+                "plots_path": "/tmp",
+                "report_folder": "benchmark",
+            }
+        )
+        return aspc
+
+    def config_documents(self) -> dict[str, list[dict]]:
+        """
+        Return the configuration documents keyed by adapter collection attribute.
+        """
+        gene_names = [gene["name"] for gene in self.genes]
+        asp = {
+            "_id": self.assay,
+            "assay_name": self.assay,
+            "display_name": f"Benchmark {self.scale}",
+            "asp_group": self.assay_group,
+            "asp_family": ASP_FAMILIES[self.scale],
+            "asp_category": "DNA",
+            "covered_genes": gene_names,
+            "covered_genes_count": len(gene_names),
+            "germline_genes": [],
+            "is_active": True,
+            "version": 1,
+        }
+        genelist = {
+            "_id": f"{self.assay}_genelist",
+            "name": f"{self.assay}_genelist",
+            "displayname": "Benchmark gene list",
+            "list_type": ["genelist"],
+            "assays": [self.assay],
+            "assay_groups": [self.assay_group],
+            "diagnosis": [],
+            "genes": gene_names[: max(10, len(gene_names) // 4)],
+            "is_active": True,
+            "adhoc": False,
+            "version": 1,
+        }
+        vep_metadata = {
+            "_id": VEP_VERSION,
+            "variant_class_translations": {
+                "SNV": "SNV",
+                "insertion": "Insertion",
+                "deletion": "Deletion",
+            },
+            "conseq_translations": {
+                term: term.replace("_variant", "").replace("_", " ") for term, _ in CONSEQUENCES
+            },
+            "db_info": {"GRCh38": {"vep": VEP_VERSION}},
+        }
+        return {
+            "schemas_collection": [self.schema],
+            "asp_collection": [asp],
+            "aspc_collection": [self.aspc],
+            "insilico_genelist_collection": [genelist],
+            "vep_metadata_collection": [vep_metadata],
+        }
+
+    # ---------------------------------------------------------------------
+    # Samples
+    # ---------------------------------------------------------------------
+    def _samples(self) -> list[dict]:
+        """
+        Return the sample documents, newest first; about a third have a report.
+        """
+        filters = {
+            key: self.aspc[key] for key in self.schema["sections"]["filters"] if key in self.aspc
+        }
+        samples = []
+        for index in range(self.params["samples"]):
+            added = self.now - timedelta(hours=index * 7)
+            reported = index > 0 and self.rng.random() < 0.35
+            paired = self.rng.random() < 0.5
+            name = f"BENCH{self.scale.upper()}{index:06d}"
+            sample = {
+                "_id": ObjectId.from_datetime(added),
+                "name": name,
+                "assay": self.assay,
+                "profile": "production",
+                "subpanel": None,
+                "omics_layer": "dna",
+                "sequencing_scope": self.scale,
+                "paired": paired,
+                "sample_no": 2 if paired else 1,
+                "case_id": name,
+                "case": {"clarity_id": f"CL{index:08d}"},
+                "control_id": f"{name}N" if paired else None,
+                "vep": VEP_VERSION,
+                "time_added": added,
+                "report_num": 1 if reported else 0,
+                "reports": [],
+                "comments": [],
+                "filters": dict(filters),
+                "QC": [],
+            }
+            if reported:
+                sample["reports"] = [
+                    {
+                        "_id": self._oid(),
+                        "report_num": 1,
+                        "report_id": f"{name}.1",
+                        "time_created": added + timedelta(days=3),
+                    }
+                ]
+            samples.append(sample)
+        return samples
+
+    # ---------------------------------------------------------------------
+    # Variants
+    # ---------------------------------------------------------------------
+    def _consequence(self) -> str:
+        """
+        Draw a consequence term by its relative frequency.
+        """
+        terms, weights = zip(*CONSEQUENCES)
+        return self.rng.choices(terms, weights)[0]
+
+    def _csq(self, gene: dict, transcript: str, consequence: str, exon: dict) -> dict:
+        """
+        Return one VEP `CSQ` entry of a variant.
+        """
+        protein_pos = self.rng.randint(1, 900)
+        coding = consequence not in (
+            "intron_variant",
+            "3_prime_UTR_variant",
+            "regulatory_region_variant",
+        )
+        ref_aa, alt_aa = self.rng.sample(AMINO_ACIDS, 2)
+        hgvsp = f"p.{ref_aa}{protein_pos}{alt_aa}" if coding else ""
+        if consequence == "synonymous_variant":
+            hgvsp = f"p.{ref_aa}{protein_pos}="
+        return {
+            "SYMBOL": gene["name"],
+            "Feature": transcript,
+            "BIOTYPE": "protein_coding",
+            "Consequence": [consequence],
+            "IMPACT": "MODERATE" if coding else "MODIFIER",
+            "HGVSc": f"c.{protein_pos * 3}{self.rng.choice(BASES)}>A",
+            "HGVSp": hgvsp,
+            "EXON": f"{exon['nbr']}/{len(gene['exons'])}" if coding else "",
+            "INTRON": "" if coding else f"{exon['nbr']}/{len(gene['exons']) - 1}",
+            "CANONICAL": "YES" if transcript == gene["transcript"] else "",
+            "Existing_variation": "",
+            "PolyPhen": "",
+            "SIFT": "",
+        }
+
+    def _variant(self, sample: dict, index: int) -> dict:
+        """
+        Return one variant of a sample.
+        """
+        gene = self.genes[self.rng.randrange(len(self.genes))]
+        exon = self.rng.choice(gene["exons"])
+        pos = self.rng.randint(exon["start"], exon["end"])
+        ref = self.rng.choice(BASES)
+        kind = self.rng.random()
+        if kind < 0.85:
+            alt, variant_class = self.rng.choice([b for b in BASES if b != ref]), "SNV"
+        elif kind < 0.93:
+            alt, variant_class = ref + "".join(self.rng.choices(BASES, k=3)), "insertion"
+        else:
+            ref, alt, variant_class = ref + "".join(self.rng.choices(BASES, k=4)), ref, "deletion"
+        consequence = self._consequence()
+
+        transcripts = [gene["transcript"]] + [
+            f"{gene['transcript']}{suffix}" for suffix in ("A", "B")[: self.rng.randint(0, 2)]
+        ]
+        csq = [self._csq(gene, tx, consequence, exon) for tx in transcripts]
+        selected = csq[0]
+
+        depth = self.rng.randint(80, 3000)
+        af = round(min(1.0, self.rng.betavariate(0.6, 2.5) + 0.005), 4)
+        gt = [
+            {
+                "sample": sample["name"],
+                "type": "case",
+                "GT": "0/1" if af < 0.9 else "1/1",
+                "AF": af,
+                "DP": depth,
+                "VD": int(af * depth),
+            }
+        ]
+        if sample["paired"]:
+            control_depth = self.rng.randint(50, 1500)
+            control_af = round(self.rng.random() * 0.02, 4)
+            gt.append(
+                {
+                    "sample": sample["control_id"],
+                    "type": "control",
+                    "GT": "0/0",
+                    "AF": control_af,
+                    "DP": control_depth,
+                    "VD": int(control_af * control_depth),
+                }
+            )
+
+        simple_id = f"{gene['chrom']}_{pos}_{ref}_{alt}"
+        variant = {
+            "_id": self._oid(),
+            "SAMPLE_ID": str(sample["_id"]),
+            "CHROM": gene["chrom"],
+            "POS": pos,
+            "REF": ref,
+            "ALT": alt,
+            "QUAL": round(self.rng.uniform(20, 5000), 1),
+            "FILTER": ["GERMLINE"] if self.rng.random() < 0.03 else ["PASS"],
+            "simple_id": simple_id,
+            "simple_id_hash": md5(simple_id.encode()).hexdigest(),
+            "variant_class": variant_class,
+            "genes": [gene["name"]],
+            "transcripts": transcripts,
+            "HGVSc": [entry["HGVSc"] for entry in csq],
+            "HGVSp": [entry["HGVSp"] for entry in csq if entry["HGVSp"]],
+            "gnomad_frequency": (
+                round(self.rng.random() ** 4 * 0.05, 6) if self.rng.random() < 0.6 else None
+            ),
+            "GT": gt,
+            "INFO": {
+                "CSQ": csq,
+                "selected_CSQ": selected,
+                "selected_CSQ_criteria": "canonical",
+                "variant_callers": ["vardict", "tnscope"][: self.rng.randint(1, 2)],
+            },
+        }
+        if self.rng.random() < 0.03:
+            variant["hotspots"] = [{"mm_hotspot": [f"COSV{index:08d}"]}]
+        return variant
+
+    def _variants(self, sample: dict) -> list[dict]:
+        """
+        Return the variants of a sample.
+        """
+        return [self._variant(sample, index) for index in range(self.params["variants_per_sample"])]
+
+    def variants(self) -> Iterator[dict]:
+        """
+        Yield the variants of all samples with variants.
+        """
+        for variants in self.variants_by_sample.values():
+            yield from variants
+
+    # ---------------------------------------------------------------------
+    # Annotation, blacklist, coverage and CNVs
+    # ---------------------------------------------------------------------
+    def annotations(self) -> list[dict]:
+        """
+        Return classifications and texts; about half refer to variants of the samples.
+        """
+        pool = list(self.variants())
+        annotations = []
+        for index in range(self.params["annotations"]):
+            if pool and index % 2 == 0:
+                variant = self.rng.choice(pool)
+                selected = variant["INFO"]["selected_CSQ"]
+                nomenclature, value = (
+                    ("p", selected["HGVSp"]) if selected["HGVSp"] else ("c", selected["HGVSc"])
+                )
+                if self.rng.random() < 0.2:
+                    nomenclature = "g"
+                    value = f"{variant['CHROM']}:{variant['POS']}:{variant['REF']}/{variant['ALT']}"
+                gene, transcript = selected["SYMBOL"], selected["Feature"]
+            else:
+                gene_doc = self.rng.choice(self.genes)
+                gene, transcript = gene_doc["name"], gene_doc["transcript"]
+                nomenclature, value = "p", f"p.Gly{index}Asp"
+            annotation = {
+                "gene": gene,
+                "transcript": transcript,
+                "nomenclature": nomenclature,
+                "variant": value,
+                "assay": self.assay_group if self.rng.random() < 0.8 else "solid",
+                "subpanel": None,
+                "author": "benchmark",
+                "time_created": self.now - timedelta(minutes=index),
+            }
+            if self.rng.random() < 0.7:
+                annotation["class"] = self.rng.choice([1, 2, 3, 4])
+            else:
+                annotation["text"] = f"Synthetic interpretation {index}"
+            annotations.append(annotation)
+        return annotations
+
+    def blacklist(self) -> list[dict]:
+        """
+        Return blacklisted positions; about a tenth are variants of the target sample.
+        """
+        target_variants = self.variants_by_sample.get(str(self.target["_id"]), [])
+        positions = {}
+        for variant in target_variants[:: max(1, min(10, len(target_variants)))]:
+            positions[variant["simple_id"]] = round(self.rng.random(), 3)
+        while len(positions) < self.params["blacklist"]:
+            gene = self.rng.choice(self.genes)
+            pos = self.rng.randint(gene["exons"][0]["start"], gene["exons"][-1]["end"])
+            ref, alt = self.rng.sample(BASES, 2)
+            positions[f"{gene['chrom']}_{pos}_{ref}_{alt}"] = round(self.rng.random(), 3)
+        return [
+            {"assay": self.assay_group, "pos": pos, "in_normal_perc": perc}
+            for pos, perc in positions.items()
+        ]
+
+    def coverage(self, sample: dict) -> dict:
+        """
+        Return the `panel_cov` document of a sample: CDS, probe and exon coverage per gene.
+        """
+        genes = {}
+        for gene in self.genes:
+            cds = {}
+            for exon in gene["exons"]:
+                key = f"{gene['chrom']}_{exon['start']}_{exon['end']}"
+                cds[key] = {
+                    "chr": gene["chrom"],
+                    "start": exon["start"],
+                    "end": exon["end"],
+                    "nbr": exon["nbr"],
+                    "cov": round(self.rng.lognormvariate(6.5, 0.6), 1),
+                }
+            entry = {"transcript": gene["transcript"], "CDS": cds, "exons": dict(cds)}
+            if self.params["probes_per_gene"]:
+                probes = {}
+                for _ in range(self.params["probes_per_gene"]):
+                    exon = self.rng.choice(gene["exons"])
+                    start = exon["start"] - self.rng.randint(0, 60)
+                    key = f"{gene['chrom']}_{start}_{start + 120}"
+                    probes[key] = {
+                        "chr": gene["chrom"],
+                        "start": start,
+                        "end": start + 120,
+                        "cov": round(self.rng.lognormvariate(6.5, 0.7), 1),
+                    }
+                entry["probes"] = probes
+            genes[gene["name"]] = entry
+        return {"SAMPLE_ID": str(sample["_id"]), "sample": sample["name"], "genes": genes}
+
+    def coverage_blacklist(self) -> list[dict]:
+        """
+        Return `group_coverage` entries: a few whole genes and CDS regions of the assay group.
+        """
+        entries = []
+        for gene in self.genes[:: max(1, len(self.genes) // 10)]:
+            entries.append({"gene": gene["name"], "group": self.assay_group, "region": "gene"})
+            exon = gene["exons"][0]
+            entries.append(
+                {
+                    "gene": gene["name"],
+                    "group": self.assay_group,
+                    "region": "CDS",
+                    "coord": f"{gene['chrom']}_{exon['start']}_{exon['end']}",
+                }
+            )
+        return entries
+
+    def cnvs(self, sample: dict) -> list[dict]:
+        """
+        Return the CNVs of a sample; a few are marked interesting for the report.
+        """
+        cnvs = []
+        for _ in range(self.params["cnvs_per_sample"]):
+            index = self.rng.randrange(len(self.genes))
+            span = self.genes[index : index + self.rng.randint(1, 6)]
+            start = span[0]["exons"][0]["start"]
+            end = span[-1]["exons"][-1]["end"]
+            ratio = round(self.rng.choice([-1, 1]) * self.rng.uniform(0.1, 1.5), 3)
+            cnvs.append(
+                {
+                    "SAMPLE_ID": str(sample["_id"]),
+                    "chr": span[0]["chrom"],
+                    "start": start,
+                    "end": end,
+                    "size": end - start,
+                    "ratio": ratio,
+                    "nprobes": self.rng.randint(3, 400),
+                    "callers": ["gatk", "cnvkit"][: self.rng.randint(1, 2)],
+                    "genes": [
+                        {"gene": gene["name"], "class": 1} if i == 0 else {"gene": gene["name"]}
+                        for i, gene in enumerate(span)
+                    ],
+                    "interesting": self.rng.random() < 0.05,
+                }
+            )
+        return cnvs
+
+    # ---------------------------------------------------------------------
+    # Loading
+    # ---------------------------------------------------------------------
+    def documents(self) -> Iterator[tuple[str, list[dict]]]:
+        """
+        Yield `(adapter collection attribute, documents)` for the whole dataset.
+        """
+        yield from self.config_documents().items()
+        yield "samples_collection", self.samples
+        for variants in self.variants_by_sample.values():
+            yield "variants_collection", variants
+        yield "annotations_collection", self.annotations()
+        yield "blacklist_collection", self.blacklist()
+        yield "groupcov_collection", self.coverage_blacklist()
+        for sample in self.samples[: self.params["variant_samples"]]:
+            yield "coverage2_collection", [self.coverage(sample)]
+            yield "cnvs_collection", self.cnvs(sample)
+
+    def load(self, store, batch_size: int = 5000) -> dict[str, int]:
+        """
+        Replace the benchmark collections of an adapter with this dataset.
+
+        Every collection written to is emptied first, so only run this against the
+        benchmark database.
+
+        Args:
+            store (MongoAdapter): The initialized adapter.
+            batch_size (int): Documents per `insert_many`.
+
+        Returns:
+            dict[str, int]: Number of documents written per collection.
+        """
+        counts: dict[str, int] = {}
+        for attribute, docs in self.documents():
+            collection = getattr(store, attribute)
+            if attribute not in counts:
+                collection.delete_many({})
+                counts[attribute] = 0
+            for start in range(0, len(docs), batch_size):
+                collection.insert_many(docs[start : start + batch_size], ordered=False)
+            counts[attribute] += len(docs)
+
+        store.blacklist_handler.bump_stamp(self.assay_group)
+        return {getattr(store, attribute).name: count for attribute, count in counts.items()}
@@ -90,10 +90,35 @@ class DefaultConfig:
     # REDIS CACHE TIMEOUTS
     CACHE_DEFAULT_TIMEOUT = 300  # 300 secs, 5 minutes
     CACHE_KEY_PREFIX = "coyote3_cache"
-    CACHE_TYPE = "RedisCache"
+    CACHE_TYPE = os.getenv("CACHE_TYPE", "RedisCache")
     CACHE_REDIS_HOST = os.getenv("CACHE_REDIS_HOST", "localhost")
     CACHE_REDIS_URL = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379/0")
 
+    # Create handler indexes at startup (see MongoAdapter.ensure_indexes)
+    MONGO_ENSURE_INDEXES = os.getenv("MONGO_ENSURE_INDEXES", "true").lower() == "true"
+
+    # IN-PROCESS REFERENCE DATA CACHE (VEP metadata, CIViC, HGNC, OncoKB)
+    REFERENCE_CACHE_ENABLED = True
+    REFERENCE_CACHE_MAX_ENTRIES = 20000  # per namespace
+    REFERENCE_CACHE_VERSION_CHECK_INTERVAL = 30  # secs between shared version checks
+
+    # IN-PROCESS BLACKLIST SNAPSHOT (per assay, guarded by a change stamp in Redis)
+    BLACKLIST_SNAPSHOT_ENABLED = True
+    BLACKLIST_IMPORT_BATCH_SIZE = 1000
+
+    # VARIANT KNOWLEDGE BUNDLE CACHE (Redis, per simple_id / VEP version / KB tag versions)
+    KNOWLEDGE_BUNDLE_CACHE_TIMEOUT = 86400  # secs, 0 disables
+
+    # IN-PROCESS USER MODEL CACHE (guarded by the identity change stamp in Redis)
+    IDENTITY_CACHE_ENABLED = True
+    IDENTITY_CACHE_MAX_AGE = 300  # secs, upper bound even without a stamp change
+
+    # REQUEST-SCOPED IDENTITY MAP (sample / config / schema / ASP / ISGL lookups on flask.g)
+    REQUEST_CACHE_ENABLED = True
+
+    # IN-PROCESS BAM PATH CACHE (BAM_Service lookups, paths do not change once loaded)
+    BAM_PATH_CACHE_TTL = 3600  # secs, 0 disables
+
     # Fernet key for encrypting sensitive data in the report
     FERNET = Fernet(os.getenv("COYOTE3_FERNET_KEY"))
 
@@ -251,6 +276,54 @@ class DefaultConfig:
     SAMPLE_SEARCH_LIMIT = 1000
     REPORTED_SAMPLES_SEARCH_LIMIT = 50
 
+    # DNA VARIANT LIST PAGING (rows rendered with the page / max rows per JSON page)
+    DNA_VARIANT_PAGE_SIZE = 200
+    DNA_VARIANT_PAGE_MAX = 1000
+
+    # FLAG UPDATES (max ids per UpdateMany when marking fp / irrelevant / interesting)
+    FLAG_UPDATE_CHUNK_SIZE = 5000
+
+    # VARIANT OCCURRENCE INDEX (recent samples kept per simple_id / samples per page)
+    VARIANT_OCCURRENCE_RECENT_SAMPLES = 200
+    VARIANT_OCCURRENCE_PAGE_SIZE = 20
+    VARIANT_OCCURRENCE_BATCH_SIZE = 1000
+
+    # SECTION LOADER (concurrent section fetches in list views / shared pool size)
+    SECTION_LOADER_ENABLED = True
+    SECTION_LOADER_MAX_WORKERS = 8
+
+    # REPORT JOB QUEUE (background report rendering per web worker process)
+    REPORT_JOBS_ENABLED = True
+    REPORT_JOB_MAX_WORKERS = 2
+    REPORT_JOB_STALE_SECONDS = 600  # running jobs without a heartbeat this long are claimed again
+    REPORT_JOB_MAX_ATTEMPTS = 3
+
+    # DNA REPORT PREVIEW CACHE (Redis, per sample / annotation / config change stamps)
+    REPORT_PREVIEW_CACHE_TIMEOUT = 3600  # secs, 0 disables
+
+    # PLOT ASSETS (browser cache lifetime / rotated renditions on disk)
+    PLOT_CACHE_MAX_AGE = 3600  # secs, plots are revalidated with their ETag afterwards
+    PLOT_CACHE_DIR = os.getenv("PLOT_CACHE_DIR", os.path.join(REPORTS_BASE_PATH, "plot_cache"))
+
+    # PDF RENDERING (WeasyPrint process pool / rendered PDFs keyed by report HTML hash)
+    PDF_RENDER_MAX_WORKERS = 2
+    PDF_RENDER_TIMEOUT = 120  # secs
+    PDF_CACHE_DIR = os.getenv("PDF_CACHE_DIR", os.path.join(REPORTS_BASE_PATH, "pdf_cache"))
+    PDF_CACHE_MAX_FILES = 1000  # least recently used PDFs above this are removed, 0 = no limit
+    PDF_CACHE_MAX_AGE = 30 * 86400  # secs, PDFs unused this long are removed, 0 = no limit
+
+    # SAMPLES HOME (keyset pages of the live / reported sample lists)
+    SAMPLES_HOME_PAGE_SIZE = 500
+
+    # DASHBOARD STATS (materialized counters, full recount when older than this)
+    DASHBOARD_STATS_RECONCILE_SECONDS = 86400  # secs, 1 day
+
+    # QUERY STATS (MongoDB commands per endpoint: Server-Timing header, log, admin page)
+    QUERY_STATS_ENABLED = True
+    QUERY_STATS_WINDOW = 200  # requests kept per endpoint
+    QUERY_STATS_MEASURE_BYTES = False  # BSON-encode every reply to count bytes (costs CPU)
+    QUERY_BUDGET_MAX_QUERIES = int(os.getenv("QUERY_BUDGET_MAX_QUERIES", "0"))  # 0 = no budget
+
     @property
     def MONGO_URI(self) -> str:
         """
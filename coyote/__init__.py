@@ -34,9 +34,7 @@ from flask_cors import CORS
 import config
 from coyote import extensions
 from .errors import register_error_handlers
-from flask_login import current_user, login_user
-from coyote.services.auth.user_session import User
-from coyote.models.user import UserModel
+from flask_login import current_user
 from coyote.extensions import store
 from coyote.util.misc import get_dynamic_assay_nav
 from pymongo.errors import ConnectionFailure
@@ -68,7 +66,7 @@ class PrefixMiddleware:
         return self.app(environ, start_response)
 
 
-def init_app(testing: bool = False, development: bool = False) -> Flask:
+def init_app(testing: bool = False, development: bool = False, mongo_client=None) -> Flask:
     """
     Creates and configures the Flask application instance.
 
@@ -79,6 +77,9 @@ def init_app(testing: bool = False, development: bool = False) -> Flask:
     Args:
         testing (bool): If True, loads testing configuration.
         development (bool): If True, loads development configuration and enables debug mode.
+        mongo_client (pymongo.MongoClient, optional): Use this client instead of connecting to
+            `MONGO_URI`, e.g. a `mongomock.MongoClient` for the benchmarks. The connection
+            check of `init_db` is skipped.
 
     Returns:
         Flask: The configured Flask application instance.
@@ -121,8 +122,9 @@ def init_app(testing: bool = False, development: bool = False) -> Flask:
     app.logger.info("Initializing app extensions + blueprints:")
     with app.app_context():
         init_login_manager(app)
-        init_db(app)
-        init_store(app)
+        if mongo_client is None:
+            init_db(app)
+        init_store(app, mongo_client)
         register_blueprints(app)
         init_ldap(app)
         init_utility(app)
@@ -170,45 +172,6 @@ def init_app(testing: bool = False, development: bool = False) -> Flask:
                 "ENV_NAME": app.config.get("ENV_NAME"),
             }
 
-    # Refresh user session with latest data from the database before each request.
-    @app.before_request
-    def refresh_user_session() -> None:
-        """
-        Refreshes the current user's session data before each request.
-
-        This `before_request` hook ensures that any updates to the user's profile, role,
-        permissions, or assay access are reflected immediately in the session without requiring logout.
-
-        Behavior:
-            - If the user is authenticated:
-                - Fetches the latest user document from the database.
-                - Rebuilds the `UserModel` with updated role and assay configuration.
-                - Compares the current session user data to the freshly loaded data.
-                - If changes are detected (e.g., permission updates, role changes):
-                    - Re-authenticates the user to update the session state.
-
-        This is useful in environments where user data can change dynamically during a session,
-        such as through an admin panel or external provisioning system.
-
-        Returns:
-            None
-        """
-        if current_user.is_authenticated:
-            fresh_user_data = store.user_handler.user_with_id(current_user.username)
-            if fresh_user_data:
-                role_doc = store.roles_handler.get_role(fresh_user_data.get("role")) or {}
-                asp_docs = store.asp_handler.get_all_asps(is_active=True)
-                user_model = UserModel.from_mongo(fresh_user_data, role_doc, asp_docs)
-                updated_user = User(user_model)
-
-                # Re-login only if things have changed
-                current = current_user.to_dict()
-                updated = updated_user.to_dict()
-
-                if current != updated:
-                    login_user(updated_user)
-                    app.logger.debug(f"Session refreshed: {updated_user.username}")
-
     @app.before_request
     def enforce_permissions() -> None:
         """
@@ -475,7 +438,7 @@ def init_db(app) -> None:
         raise RuntimeError("Could not connect to MongoDB. Aborting.") from e
 
 
-def init_store(app) -> None:
+def init_store(app, mongo_client=None) -> None:
     """
     Initializes the data store for the application.
 
@@ -485,9 +448,11 @@ def init_store(app) -> None:
 
     Args:
         app (Flask): The Flask application instance.
+        mongo_client (pymongo.MongoClient, optional): An existing client to use instead of
+            connecting to `MONGO_URI`.
     """
     app.logger.info(f"Initializing MongoAdapter at: {app.config['MONGO_URI']}")
-    extensions.store.init_from_app(app)
+    extensions.store.init_from_app(app, client=mongo_client)
 
 
 def init_utility(app) -> None:
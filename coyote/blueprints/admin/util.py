@@ -496,6 +496,12 @@ class AdminUtility:
             - Displays a flash message for each deletion result.
         """
         sample_name = store.sample_handler.get_sample_by_id(sample_id)
+
+        # The occurrence index and dashboard counters are updated from the sample data,
+        # so they go before it
+        store.variant_occurrences_handler.remove_sample(sample_id)
+        store.dashboard_stats_handler.record_sample(sample_id, sign=-1)
+
         actions = [
             store.variant_handler.delete_sample_variants,
             store.cnv_handler.delete_sample_cnvs,
@@ -507,7 +513,6 @@ class AdminUtility:
             store.sample_handler.delete_sample,
         ]
         for handler in actions:
-            handler(sample_id)
             result = handler(sample_id)
             collection_name = handler.__name__.replace("delete_sample_", "").replace("_handler", "")
             if collection_name == "delete_sample":
@@ -39,6 +39,19 @@ import json
 from pathlib import Path
 
 
+@admin_bp.after_request
+def bump_report_config_stamp(response: Response) -> Response:
+    """
+    Retire the cached DNA report previews after a successful admin change.
+
+    Assay configs, panels and genelists are edited here; any successful admin POST bumps
+    the `config` report stamp (see `DNAUtility.get_dna_report_preview`).
+    """
+    if request.method == "POST" and response.status_code < 400:
+        util.dna.bump_report_stamp("config")
+    return response
+
+
 @admin_bp.route("/")
 @require(min_role="manager", min_level=99)
 def admin_home() -> Any:
@@ -2689,3 +2702,80 @@ def audit():
         "audit/audit.html",
         logs=logs_data,
     )
+
+
+@admin_bp.route("/reference-cache", methods=["GET"])
+@require(min_role="admin", min_level=99999)
+def reference_cache_stats() -> Response:
+    """
+    Returns hit/miss/invalidation counters of the reference data cache for this worker.
+
+    Returns:
+        Response: JSON response with counters keyed by reference data namespace.
+    """
+    return jsonify(store.reference_cache.stats())
+
+
+@admin_bp.route("/reference-cache/invalidate", methods=["POST"])
+@require(min_role="admin", min_level=99999)
+@log_action(action_name="invalidate_reference_cache", call_type="admin_call")
+def invalidate_reference_cache() -> Response:
+    """
+    Invalidates the reference data cache after a reference collection has been reloaded.
+
+    An optional `namespace` (form field or JSON key) limits the invalidation to one
+    namespace, e.g. `hgnc` or `oncokb_genes`. Without it, every namespace is invalidated.
+
+    Returns:
+        Response: JSON response listing the invalidated namespaces.
+    """
+    payload = request.get_json(silent=True) or request.form
+    namespace = payload.get("namespace") or None
+    if namespace and namespace not in store.reference_cache.NAMESPACES:
+        return jsonify({"error": f"Unknown reference cache namespace: {namespace}"}), 400
+
+    namespaces = store.reference_cache.invalidate(namespace)
+
+    # Log Action
+    g.audit_metadata = {"namespaces": namespaces}
+
+    return jsonify({"invalidated": namespaces})
+
+
+@admin_bp.route("/query-stats", methods=["GET"])
+@require(min_role="admin", min_level=99999)
+def query_stats() -> str | Response:
+    """
+    Shows the rolling MongoDB command statistics per endpoint for this worker.
+
+    With `?format=json` the statistics are returned as JSON instead.
+
+    Returns:
+        str | Response: Rendered statistics page or JSON response.
+    """
+    stats = store.query_stats.stats()
+    if request.args.get("format") == "json":
+        return jsonify(stats)
+    return render_template(
+        "query_stats/query_stats.html",
+        stats=stats,
+        enabled=store.query_stats.enabled,
+        max_queries=store.query_stats.max_queries,
+        window=store.query_stats.window,
+        measure_bytes=store.query_stats.measure_bytes,
+    )
+
+
+@admin_bp.route("/query-stats/reset", methods=["POST"])
+@require(min_role="admin", min_level=99999)
+@log_action(action_name="reset_query_stats", call_type="admin_call")
+def reset_query_stats() -> Response:
+    """
+    Clears the MongoDB command statistics of this worker.
+
+    Returns:
+        Response: Redirect to the statistics page.
+    """
+    store.query_stats.reset()
+    flash("Query statistics reset for this worker.", "green")
+    return redirect(url_for("admin_bp.query_stats"))
@@ -26,6 +26,7 @@ from datetime import datetime
 from flask_login import current_user
 from bson.objectid import ObjectId
 from flask import current_app as app
+from flask import flash, g
 from coyote.extensions import store
 
 
@@ -36,6 +37,32 @@ class BPCommonUtility:
     summarizing SNVs, CNVs, translocations, biomarkers, and introductory report sections.
     """
 
+    @staticmethod
+    def get_sample_bams(sample: dict) -> tuple[dict, dict]:
+        """
+        Resolve the case/control sample IDs of a sample and their BAM paths.
+
+        Shared by every view that renders BAM/IGV links. The result is kept on `flask.g` for
+        the rest of the request, so the `BAM_Service` database is queried at most once per
+        sample and request (and `BamServiceHandler.get_bams` caches across requests).
+
+        Args:
+            sample (dict): The sample document.
+
+        Returns:
+            tuple[dict, dict]: `(sample_ids, bam_id)` where `sample_ids` maps case/control to
+            sample IDs and `bam_id` maps sample IDs to lists of BAM paths.
+        """
+        request_cache = g.setdefault("sample_bams", {})
+        key = str(sample.get("_id"))
+        if key not in request_cache:
+            sample_ids = CommonUtility.get_case_and_control_sample_ids(sample)
+            if not sample_ids:
+                # Fallback for older samples that do not have case/control samples set
+                sample_ids = store.variant_handler.get_sample_ids(str(sample["_id"]))
+            request_cache[key] = (sample_ids, store.bam_service_handler.get_bams(sample_ids))
+        return request_cache[key]
+
     @staticmethod
     def process_gene_annotations(annotations: dict) -> dict:
         """
@@ -160,6 +187,136 @@ class BPCommonUtility:
 
         return doc
 
+    @staticmethod
+    def classify_variants_bulk(
+        variant_ids: list[str],
+        class_num: int,
+        assay_group: str | None,
+        subpanel: str | None,
+        flags: dict | None = None,
+    ) -> list[dict]:
+        """
+        Classify several variants at once and add the automatic annotation text.
+
+        The variants and their OncoKB genes are fetched with one query each, the class and
+        text documents of all variants are written with one `insert_many`, and `flags` (e.g.
+        `{"irrelevant": True}`) are set on the classified variants with one bulk write.
+
+        Args:
+            variant_ids (list[str]): The selected variant IDs.
+            class_num (int): The class (tier) to assign.
+            assay_group (str | None): The assay group the classification applies to.
+            subpanel (str | None): The subpanel the classification applies to.
+            flags (dict | None): Flag fields to set on successfully classified variants.
+
+        Returns:
+            list[dict]: One result per selected ID, in order, with `id`, `variant` (the
+            classified nomenclature, or None) and `status` (`classified`, `not_found` or
+            `failed`).
+        """
+        variants = store.variant_handler.get_variants_by_ids(variant_ids)
+        oncokb_genes = store.oncokb_handler.get_oncokb_genes(
+            [var.get("INFO", {}).get("selected_CSQ", {}).get("SYMBOL") for var in variants.values()]
+        )
+
+        results = []
+        documents = []
+        for variant_id in dict.fromkeys(str(vid) for vid in variant_ids):
+            var = variants.get(variant_id)
+            if not var:
+                results.append({"id": variant_id, "variant": None, "status": "not_found"})
+                continue
+
+            selected_csq = var.get("INFO", {}).get("selected_CSQ", {})
+            gene = selected_csq.get("SYMBOL")
+            hgvs_p = selected_csq.get("HGVSp")
+            hgvs_c = selected_csq.get("HGVSc")
+
+            nomenclature = "p"
+            if hgvs_p != "" and hgvs_p is not None:
+                variant = hgvs_p
+            elif hgvs_c != "" and hgvs_c is not None:
+                variant = hgvs_c
+                nomenclature = "c"
+            else:
+                variant = f"{var['CHROM']}:{var['POS']}:{var['REF']}/{var['ALT']}"
+                nomenclature = "g"
+
+            variant_data = {
+                "gene": gene,
+                "assay_group": assay_group,
+                "subpanel": subpanel,
+                "transcript": selected_csq.get("Feature"),
+            }
+            text = BPCommonUtility.create_annotation_text_from_gene(
+                gene,
+                selected_csq.get("Consequence"),
+                assay_group,
+                gene_oncokb=oncokb_genes.get(gene),
+            )
+
+            # Class document and annotation text document for the variant
+            documents.append(
+                CommonUtility.create_classified_variant_doc(
+                    variant=variant,
+                    nomenclature=nomenclature,
+                    class_num=class_num,
+                    variant_data=variant_data,
+                )
+            )
+            documents.append(
+                CommonUtility.create_classified_variant_doc(
+                    variant=variant,
+                    nomenclature=nomenclature,
+                    class_num=class_num,
+                    variant_data=variant_data,
+                    text=text,
+                )
+            )
+            results.append(
+                {
+                    "id": variant_id,
+                    "variant": variant,
+                    "status": "classified",
+                    "_doc": len(documents),
+                }
+            )
+
+        inserted = store.annotation_handler.insert_classifications_bulk(documents)
+        for result in results:
+            doc_end = result.pop("_doc", None)
+            if doc_end is not None and not all(inserted[doc_end - 2 : doc_end]):
+                result["status"] = "failed"
+
+        if flags:
+            store.variant_handler.set_variant_flags_bulk(
+                [result["id"] for result in results if result["status"] == "classified"], flags
+            )
+
+        return results
+
+    @staticmethod
+    def flash_classification_results(results: list[dict]) -> None:
+        """
+        Flash a summary of `classify_variants_bulk` results and log the failed items.
+
+        Args:
+            results (list[dict]): The per-variant results.
+        """
+        classified = [res for res in results if res["status"] == "classified"]
+        not_classified = [res for res in results if res["status"] != "classified"]
+        if classified:
+            flash(f"{len(classified)} variant(s) classified", "green")
+        if not_classified:
+            flash(
+                f"{len(not_classified)} variant(s) not classified: "
+                + ", ".join(
+                    f"{res['variant'] or res['id']} ({res['status']})" for res in not_classified
+                ),
+                "red",
+            )
+            app.logger.warning(f"[CLASSIFY] Variants not classified: {not_classified}")
+
     @staticmethod
     def generate_summary_text(
         sample_ids: list,
@@ -227,7 +227,7 @@ def list_samples_with_tiered_variant(variant_id: str, tier: int):
     docs = store.reported_variants_handler.list_reported_variants(query)
 
     # Enrich docs with sample details, variant details, report details
-    docs = util.bpcommon.enrich_reported_variant_docs(deepcopy(docs))
+    docs = util.bpcommon.enrich_reported_variant_docs(docs)
 
     return render_template(
         "tiered_variant_info.html",
@@ -33,7 +33,30 @@ class CoverageUtility:
     """
 
     @staticmethod
-    def find_low_covered_genes(cov: dict, cutoff: float, smp_grp: str) -> dict:
+    def load_blacklist(smp_grp: str) -> tuple[set, set]:
+        """
+        Loads the coverage blacklist of a sample group with a single query.
+
+        Args:
+            smp_grp (str): Sample group identifier.
+
+        Returns:
+            tuple[set, set]: Blacklisted gene names, and blacklisted regions as
+            `(gene, region type, coord)` tuples.
+        """
+        genes = set()
+        regions = set()
+        for entry in store.groupcov_handler.get_regions_per_group(smp_grp):
+            if entry.get("region") == "gene":
+                genes.add(entry.get("gene"))
+            else:
+                regions.add((entry.get("gene"), entry.get("region"), entry.get("coord")))
+        return genes, regions
+
+    @staticmethod
+    def find_low_covered_genes(
+        cov: dict, cutoff: float, smp_grp: str, blacklist: tuple[set, set] | None = None
+    ) -> dict:
         """
         Identifies low-covered regions within specified genes of interest.
 
@@ -41,27 +64,26 @@ class CoverageUtility:
             cov (dict): Coverage data structured by gene, containing subregions such as 'CDS' and 'probes'.
             cutoff (float): Coverage threshold below which a region is considered low-covered.
             smp_grp (str): Sample group identifier for blacklist checks.
+            blacklist (tuple[set, set] | None): The result of `load_blacklist`, loaded if not given.
 
         Returns:
             dict: Dictionary of genes with at least one region below the coverage cutoff and not blacklisted.
         """
+        _, blacklisted_regions = blacklist or CoverageUtility.load_blacklist(smp_grp)
         keep = defaultdict(dict)
-        for gene in cov["genes"]:
+        for gene, gene_cov in cov["genes"].items():
             has_low = False
-            if "CDS" in cov["genes"][gene]:
+            if "CDS" in gene_cov:
                 has_low = CoverageUtility.reg_low(
-                    cov["genes"][gene]["CDS"], "CDS", cutoff, gene, smp_grp
+                    gene_cov["CDS"], "CDS", cutoff, gene, smp_grp, blacklisted_regions
                 )
-            if "probes" in cov["genes"][gene]:
+            # Probes decide for genes that have both
+            if "probes" in gene_cov:
                 has_low = CoverageUtility.reg_low(
-                    cov["genes"][gene]["probes"],
-                    "probe",
-                    cutoff,
-                    gene,
-                    smp_grp,
+                    gene_cov["probes"], "probe", cutoff, gene, smp_grp, blacklisted_regions
                 )
             if has_low:
-                keep["genes"][gene] = cov["genes"][gene]
+                keep["genes"][gene] = gene_cov
         return keep
 
     @staticmethod
@@ -108,7 +130,7 @@ class CoverageUtility:
 
     @staticmethod
     def filter_genes_from_form(
-        cov_dict: dict, filter_genes: list, smp_grp: str
+        cov_dict: dict, filter_genes: list, smp_grp: str, blacklist: tuple[set, set] | None = None
     ) -> dict:
         """
         Filters the genes in the coverage dictionary, keeping only those present in the provided list and not blacklisted for the given sample group.
@@ -117,22 +139,27 @@ class CoverageUtility:
             cov_dict (dict): Dictionary containing gene coverage data.
             filter_genes (list): List of gene names to retain.
             smp_grp (str): Sample group identifier for blacklist checking.
+            blacklist (tuple[set, set] | None): The result of `load_blacklist`, loaded if not given.
 
         Returns:
             dict: Filtered dictionary containing only allowed genes.
         """
+        blacklisted_genes, _ = blacklist or CoverageUtility.load_blacklist(smp_grp)
+        keep_genes = set(filter_genes) - blacklisted_genes
         filtered_dict = defaultdict(dict)
-        for gene in cov_dict["genes"]:
-            blacklisted = store.groupcov_handler.is_gene_blacklisted(
-                gene, smp_grp
-            )
-            if gene in filter_genes and not blacklisted:
-                filtered_dict["genes"][gene] = cov_dict["genes"][gene]
+        for gene, gene_cov in cov_dict["genes"].items():
+            if gene in keep_genes:
+                filtered_dict["genes"][gene] = gene_cov
         return filtered_dict
 
     @staticmethod
     def reg_low(
-        region_dict: dict, region: str, cutoff: float, gene: str, smp_grp: str
+        region_dict: dict,
+        region: str,
+        cutoff: float,
+        gene: str,
+        smp_grp: str,
+        blacklisted_regions: set | None = None,
     ) -> bool:
         """
         Checks if any region in the given region dictionary has coverage below the specified cutoff,
@@ -144,20 +171,19 @@ class CoverageUtility:
             cutoff (float): Coverage threshold below which a region is considered low-covered.
             gene (str): Gene name.
             smp_grp (str): Sample group identifier for blacklist checks.
+            blacklisted_regions (set | None): Blacklisted `(gene, region type, coord)` tuples from
+                `load_blacklist`, loaded if not given.
 
         Returns:
             bool: True if at least one non-blacklisted region is below the cutoff, False otherwise.
         """
-        has_low = False
-        for reg in region_dict:
-            if "cov" in region_dict[reg]:
-                if float(region_dict[reg]["cov"]) < cutoff:
-                    blacklisted = store.groupcov_handler.is_region_blacklisted(
-                        gene, region, reg, smp_grp
-                    )
-                    if not blacklisted:
-                        has_low = True
-        return has_low
+        if blacklisted_regions is None:
+            _, blacklisted_regions = CoverageUtility.load_blacklist(smp_grp)
+        return any(
+            float(reg_cov["cov"]) < cutoff and (gene, region, reg) not in blacklisted_regions
+            for reg, reg_cov in region_dict.items()
+            if "cov" in reg_cov
+        )
 
     @staticmethod
     def coverage_table(cov_dict: dict, cov_cutoff: float) -> defaultdict:
@@ -74,8 +74,14 @@ def get_cov(sample_id):
     cov_dict = store.coverage2_handler.get_sample_coverage(str(sample["_id"]))
     del cov_dict["_id"]
     del sample["_id"]
-    filtered_dict = util.coverage.filter_genes_from_form(cov_dict, filter_genes, assay_group)
-    filtered_dict = util.coverage.find_low_covered_genes(filtered_dict, cov_cutoff, assay_group)
+    # Group blacklist, loaded once for the gene and the region checks
+    blacklist = util.coverage.load_blacklist(assay_group)
+    filtered_dict = util.coverage.filter_genes_from_form(
+        cov_dict, filter_genes, assay_group, blacklist
+    )
+    filtered_dict = util.coverage.find_low_covered_genes(
+        filtered_dict, cov_cutoff, assay_group, blacklist
+    )
     cov_table = util.coverage.coverage_table(filtered_dict, cov_cutoff)
 
     filtered_dict = util.coverage.organize_data_for_d3(filtered_dict)
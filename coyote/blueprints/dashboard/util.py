@@ -10,14 +10,13 @@
 #  the copyright holders.
 #
 
-from hashlib import md5
 from collections import defaultdict, OrderedDict
 
 
 class DashBoardUtility:
     """
     Utility class providing helper methods for formatting and processing dashboard-related data,
-    such as classified statistics, assay statistics, ASP gene statistics, and cache key generation.
+    such as classified statistics, assay statistics, ASP gene statistics, and user sample statistics.
     """
 
     @staticmethod
@@ -116,15 +115,29 @@ class DashBoardUtility:
         return grouped
 
     @staticmethod
-    def generate_dashboard_chache_key(username: str) -> str:
+    def format_user_sample_stats(
+        assay_stats: dict, assays: list | None, profile: str = "production"
+    ) -> dict:
         """
-        Generates a cache key for dashboard data based on the provided username.
+        Formats the per assay sample counters of the dashboard statistics for a user.
 
         Args:
-            username (str): The username for which to generate the cache key.
+            assay_stats (dict): Counters as `{assay: {profile: {"total": n, "analysed": n}}}`.
+            assays (list | None): The assays of the user; without assays all assays and
+                profiles are counted.
+            profile (str): The profile counted for the user assays.
 
         Returns:
-            str: A unique cache key string for the user's dashboard data.
+            dict: A dictionary mapping each assay to its `total`, `analysed` and `pending` counts.
         """
-        raw_key = f"dashboard_data_{username}"
-        return f"dashboard:{md5(raw_key.encode()).hexdigest()}"
+        result = {}
+        for assay, profiles in assay_stats.items():
+            if assays and assay not in assays:
+                continue
+            counts = [profiles.get(profile, {})] if assays else profiles.values()
+            total = sum(c.get("total", 0) for c in counts)
+            analysed = sum(c.get("analysed", 0) for c in counts)
+            if assays and not total:
+                continue
+            result[assay] = {"total": total, "analysed": analysed, "pending": total - analysed}
+        return result
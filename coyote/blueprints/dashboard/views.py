@@ -33,92 +33,39 @@ def dashboard() -> str:
     - Unique gene counts across all panels
     - Gene counts per assay panel
 
-    Results are cached for performance, and the user must be authenticated.
+    The statistics are read from the materialized `dashboard_stats` document shared by all
+    users (see `DashboardStatsHandler`); the user must be authenticated.
     """
-    cache_timeout = app.config.get("CACHE_DEFAULT_TIMEOUT", 0)
-    cache_key = util.dashboard.generate_dashboard_chache_key(current_user.username)
-
-    if app.cache.get(cache_key):
-        (
-            total_samples_count,
-            analysed_samples_count,
-            pending_samples_count,
-            user_samples_stats,
-            variant_stats,
-            unique_gene_count_all_panels,
-            asp_gene_counts,
-            sample_stats,
-        ) = app.cache.get(cache_key)
-        app.logger.info(f"Dashboard cache hit for {cache_key}")
-
+    handler = store.dashboard_stats_handler
+    stats = handler.get_stats()
+    if stats is None:
+        app.logger.info("Dashboard stats missing, reconciling")
+        stats = handler.reconcile()
     else:
-        app.logger.info(f"Dashboard cache miss for {cache_key}")
-        total_samples_count = store.sample_handler.get_all_sample_counts()
-        analysed_samples_count = store.sample_handler.get_all_sample_counts(report=True)
-        pending_samples_count = total_samples_count - analysed_samples_count
-
-        # User specific samples stats, assay and group wise
-        user_samples_stats = store.sample_handler.get_assay_specific_sample_stats(
-            assays=current_user.assays
-        )
-
-        ##### Generic Variant Stats
-        variant_stats = {}
-        variant_stats["total_variants"] = store.variant_handler.get_total_variant_counts()
-
-        # Get all unique variants
-        # variant_stats["unique_variants"] = store.variant_handler.get_unique_total_variant_counts()
-
-        # get total variants Snps
-        variant_stats["total_snps"] = store.variant_handler.get_total_snp_counts()
-
-        # get total CNVs
-        variant_stats["total_cnvs"]: int = store.cnv_handler.get_total_cnv_count()
+        handler.reconcile_if_stale(app.config.get("DASHBOARD_STATS_RECONCILE_SECONDS", 86400))
 
-        # get total Translocations
-        variant_stats["total_translocs"]: int = store.transloc_handler.get_total_transloc_count()
+    total_samples_count = stats["samples"]["total"]
+    analysed_samples_count = stats["samples"]["analysed"]
+    pending_samples_count = total_samples_count - analysed_samples_count
 
-        # get unitotal RNA fusions
-        variant_stats["total_fusions"]: int = store.fusion_handler.get_total_fusion_count()
-
-        # Get total blacklisted variants
-        variant_stats["blacklisted"]: int = store.blacklist_handler.get_unique_blacklist_count()
-
-        # Get total False positive variants
-        variant_stats["fps"]: int = store.variant_handler.get_fp_counts()  # Change it back
-
-        ### Generic Variant Stats End
-
-        # Get total genes analysed from all the asp
-        unique_gene_count_all_panels = store.asp_handler.get_all_asps_unique_gene_count()
-
-        # Get gene counts in each panel
-        asp_gene_counts = store.asp_handler.get_all_asp_gene_counts()
-        asp_gene_counts = util.dashboard.format_asp_gene_stats(deepcopy(asp_gene_counts))
+    # User specific samples stats, assay wise (production samples of the user assays)
+    user_samples_stats = util.dashboard.format_user_sample_stats(
+        stats.get("assays", {}), current_user.assays
+    )
 
-        # Sample env stats
-        sample_stats = {}
+    variant_stats = stats["variants"]
 
-        sample_stats["profiles"] = store.sample_handler.get_profile_counts()
-        sample_stats["omics_layers"] = store.sample_handler.get_omics_counts()
-        sample_stats["sequencing_scopes"] = store.sample_handler.get_sequencing_scope_counts()
-        sample_stats["pair_count"] = store.sample_handler.get_paired_sample_counts()
+    # Genes analysed across all the asp and gene counts in each panel
+    unique_gene_count_all_panels = stats["genes"]["unique_all_panels"]
+    asp_gene_counts = util.dashboard.format_asp_gene_stats(deepcopy(stats["genes"]["panels"]))
 
-    # Check if the cache exists and is still valid
-    app.cache.set(
-        cache_key,
-        (
-            total_samples_count,
-            analysed_samples_count,
-            pending_samples_count,
-            user_samples_stats,
-            variant_stats,
-            unique_gene_count_all_panels,
-            asp_gene_counts,
-            sample_stats,
-        ),
-        timeout=cache_timeout,
-    )
+    # Sample env stats
+    sample_stats = {
+        "profiles": stats["profiles"],
+        "omics_layers": stats["omics_layers"],
+        "sequencing_scopes": stats["sequencing_scopes"],
+        "pair_count": stats["pair_count"],
+    }
 
     # TODO: Add more stats here
     # Total Assays analysed
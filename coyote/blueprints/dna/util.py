@@ -18,15 +18,21 @@ from __future__ import annotations
 
 from collections import defaultdict
 from datetime import datetime
+from bson import ObjectId
+from bson.errors import InvalidId
 from coyote.util.common_utility import CommonUtility
 from coyote.util.report.report_util import ReportUtility
 from flask import current_app as app
 from coyote.extensions import store
 from typing import Any, Dict, List, Optional, Tuple
 from flask import render_template
-from coyote.blueprints.dna.varqueries import build_query
-from copy import deepcopy
+from flask_login import current_user
+from coyote.blueprints.dna.varqueries import build_query, build_page_pipeline, build_query_pipeline
+import base64
+import hashlib
+import json
 import os
+import uuid
 from pprint import pformat
 
 
@@ -105,6 +111,40 @@ class DNAUtility:
 
         return filter_conseq
 
+    @staticmethod
+    def build_snv_settings(
+        sample: dict, sample_filters: dict, filter_genes: list, disp_pos: list
+    ) -> dict:
+        """
+        Build the SNV filter settings of a sample, as passed to `build_query`.
+
+        Shared by `list_variants` and `list_variants_page`, so every page of the variant
+        list is filtered the same way.
+
+        Args:
+            sample (dict): The sample document.
+            sample_filters (dict): The effective filters of the sample.
+            filter_genes (list): The effective genes to filter on.
+            disp_pos (list): Verification positions to always display.
+
+        Returns:
+            dict: The SNV filter settings.
+        """
+        return {
+            "id": str(sample["_id"]),
+            "max_freq": sample_filters["max_freq"],
+            "min_freq": sample_filters["min_freq"],
+            "max_control_freq": sample_filters["max_control_freq"],
+            "min_depth": sample_filters["min_depth"],
+            "min_alt_reads": sample_filters["min_alt_reads"],
+            "max_popfreq": sample_filters["max_popfreq"],
+            "filter_conseq": DNAUtility.get_filter_conseq_terms(
+                sample_filters.get("vep_consequences", [])
+            ),
+            "filter_genes": filter_genes,
+            "disp_pos": disp_pos,
+        }
+
     @staticmethod
     def create_cnveffectlist(cnvtype: list) -> list:
         """
@@ -147,10 +187,10 @@ class DNAUtility:
         """
         Add global annotations to each variant in the provided list.
 
-        This method iterates over the list of variant dictionaries, retrieves global annotations,
-        classification, other classification, and interesting annotations for each variant using
-        the annotation handler from the store, and updates the variant accordingly. It also adds
-        alternative classifications based on the specified assay and subpanel.
+        This method resolves global annotations, classification, other classification, and
+        interesting annotations for all variants at once using the bulk resolvers of the
+        annotation handler, and updates each variant accordingly. It also adds alternative
+        classifications based on the specified assay and subpanel.
 
         Args:
             variants (list): List of variant dictionaries to annotate.
@@ -161,28 +201,51 @@ class DNAUtility:
             list: The list of variants with updated global annotations and classifications.
         """
         selected_variants = []
+        global_annotations = store.annotation_handler.get_global_annotations_bulk(
+            variants, assay, subpanel
+        )
+        additional_classifications = store.annotation_handler.get_additional_classifications_bulk(
+            variants, assay, subpanel
+        )
         for var_idx, var in enumerate(variants):
             (
                 variants[var_idx]["global_annotations"],
                 variants[var_idx]["classification"],
                 variants[var_idx]["other_classification"],
                 variants[var_idx]["annotations_interesting"],
-            ) = store.annotation_handler.get_global_annotations(var, assay, subpanel)
-            classification = variants[var_idx]["classification"]
-            if classification is not None:
-                class_value = classification.get("class")
-                if (
-                    class_value is not None
-                    and class_value < 999
-                    and not var.get("blacklist")
-                    and not var.get("fp")
-                    and not var.get("irrelevant")
-                ):
-                    selected_variants.append(variants[var_idx])
-
-            variants[var_idx] = DNAUtility.add_alt_class(variants[var_idx], assay, subpanel)
+            ) = global_annotations[var_idx]
+            if DNAUtility.is_tiered(variants[var_idx]):
+                selected_variants.append(variants[var_idx])
+
+            variants[var_idx] = DNAUtility.set_alt_class(
+                variants[var_idx], additional_classifications[var_idx]
+            )
         return variants, selected_variants
 
+    @staticmethod
+    def is_tiered(variant: dict) -> bool:
+        """
+        Return whether a variant with global annotations belongs to the summary tiers.
+
+        Args:
+            variant (dict): A variant with `classification` set by the global annotations.
+
+        Returns:
+            bool: True for classified (class below 999) variants that are not blacklisted,
+            false positive or irrelevant.
+        """
+        classification = variant.get("classification")
+        if classification is None:
+            return False
+        class_value = classification.get("class")
+        return (
+            class_value is not None
+            and class_value < 999
+            and not variant.get("blacklist")
+            and not variant.get("fp")
+            and not variant.get("irrelevant")
+        )
+
     @staticmethod
     def add_alt_class(variant: dict, assay: str, subpanel: str) -> dict:
         """
@@ -199,6 +262,21 @@ class DNAUtility:
         additional_classifications = store.annotation_handler.get_additional_classifications(
             variant, assay, subpanel
         )
+        return DNAUtility.set_alt_class(variant, additional_classifications)
+
+    @staticmethod
+    def set_alt_class(variant: dict, additional_classifications: list) -> dict:
+        """
+        Attach already resolved alternative classifications to a variant.
+
+        Args:
+            variant (dict): A dictionary representing a variant to be annotated.
+            additional_classifications (list): The result of `get_additional_classifications`
+                (or one element of its bulk counterpart) for this variant.
+
+        Returns:
+            dict: The variant dictionary with additional classifications added.
+        """
         if additional_classifications:
             additional_classifications[0].pop("author", None)
             additional_classifications[0].pop("time_created", None)
@@ -261,6 +339,494 @@ class DNAUtility:
         """
         return sorted(data, key=lambda d: (d["class"], -d["af"]))
 
+    @staticmethod
+    def get_filtered_snvs(
+        assay_group: str, subpanel: str | None, settings: dict
+    ) -> tuple[list, list]:
+        """
+        Fetch the filtered SNVs of a sample for the variant list, with list enrichment applied.
+
+        Only the fields of the `list` projection profile are fetched. Blacklist data, global
+        annotations and classifications, and hotspots are added to every variant.
+
+        Args:
+            assay_group (str): The assay group of the sample.
+            subpanel (str | None): The subpanel of the sample.
+            settings (dict): The variant filter settings, as for `build_query`.
+
+        Returns:
+            tuple[list, list]: The variants, and the tiered variants used for the summary text.
+        """
+        variants = store.variant_handler.aggregate_case_variants(
+            build_query_pipeline(
+                assay_group, settings, projection=store.variant_handler.get_projection("list")
+            )
+        )
+        variants = store.blacklist_handler.add_blacklist_data(variants, assay_group)
+        variants, tiered_variants = DNAUtility.add_global_annotations(
+            variants, assay_group, subpanel
+        )
+        variants = DNAUtility.hotspot_variant(variants)
+        return variants, tiered_variants
+
+    @staticmethod
+    def get_tiered_snvs(assay_group: str, subpanel: str | None, settings: dict) -> list:
+        """
+        Return the tiered variants of the whole filtered SNV list, for the summary text.
+
+        Fetches the `tier` projection of the filtered variants (annotation keys, genotypes and
+        flags) and resolves only their latest classifications, from the classification
+        documents. The blacklist is checked for the classified variants only, and nothing
+        else is enriched.
+
+        Args:
+            assay_group (str): The assay group of the sample.
+            subpanel (str | None): The subpanel of the sample.
+            settings (dict): The variant filter settings, as for `build_query`.
+
+        Returns:
+            list: The variants for which `is_tiered` holds, with `classification` set.
+        """
+        variants = [
+            var
+            for var in store.variant_handler.aggregate_case_variants(
+                build_query_pipeline(
+                    assay_group, settings, projection=store.variant_handler.get_projection("tier")
+                )
+            )
+            if not var.get("fp") and not var.get("irrelevant")
+        ]
+        global_annotations = store.annotation_handler.get_global_annotations_bulk(
+            variants, assay_group, subpanel, classified_only=True
+        )
+        classified = []
+        for variant, (_, classification, _, _) in zip(variants, global_annotations):
+            if classification.get("class", 999) < 999:
+                variant["classification"] = classification
+                classified.append(variant)
+        classified = store.blacklist_handler.add_blacklist_data(classified, assay_group)
+        return [var for var in classified if DNAUtility.is_tiered(var)]
+
+    @staticmethod
+    def get_snv_list(
+        assay_group: str, subpanel: str | None, settings: dict, page_size: int
+    ) -> tuple[list, list, int, str | None]:
+        """
+        Fetch the SNV section of the variant list: its first page, the summary tiers and the total.
+
+        Rows are in the default table order, case AF descending, as `list_variants_page`
+        continues it. Lists up to `page_size` variants are fetched and enriched whole
+        (`get_filtered_snvs`). Longer lists fetch and enrich only their first page and build
+        the summary tiers with `get_tiered_snvs`; the page loads further pages on demand.
+
+        Args:
+            assay_group (str): The assay group of the sample.
+            subpanel (str | None): The subpanel of the sample.
+            settings (dict): The variant filter settings, as for `build_query`.
+            page_size (int): The number of variants rendered with the page.
+
+        Returns:
+            tuple[list, list, int, str | None]: The enriched rows to render, the tiered variants,
+            the number of variants passing the filters, and the cursor of the next page (None
+            when every variant is rendered).
+        """
+        total = store.variant_handler.count_case_variants(build_query(assay_group, settings))
+        if total <= page_size:
+            variants, tiered_variants = DNAUtility.get_filtered_snvs(
+                assay_group, subpanel, settings
+            )
+            variants.sort(
+                key=lambda var: (DNAUtility.variant_sort_value(var, "af"), var["_id"]),
+                reverse=True,
+            )
+            return variants, tiered_variants, len(variants), None
+
+        rows, has_more = DNAUtility.get_variant_page(
+            assay_group, subpanel, settings, sort="af", direction=-1, limit=page_size
+        )
+        next_cursor = DNAUtility.encode_variant_cursor(rows[-1], "af", -1) if has_more else None
+        tiered_variants = DNAUtility.get_tiered_snvs(assay_group, subpanel, settings)
+        return rows, tiered_variants, total, next_cursor
+
+    @staticmethod
+    def add_diagnosis_genelists(assay_config: dict, sample: dict) -> dict:
+        """
+        Add the default gene lists of the sample subpanel to the assay config filters.
+
+        Applies when the assay config sets `use_diagnosis_genelist` and the sample has a
+        subpanel; the variant list and its paginated endpoint both filter with the result.
+
+        Args:
+            assay_config (dict): The formatted assay config of the sample.
+            sample (dict): The sample document.
+
+        Returns:
+            dict: The assay config, or a copy of it with the extended `filters.genelists`.
+        """
+        subpanel = sample.get("subpanel")
+        if not (assay_config.get("use_diagnosis_genelist", False) and subpanel):
+            return assay_config
+        genelist_ids = store.isgl_handler.get_isgl_ids(
+            sample.get("assay"), subpanel, "genelist", is_active=True
+        )
+        filters = dict(assay_config.get("filters", {}))
+        filters["genelists"] = [*filters.get("genelists", []), *genelist_ids]
+        return {**assay_config, "filters": filters}
+
+    @staticmethod
+    def get_filtered_cnvs(cnv_query: dict, filter_cnveffects: list) -> list:
+        """
+        Fetch the CNVs of a sample matching a CNV query, filtered by effect and with genes organized.
+
+        Args:
+            cnv_query (dict): The query built by `build_cnv_query`.
+            filter_cnveffects (list): CNV effects to keep (`DEL`, `AMP`); all if empty.
+
+        Returns:
+            list: The CNVs for display.
+        """
+        cnvs = store.cnv_handler.get_sample_cnvs(cnv_query)
+        if filter_cnveffects:
+            cnvs = DNAUtility.cnvtype_variant(cnvs, filter_cnveffects)
+        return DNAUtility.cnv_organizegenes(cnvs)
+
+    # Knowledge-base tags (reference cache namespaces) a knowledge bundle depends on
+    KNOWLEDGE_BUNDLE_TAGS = ("civic", "oncokb", "brca_exchange", "iarc_tp53", "expression")
+
+    @staticmethod
+    def civic_variant_desc(variant: dict) -> str:
+        """
+        Return the CIViC variant description matched for special variant types.
+
+        Args:
+            variant (dict): The variant document.
+
+        Returns:
+            str: `EXON 9 FRAMESHIFT` for CALR exon 9 frameshifts, `ITD` for FLT3 ITDs,
+            otherwise a placeholder that matches no CIViC variant.
+        """
+        csq = variant["INFO"]["selected_CSQ"]
+        variant_desc = "NOTHING_IN_HERE"
+        if (
+            csq["SYMBOL"] == "CALR"
+            and csq["EXON"] == "9/9"
+            and "frameshift_variant" in csq["Consequence"]
+        ):
+            variant_desc = "EXON 9 FRAMESHIFT"
+        if csq["SYMBOL"] == "FLT3" and "SVLEN" in variant["INFO"] and variant["INFO"]["SVLEN"] > 10:
+            variant_desc = "ITD"
+        return variant_desc
+
+    @staticmethod
+    def oncokb_alterations(variant: dict) -> list:
+        """
+        Return the OncoKB alteration names to look up for a variant.
+
+        Args:
+            variant (dict): The variant document.
+
+        Returns:
+            list: The one-letter protein change without `p.`, and `Truncating Mutations`
+            for truncating consequences.
+        """
+        one_letter_p = app.jinja_env.filters["one_letter_p"]
+        csq = variant["INFO"]["selected_CSQ"]
+        oncokb_hgvsp = []
+        if len(csq["HGVSp"]) > 0:
+            oncokb_hgvsp.append(one_letter_p(csq["HGVSp"]).replace("p.", ""))
+
+        if csq["Consequence"] in [
+            "frameshift_variant",
+            "stop_gained",
+            "frameshift_deletion",
+            "frameshift_insertion",
+        ]:
+            oncokb_hgvsp.append("Truncating Mutations")
+        return oncokb_hgvsp
+
+    @staticmethod
+    def load_knowledge_bundle(variant: dict, assay_group: str) -> dict:
+        """
+        Look up the knowledge-base data shown for a variant (CIViC, OncoKB, BRCA Exchange,
+        IARC TP53 and expression).
+
+        Args:
+            variant (dict): The variant document.
+            assay_group (str): The assay group of the sample (BRCA Exchange is assay specific).
+
+        Returns:
+            dict: The knowledge-base documents keyed by their template name. Cursors are
+            materialized so the bundle can be cached.
+        """
+        gene = variant["INFO"]["selected_CSQ"]["SYMBOL"]
+        oncokb_hgvsp = DNAUtility.oncokb_alterations(variant)
+        return {
+            "civic": list(
+                store.civic_handler.get_civic_data(variant, DNAUtility.civic_variant_desc(variant))
+            ),
+            "civic_gene": store.civic_handler.get_civic_gene_info(gene),
+            "oncokb": store.oncokb_handler.get_oncokb_anno(variant, oncokb_hgvsp),
+            "oncokb_action": list(store.oncokb_handler.get_oncokb_action(variant, oncokb_hgvsp)),
+            "oncokb_gene": store.oncokb_handler.get_oncokb_gene(gene),
+            "brca_exchange": store.brca_handler.get_brca_data(variant, assay_group),
+            "iarc_tp53": store.iarc_tp53_handler.find_iarc_tp53(variant),
+            "expression": store.expression_handler.get_expression_data(
+                list(variant.get("transcripts") or [])
+            ),
+        }
+
+    @staticmethod
+    def get_knowledge_bundle(variant: dict, assay_group: str, vep_version: Any) -> dict:
+        """
+        Return the knowledge-base bundle of a variant, served from the Redis cache when possible.
+
+        Bundles are keyed by the variant `simple_id`, its selected transcript, the assay group,
+        the VEP version of the sample and a stamp of the knowledge-base tag versions. After a
+        knowledge-base collection is reloaded, invalidating its tag through the reference cache
+        (`POST /admin/reference-cache/invalidate`) retires every bundle built from it.
+
+        Args:
+            variant (dict): The variant document.
+            assay_group (str): The assay group of the sample.
+            vep_version (Any): The VEP version of the sample.
+
+        Returns:
+            dict: The knowledge-base bundle, see `load_knowledge_bundle`. Treat as read-only.
+        """
+        timeout = app.config.get("KNOWLEDGE_BUNDLE_CACHE_TIMEOUT", 86400)
+        cache = getattr(app, "cache", None)
+        simple_id = variant.get("simple_id")
+        if not timeout or cache is None or not simple_id:
+            return DNAUtility.load_knowledge_bundle(variant, assay_group)
+
+        stamp = store.reference_cache.version_stamp(DNAUtility.KNOWLEDGE_BUNDLE_TAGS)
+        feature = variant["INFO"]["selected_CSQ"].get("Feature", "")
+        cache_key = f"kb_bundle:{stamp}:{vep_version}:{assay_group}:{simple_id}:{feature}"
+
+        try:
+            bundle = cache.get(cache_key)
+        except Exception as exc:
+            app.logger.warning(f"[KB BUNDLE] Cache lookup failed for {simple_id}: {exc}")
+            bundle = None
+        if bundle is not None:
+            return bundle
+
+        bundle = DNAUtility.load_knowledge_bundle(variant, assay_group)
+        try:
+            cache.set(cache_key, bundle, timeout=timeout)
+        except Exception as exc:
+            app.logger.warning(f"[KB BUNDLE] Could not cache bundle for {simple_id}: {exc}")
+        return bundle
+
+    @staticmethod
+    def variant_sort_value(variant: dict, sort: str) -> Any:
+        """
+        Python counterpart of `VARIANT_SORT_FIELDS`, plus the `tier` sort key.
+
+        Used to sort an already fetched variant list in the same order as the paginated
+        endpoint, and for tier sorting, which needs the classification from the annotations.
+
+        Args:
+            variant (dict): A variant document (list projection).
+            sort (str): gene, af, depth or tier.
+
+        Returns:
+            Any: The sort value; missing values sort like the MongoDB side (`""`, `-1`, `999`).
+        """
+        if sort == "gene":
+            return (variant.get("INFO", {}).get("selected_CSQ", {}) or {}).get("SYMBOL") or ""
+        if sort == "tier":
+            class_value = (variant.get("classification") or {}).get("class")
+            return class_value if class_value is not None else 999
+
+        gts = variant.get("GT") or []
+        case_gt = next((gt for gt in gts if gt.get("type") == "case"), gts[0] if gts else {})
+        value = case_gt.get("AF" if sort == "af" else "DP")
+        return value if value is not None else -1
+
+    @staticmethod
+    def encode_variant_cursor(variant: dict, sort: str, direction: int) -> str:
+        """
+        Build the opaque paging cursor pointing after `variant`.
+
+        Args:
+            variant (dict): The last variant of a page; must carry `_sort` and `_id`.
+            sort (str): The sort field of the page.
+            direction (int): 1 for ascending, -1 for descending.
+
+        Returns:
+            str: A URL safe cursor token.
+        """
+        raw = json.dumps(
+            {"s": sort, "d": direction, "v": variant["_sort"], "id": str(variant["_id"])},
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(raw.encode()).decode()
+
+    @staticmethod
+    def decode_variant_cursor(token: str, sort: str, direction: int) -> tuple[Any, ObjectId]:
+        """
+        Decode a paging cursor built by `encode_variant_cursor`.
+
+        Args:
+            token (str): The cursor token from the previous page.
+            sort (str): The sort field of the requested page.
+            direction (int): The sort direction of the requested page.
+
+        Returns:
+            tuple[Any, ObjectId]: The `(sort value, _id)` to continue after.
+
+        Raises:
+            ValueError: If the token is malformed or was issued for another sort order.
+        """
+        try:
+            cursor = json.loads(base64.urlsafe_b64decode(token.encode()))
+            after = (cursor["v"], ObjectId(cursor["id"]))
+        except (ValueError, TypeError, KeyError, InvalidId) as exc:
+            raise ValueError(f"Invalid variant page cursor: {exc}") from exc
+        if cursor.get("s") != sort or cursor.get("d") != direction:
+            raise ValueError("Variant page cursor was issued for a different sort order")
+        return after
+
+    @staticmethod
+    def get_variant_page(
+        assay_group: str,
+        subpanel: str | None,
+        settings: dict,
+        sort: str = "gene",
+        direction: int = 1,
+        after: tuple | None = None,
+        limit: int = 100,
+    ) -> tuple[list, bool]:
+        """
+        Fetch and enrich one page of the filtered SNV list.
+
+        Gene, AF and depth are sorted and paged in MongoDB, and the blacklist, global
+        annotation and hotspot enrichment runs only for the returned page. Tier sorting needs
+        the classification of every matching variant, so it fetches the whole (projected) list,
+        resolves the annotations in bulk and pages in memory.
+
+        Args:
+            assay_group (str): The assay group of the sample.
+            subpanel (str | None): The subpanel of the sample.
+            settings (dict): The variant filter settings, as for `build_query`.
+            sort (str): gene, af, depth or tier.
+            direction (int): 1 for ascending, -1 for descending.
+            after (tuple | None): `(sort value, _id)` of the last variant already shown.
+            limit (int): Page size.
+
+        Returns:
+            tuple[list, bool]: The enriched variants of the page, and whether more pages follow.
+        """
+        projection = store.variant_handler.get_projection("list")
+
+        if sort == "tier":
+            variants = store.variant_handler.aggregate_case_variants(
+                build_query_pipeline(assay_group, settings, projection=projection)
+            )
+            variants, _ = DNAUtility.add_global_annotations(variants, assay_group, subpanel)
+            for variant in variants:
+                variant["_sort"] = DNAUtility.variant_sort_value(variant, "tier")
+            variants.sort(key=lambda var: (var["_sort"], var["_id"]), reverse=direction < 0)
+            if after is not None:
+                variants = [
+                    var
+                    for var in variants
+                    if (
+                        (var["_sort"], var["_id"]) > after
+                        if direction > 0
+                        else (var["_sort"], var["_id"]) < after
+                    )
+                ]
+            page = variants[: limit + 1]
+        else:
+            page = store.variant_handler.aggregate_case_variants(
+                build_page_pipeline(
+                    assay_group,
+                    settings,
+                    sort=sort,
+                    direction=direction,
+                    after=after,
+                    limit=limit + 1,
+                    projection=projection,
+                )
+            )
+
+        has_more = len(page) > limit
+        page = page[:limit]
+
+        page = store.blacklist_handler.add_blacklist_data(page, assay_group)
+        if sort != "tier":
+            page, _ = DNAUtility.add_global_annotations(page, assay_group, subpanel)
+        page = DNAUtility.hotspot_variant(page)
+        return page, has_more
+
+    @staticmethod
+    def get_oncokb_gene_names(variants: list) -> list:
+        """
+        Return the Hugo symbols of the OncoKB actionable genes among the variants, in variant order.
+
+        Args:
+            variants (list): Variant documents with `INFO.selected_CSQ.SYMBOL`.
+
+        Returns:
+            list: Unique actionable gene symbols.
+        """
+        oncokb_action_genes = store.oncokb_handler.get_oncokb_action_genes(
+            [variant["INFO"]["selected_CSQ"]["SYMBOL"] for variant in variants]
+        )
+        oncokb_genes = []
+        for variant in variants:
+            oncokb_gene = oncokb_action_genes.get(variant["INFO"]["selected_CSQ"]["SYMBOL"])
+            if oncokb_gene and "Hugo Symbol" in oncokb_gene:
+                name = oncokb_gene["Hugo Symbol"]
+                if name not in oncokb_genes:
+                    oncokb_genes.append(name)
+        return oncokb_genes
+
+    @staticmethod
+    def get_verification_positions(sample_name: str, assay_config: dict) -> tuple[list, str | None]:
+        """
+        Return the positions to display for a verification sample (e.g. an HD sample).
+
+        Args:
+            sample_name (str): The sample name.
+            assay_config (dict): The assay configuration with optional `verification_samples`.
+
+        Returns:
+            tuple[list, str | None]: The positions, and the matching verification sample key.
+        """
+        disp_pos = []
+        verification_sample_used = None
+        for veri_key, veri_value in (assay_config.get("verification_samples") or {}).items():
+            if veri_key in sample_name:
+                disp_pos = veri_value
+                verification_sample_used = veri_key
+        return disp_pos, verification_sample_used
+
+    @staticmethod
+    def get_igv_bam_paths(bam_id: dict) -> list:
+        """
+        Build the IGV file list (BAMs plus the design BED) used for the Chr:Pos links.
+
+        Mirrors the BAM path block at the top of `list_variants_vep.html`.
+
+        Args:
+            bam_id (dict): Sample id to BAM paths, as returned by `BamServiceHandler.get_bams`.
+
+        Returns:
+            list: IGV `/R:` file paths.
+        """
+        paths = []
+        subfolder = None
+        for bam_paths in bam_id.values():
+            for path in bam_paths:
+                subfolder = path.split("/")[0]
+                paths.append(f"/R:{path}")
+        if subfolder and subfolder != "tumwgs":
+            paths.append(f"/R:{subfolder}/BED/design.bed")
+        return paths
+
     @staticmethod
     def get_simple_variants_for_report(variants: list, assay_config: dict) -> list:
         """
@@ -514,6 +1080,121 @@ class DNAUtility:
         """
         return CommonUtility.utc_now().strftime("%y%m%d%H%M%S")
 
+    REPORT_STAMP_PREFIX = "report_stamp"
+    REPORT_TEMPLATES = ("dna_report.html", "report_layout.html")
+
+    @staticmethod
+    def get_report_stamp(scope: str) -> str | None:
+        """
+        Read a report change stamp (`sample:<id>` or `config`) from Redis.
+
+        Returns:
+            str | None: The stamp (`"0"` if never bumped), or None if it cannot be read.
+        """
+        cache = getattr(app, "cache", None)
+        if cache is None:
+            return None
+        try:
+            return cache.get(f"{DNAUtility.REPORT_STAMP_PREFIX}:{scope}") or "0"
+        except Exception as exc:
+            app.logger.warning(f"[REPORT PREVIEW] Stamp lookup failed for {scope}: {exc}")
+            return None
+
+    @staticmethod
+    def bump_report_stamp(scope: str) -> None:
+        """
+        Publish a new report change stamp, retiring every cached report preview built on it.
+
+        Args:
+            scope (str): `sample:<sample_oid>` after a change to one sample, `config` after
+                an assay, panel or genelist configuration change.
+        """
+        cache = getattr(app, "cache", None)
+        if cache is None:
+            return
+        try:
+            cache.set(f"{DNAUtility.REPORT_STAMP_PREFIX}:{scope}", uuid.uuid4().hex, timeout=0)
+        except Exception as exc:
+            app.logger.warning(f"[REPORT PREVIEW] Could not bump stamp {scope}: {exc}")
+
+    @staticmethod
+    def report_template_version() -> str:
+        """
+        Return a short hash of the app version and the DNA report template sources.
+        """
+        digest = hashlib.sha1(str(app.config.get("APP_VERSION", "")).encode())
+        for name in DNAUtility.REPORT_TEMPLATES:
+            source, _, _ = app.jinja_env.loader.get_source(app.jinja_env, name)
+            digest.update(source.encode())
+        return digest.hexdigest()[:16]
+
+    @staticmethod
+    def get_dna_report_preview(sample: dict, assay_config: dict, save: int = 0) -> str:
+        """
+        Return the rendered DNA report preview, served from the Redis cache when possible.
+
+        Previews are keyed by a hash of the sample document, the sample change stamp, the
+        annotation, configuration and blacklist stamps, the assay config, the report template
+        version, the VEP metadata version, the user and the date. Flag, comment and
+        classification changes bump these stamps (see the `dna_bp` after-request hook and
+        `AnnotationsHandler.bump_stamp`), so
+        the next preview is built again with `build_dna_report_payload`.
+
+        Args:
+            sample (dict): Sample document as retrieved from the database.
+            assay_config (dict): Formatted assay configuration of the sample.
+            save (int): Passed through to the report template.
+
+        Returns:
+            str: The rendered report HTML.
+        """
+        timeout = app.config.get("REPORT_PREVIEW_CACHE_TIMEOUT", 3600)
+        cache = getattr(app, "cache", None)
+        if not timeout or cache is None:
+            return DNAUtility.build_dna_report_payload(sample, assay_config, save=save)[0]
+
+        assay_group = assay_config.get("asp_group", "unknown")
+        stamps = [
+            DNAUtility.get_report_stamp(f"sample:{sample['_id']}"),
+            store.annotation_handler.get_stamp(),
+            DNAUtility.get_report_stamp("config"),
+            store.blacklist_handler.get_stamp(assay_group),
+        ]
+        if None in stamps:
+            return DNAUtility.build_dna_report_payload(sample, assay_config, save=save)[0]
+
+        content = json.dumps(
+            {
+                "sample": sample,
+                "assay_config": assay_config,
+                "stamps": stamps,
+                "template": DNAUtility.report_template_version(),
+                "refdata": store.reference_cache.version_stamp(["vep_metadata"]),
+                "user": current_user.username,
+                "date": datetime.now().date().isoformat(),
+                "save": save,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        cache_key = f"report_preview:{sample['_id']}:{hashlib.sha256(content.encode()).hexdigest()}"
+
+        try:
+            html = cache.get(cache_key)
+        except Exception as exc:
+            app.logger.warning(f"[REPORT PREVIEW] Cache lookup failed for {sample['_id']}: {exc}")
+            html = None
+        if html is not None:
+            app.logger.debug(f"[REPORT PREVIEW] cache hit {cache_key}")
+            return html
+
+        html, _ = DNAUtility.build_dna_report_payload(sample, assay_config, save=save)
+        try:
+            cache.set(cache_key, html, timeout=timeout)
+        except Exception as exc:
+            app.logger.warning(f"[REPORT PREVIEW] Could not cache preview {sample['_id']}: {exc}")
+        return html
+
     @staticmethod
     def build_dna_report_payload(
         sample: dict,
@@ -588,7 +1269,7 @@ class DNAUtility:
         if not sample.get("filters"):
             sample = CommonUtility.merge_sample_settings_with_assay_config(sample, assay_config)
 
-        sample_filters = deepcopy(sample.get("filters", {}))
+        sample_filters = sample.get("filters", {})
 
         checked_genelists = sample_filters.get("genelists", [])
         checked_genelists_genes_dict: list[dict] = store.isgl_handler.get_isgl_by_ids(
@@ -625,7 +1306,7 @@ class DNAUtility:
             },
         )
 
-        variants = list(store.variant_handler.get_case_variants(query))
+        variants = list(store.variant_handler.get_case_variants(query, profile="report"))
         variants = store.blacklist_handler.add_blacklist_data(variants, assay=assay_group)
 
         # This returns tiered_variants already — that’s your snapshot gold
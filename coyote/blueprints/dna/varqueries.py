@@ -14,378 +14,371 @@
 This module is part of the Coyote3 codebase and provides query-building utilities for genomic data analysis.
 It defines functions to construct MongoDB queries for different analysis types (e.g., myeloid, solid, swea)
 based on user-provided settings, such as frequency thresholds, depth, gene filters, and variant consequences.
+
+Queries are built from one template per assay group and memoized on a hash of the assay group
+and the filter settings, so repeated views of a sample with unchanged filters reuse the same query.
+
+`build_page_pipeline` pages through the same query with a server-side sort and a keyset cursor,
+for the paginated variant list endpoint (`dna_bp.list_variants_page`).
 """
 
+from collections import OrderedDict
+from copy import deepcopy
+from hashlib import md5
+import json
 import re
+import threading
+
+
+# Long ALT alleles, used to keep FLT3 ITDs and other large insertions in the myeloid list
+LARGE_INS_REGEX = re.compile(r"\w{10,200}", re.IGNORECASE)
+
+# Number of distinct (assay group, settings) queries kept in memory per worker
+QUERY_CACHE_SIZE = 256
+
+_query_cache: OrderedDict[str, dict] = OrderedDict()
+_query_cache_lock = threading.Lock()
 
 
 def build_query(assay_group: str, settings: dict) -> dict:
     """
     Constructs a MongoDB query dictionary for genomic variant analysis based on the analysis type and user settings.
 
+    The query is memoized on a hash of `assay_group` and `settings`. The returned dictionary is
+    shared between callers and must not be modified.
+
     Args:
         assay_group (str): The analysis type (e.g., "myeloid", "solid", "swea", etc.).
         settings (dict): User-provided settings including frequency thresholds, depth, gene filters, and variant consequences.
 
     Returns:
         dict: A MongoDB query dictionary tailored to the specified analysis type and settings.
+
+    Raises:
+        ValueError: If there is no query template for `assay_group`.
     """
+    key = query_cache_key(assay_group, settings)
+    with _query_cache_lock:
+        query = _query_cache.get(key)
+        if query is not None:
+            _query_cache.move_to_end(key)
+            return query
 
-    large_ins_regex = re.compile(r"\w{10,200}", re.IGNORECASE)
-    gene_pos_filter = build_pos_genes_filter(settings)
-
-    # Myeloid requires settings: min_freq, min_depth, min_alt_reads, max_control_freq, filter_conseq(list)
-
-    if assay_group in {"myeloid", "hematology", "fusion", "tumwgs", "unknown"}:
-        query = {
-            "SAMPLE_ID": settings["id"],
-            "$and": [
-                gene_pos_filter,  # gene_pos_filter
-                {
-                    "$or": [
-                        {"INFO.MYELOID_GERMLINE": 1},
-                        {
-                            "FILTER": {"$in": ["GERMLINE"]},
-                            "INFO.CSQ": {"$elemMatch": {"SYMBOL": "CEBPA"}},
-                        },
-                        {
-                            "$and": [
-                                {"POS": {"$gt": 115256520}},
-                                {"POS": {"$lt": 115256538}},
-                                {"CHROM": 1},
-                            ]
-                        },
-                        {
-                            "$and": [
-                                # Case sample fulfills filter critieria
-                                {
-                                    "GT": {
-                                        "$elemMatch": {
-                                            "type": "case",
-                                            "AF": {
-                                                "$gte": float(
-                                                    settings["min_freq"]
-                                                ),
-                                                "$lte": float(
-                                                    settings["max_freq"]
-                                                ),
-                                            },
-                                            "DP": {
-                                                "$gte": float(
-                                                    settings["min_depth"]
-                                                )
-                                            },
-                                            "VD": {
-                                                "$gte": float(
-                                                    settings["min_alt_reads"]
-                                                )
-                                            },
-                                        }
-                                    }
-                                },
-                                # Either control sample fulfills criteria, or there is no control sample (unpaired tumor sample)
-                                {
-                                    "$or": [
-                                        {
-                                            "GT": {
-                                                "$elemMatch": {
-                                                    "type": "control",
-                                                    "AF": {
-                                                        "$lte": float(
-                                                            settings[
-                                                                "max_control_freq"
-                                                            ]
-                                                        )
-                                                    },
-                                                    "DP": {
-                                                        "$gte": float(
-                                                            settings[
-                                                                "min_depth"
-                                                            ]
-                                                        )
-                                                    },
-                                                }
-                                            }
-                                        },
-                                        {
-                                            "GT": {
-                                                "$not": {
-                                                    "$elemMatch": {
-                                                        "type": "control"
-                                                    }
-                                                }
-                                            }
-                                        },
-                                    ]
-                                },
-                                # Filters if gnomad population frequency are above the max_popfreq
-                                {
-                                    "$or": [
-                                        {
-                                            "gnomad_frequency": {
-                                                "$exists": True,
-                                                "$type": "number",
-                                                "$lte": float(
-                                                    settings["max_popfreq"]
-                                                ),
-                                            }
-                                        },
-                                        {
-                                            "gnomad_frequency": {
-                                                "$type": "string"
-                                            }
-                                        },
-                                        {"gnomad_frequency": None},
-                                        {
-                                            "gnomad_frequency": {
-                                                "$exists": False
-                                            }
-                                        },
-                                    ]
-                                },
-                                # Either variant fullfills Consequence-filter or is a structural variant in FLT3.
-                                {
-                                    "$or": [
-                                        {
-                                            "INFO.selected_CSQ.Consequence": {
-                                                "$in": settings[
-                                                    "filter_conseq"
-                                                ]
-                                            }
-                                        },
-                                        {
-                                            "INFO.CSQ": {
-                                                "$elemMatch": {
-                                                    "Consequence": {
-                                                        "$in": settings[
-                                                            "filter_conseq"
-                                                        ]
-                                                    }
-                                                }
-                                            }
-                                        },
-                                        {
-                                            "$and": [
-                                                {"genes": {"$in": ["FLT3"]}},
-                                                {
-                                                    "$or": [
-                                                        {
-                                                            "INFO.SVTYPE": {
-                                                                "$exists": "true"
-                                                            }
-                                                        },
-                                                        {
-                                                            "ALT": large_ins_regex
-                                                        },
-                                                    ]
-                                                },
-                                            ]
-                                        },
-                                    ]
-                                },
-                            ]
-                        },
-                    ],
-                },
-            ],
-        }
+    template = QUERY_TEMPLATES.get(assay_group)
+    if template is None:
+        raise ValueError(f"No variant query template for assay group: {assay_group}")
+    # Built from a private copy so later changes to the caller's lists cannot leak into the cache
+    query = template(deepcopy(settings))
 
-    if assay_group in ["swea", "gmsonco"]:
-        query = {
-            "SAMPLE_ID": settings["id"],
-            "$and": [
-                gene_pos_filter,
-                # Case sample fulfills filter critieria
-                {
-                    "GT": {
-                        "$elemMatch": {
-                            "AF": {
-                                "$gte": float(settings["min_freq"]),
-                                "$lte": float(settings["max_freq"]),
-                            },
-                            "DP": {"$gte": float(settings["min_depth"])},
-                            "VD": {"$gte": float(settings["min_alt_reads"])},
-                        }
-                    }
-                },
-                # Either variant fullfills Consequence-filter or is a structural variant in FLT3.
-                {
-                    "INFO.CSQ": {
-                        "$elemMatch": {
-                            "Consequence": {"$in": settings["filter_conseq"]}
-                        }
-                    }
-                },
-            ],
+    with _query_cache_lock:
+        _query_cache[key] = query
+        while len(_query_cache) > QUERY_CACHE_SIZE:
+            _query_cache.popitem(last=False)
+    return query
+
+
+def build_query_pipeline(assay_group: str, settings: dict, projection: dict | None = None) -> list:
+    """
+    Constructs an aggregation pipeline that matches the variant query and projects only the given fields.
+
+    Args:
+        assay_group (str): The analysis type (e.g., "myeloid", "solid", "swea", etc.).
+        settings (dict): The filter settings, as for `build_query`.
+        projection (dict | None): Fields to keep, usually one of the
+            `VariantsHandler.PROJECTION_PROFILES`. Without it no `$project` stage is added.
+
+    Returns:
+        list: A `$match` (+ `$project`) pipeline for the variants collection.
+    """
+    pipeline = [{"$match": build_query(assay_group, settings)}]
+    if projection:
+        pipeline.append({"$project": projection})
+    return pipeline
+
+
+def _case_gt_value(field: str) -> dict:
+    """
+    Aggregation expression for a field of the case genotype (first GT entry if none is typed case).
+    """
+    case_gt = {
+        "$filter": {
+            "input": {"$ifNull": ["$GT", []]},
+            "as": "gt",
+            "cond": {"$eq": ["$$gt.type", "case"]},
         }
+    }
+    return {
+        "$let": {
+            "vars": {
+                "gt": {
+                    "$ifNull": [
+                        {"$arrayElemAt": [case_gt, 0]},
+                        {"$arrayElemAt": [{"$ifNull": ["$GT", []]}, 0]},
+                    ]
+                }
+            },
+            "in": f"$$gt.{field}",
+        }
+    }
+
+
+# Sort expressions for the paginated variant list. Missing values are coalesced to a value of
+# the same type, so keyset paging ($gt/$lt on the sort value) never compares against null.
+VARIANT_SORT_FIELDS = {
+    "gene": {"$ifNull": ["$INFO.selected_CSQ.SYMBOL", ""]},
+    "af": {"$ifNull": [_case_gt_value("AF"), -1]},
+    "depth": {"$ifNull": [_case_gt_value("DP"), -1]},
+}
+
+
+def build_page_pipeline(
+    assay_group: str,
+    settings: dict,
+    sort: str = "gene",
+    direction: int = 1,
+    after: tuple | None = None,
+    limit: int = 100,
+    projection: dict | None = None,
+) -> list:
+    """
+    Constructs an aggregation pipeline returning one page of the variant query, sorted server-side.
+
+    Paging is keyset based: `after` is the `(sort value, _id)` of the last variant of the previous
+    page, so every page is an index-friendly range read instead of a growing `$skip`. Each
+    returned document carries its sort value in `_sort`, which is what the next cursor is built from.
+
+    Args:
+        assay_group (str): The analysis type (e.g., "myeloid", "solid", "swea", etc.).
+        settings (dict): The filter settings, as for `build_query`.
+        sort (str): One of `VARIANT_SORT_FIELDS` (gene, af, depth).
+        direction (int): 1 for ascending, -1 for descending.
+        after (tuple | None): `(sort value, ObjectId)` of the last variant already shown.
+        limit (int): Maximum number of variants to return.
+        projection (dict | None): Fields to keep, usually `VariantsHandler.PROJECTION_PROFILES["list"]`.
+
+    Returns:
+        list: The aggregation pipeline for the variants collection.
+
+    Raises:
+        ValueError: If `sort` is not a known sort field.
+    """
+    if sort not in VARIANT_SORT_FIELDS:
+        raise ValueError(f"Unknown variant sort field: {sort}")
 
-    if assay_group == "solid":
-        query = {
-            "SAMPLE_ID": settings["id"],
-            "$and": [
-                gene_pos_filter,  # gene_pos_filter
-                {
-                    "$or": [
-                        {"FILTER": {"$in": ["GERMLINE"]}},
-                        {
-                            "$and": [
-                                # Case sample fulfills filter critieria
-                                {
-                                    "GT": {
-                                        "$elemMatch": {
-                                            "type": "case",
-                                            "AF": {
-                                                "$gte": float(
-                                                    settings["min_freq"]
-                                                ),
-                                                "$lte": float(
-                                                    settings["max_freq"]
-                                                ),
-                                            },
-                                            "DP": {
-                                                "$gte": float(
-                                                    settings["min_depth"]
-                                                )
-                                            },
-                                            "VD": {
-                                                "$gte": float(
-                                                    settings["min_alt_reads"]
-                                                )
-                                            },
-                                        }
-                                    }
-                                },
-                                # Either control sample fulfills criteria, or there is no control sample (unpaired tumor sample)
-                                {
-                                    "$or": [
-                                        {
-                                            "GT": {
-                                                "$elemMatch": {
-                                                    "type": "control",
-                                                    "AF": {
-                                                        "$lte": float(
-                                                            settings[
-                                                                "max_control_freq"
-                                                            ]
-                                                        )
-                                                    },
-                                                    "DP": {
-                                                        "$gte": float(
-                                                            settings[
-                                                                "min_depth"
-                                                            ]
-                                                        )
-                                                    },
-                                                }
-                                            }
-                                        },
-                                        {
-                                            "GT": {
-                                                "$not": {
-                                                    "$elemMatch": {
-                                                        "type": "control"
-                                                    }
-                                                }
-                                            }
-                                        },
-                                    ]
-                                },
-                                # Filters if gnomad population frequency are above the max_popfreq
-                                {
-                                    "$or": [
-                                        {
-                                            "gnomad_frequency": {
-                                                "$exists": True,
-                                                "$type": "number",
-                                                "$lte": float(
-                                                    settings["max_popfreq"]
-                                                ),
-                                            }
-                                        },
-                                        {
-                                            "gnomad_frequency": {
-                                                "$type": "string"
-                                            }
-                                        },
-                                        {"gnomad_frequency": None},
-                                        {
-                                            "gnomad_frequency": {
-                                                "$exists": False
-                                            }
-                                        },
-                                    ]
-                                },
-                                # Either variant fullfills Consequence-filter or is a promoter variant in TERT.
-                                {
-                                    "$or": [
-                                        {
-                                            "INFO.selected_CSQ.Consequence": {
-                                                "$in": settings[
-                                                    "filter_conseq"
-                                                ]
-                                            }
-                                        },
-                                        {
-                                            "INFO.CSQ": {
-                                                "$elemMatch": {
-                                                    "Consequence": {
-                                                        "$in": settings[
-                                                            "filter_conseq"
-                                                        ]
-                                                    }
-                                                }
-                                            }
-                                        },
-                                        {
-                                            "$and": [
-                                                {
-                                                    "$or": [
-                                                        {
-                                                            "genes": {
-                                                                "$in": [
-                                                                    "TERT",
-                                                                    "NFKBIE",
-                                                                ]
-                                                            }
-                                                        },
-                                                    ]
-                                                },
-                                                {
-                                                    "$or": [
-                                                        {
-                                                            "INFO.selected_CSQ.Consequence": {
-                                                                "$in": [
-                                                                    "regulatory_region_variant",
-                                                                    "TF_binding_site_variant",
-                                                                ]
-                                                            }
-                                                        },
-                                                        {
-                                                            "INFO.CSQ": {
-                                                                "$elemMatch": {
-                                                                    "Consequence": {
-                                                                        "$in": [
-                                                                            "regulatory_region_variant",
-                                                                            "TF_binding_site_variant",
-                                                                        ]
-                                                                    }
-                                                                }
-                                                            }
-                                                        },
-                                                    ]
-                                                },
-                                            ]
-                                        },
-                                    ]
-                                },
-                            ]
-                        },
-                    ],
-                },
-            ],
+    pipeline = [
+        {"$match": build_query(assay_group, settings)},
+        {"$addFields": {"_sort": VARIANT_SORT_FIELDS[sort]}},
+    ]
+    if after is not None:
+        value, last_id = after
+        op = "$gt" if direction > 0 else "$lt"
+        pipeline.append(
+            {"$match": {"$or": [{"_sort": {op: value}}, {"_sort": value, "_id": {op: last_id}}]}}
+        )
+    pipeline.append({"$sort": {"_sort": direction, "_id": direction}})
+    pipeline.append({"$limit": limit})
+    if projection:
+        pipeline.append({"$project": {**projection, "_sort": 1}})
+    return pipeline
+
+
+def query_cache_key(assay_group: str, settings: dict) -> str:
+    """
+    Builds a stable hash key for an assay group and its filter settings.
+
+    Args:
+        assay_group (str): The analysis type.
+        settings (dict): The filter settings.
+
+    Returns:
+        str: An md5 hex digest of the normalized settings.
+    """
+    raw_key = json.dumps(
+        [assay_group, settings],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=lambda value: sorted(value) if isinstance(value, (set, frozenset)) else str(value),
+    )
+    return md5(raw_key.encode()).hexdigest()
+
+
+def _case_gt_filter(settings: dict, sample_type: str | None = "case") -> dict:
+    """
+    Case sample fulfills the frequency, depth and alt-read criteria.
+    """
+    elem_match = {"type": sample_type} if sample_type else {}
+    elem_match.update(
+        {
+            "AF": {
+                "$gte": float(settings["min_freq"]),
+                "$lte": float(settings["max_freq"]),
+            },
+            "DP": {"$gte": float(settings["min_depth"])},
+            "VD": {"$gte": float(settings["min_alt_reads"])},
         }
+    )
+    return {"GT": {"$elemMatch": elem_match}}
 
-    return query
+
+def _control_gt_filter(settings: dict) -> dict:
+    """
+    Either the control sample fulfills the criteria, or there is no control sample (unpaired tumor sample).
+    """
+    return {
+        "$or": [
+            {
+                "GT": {
+                    "$elemMatch": {
+                        "type": "control",
+                        "AF": {"$lte": float(settings["max_control_freq"])},
+                        "DP": {"$gte": float(settings["min_depth"])},
+                    }
+                }
+            },
+            {"GT": {"$not": {"$elemMatch": {"type": "control"}}}},
+        ]
+    }
+
+
+def _popfreq_filter(settings: dict) -> dict:
+    """
+    Filters out variants whose gnomad population frequency is above max_popfreq.
+    """
+    return {
+        "$or": [
+            {
+                "gnomad_frequency": {
+                    "$exists": True,
+                    "$type": "number",
+                    "$lte": float(settings["max_popfreq"]),
+                }
+            },
+            {"gnomad_frequency": {"$type": "string"}},
+            {"gnomad_frequency": None},
+            {"gnomad_frequency": {"$exists": False}},
+        ]
+    }
+
+
+def _conseq_filter(conseq: list, rescue: dict) -> dict:
+    """
+    Either the variant fulfills the consequence filter, or it matches the assay specific rescue clause.
+    """
+    return {
+        "$or": [
+            {"INFO.selected_CSQ.Consequence": {"$in": conseq}},
+            {"INFO.CSQ": {"$elemMatch": {"Consequence": {"$in": conseq}}}},
+            rescue,
+        ]
+    }
+
+
+def _myeloid_query(settings: dict) -> dict:
+    """
+    Query template for myeloid, hematology, fusion, tumwgs and unknown assay groups.
+    """
+    # Structural variants and large insertions in FLT3
+    flt3_rescue = {
+        "$and": [
+            {"genes": {"$in": ["FLT3"]}},
+            {"$or": [{"INFO.SVTYPE": {"$exists": "true"}}, {"ALT": LARGE_INS_REGEX}]},
+        ]
+    }
+    return {
+        "SAMPLE_ID": settings["id"],
+        "$and": [
+            build_pos_genes_filter(settings),
+            {
+                "$or": [
+                    {"INFO.MYELOID_GERMLINE": 1},
+                    {
+                        "FILTER": {"$in": ["GERMLINE"]},
+                        "INFO.CSQ": {"$elemMatch": {"SYMBOL": "CEBPA"}},
+                    },
+                    {
+                        "$and": [
+                            {"POS": {"$gt": 115256520}},
+                            {"POS": {"$lt": 115256538}},
+                            {"CHROM": 1},
+                        ]
+                    },
+                    {
+                        "$and": [
+                            _case_gt_filter(settings),
+                            _control_gt_filter(settings),
+                            _popfreq_filter(settings),
+                            _conseq_filter(settings["filter_conseq"], flt3_rescue),
+                        ]
+                    },
+                ],
+            },
+        ],
+    }
+
+
+def _swea_query(settings: dict) -> dict:
+    """
+    Query template for swea and gmsonco assay groups.
+    """
+    return {
+        "SAMPLE_ID": settings["id"],
+        "$and": [
+            build_pos_genes_filter(settings),
+            _case_gt_filter(settings, sample_type=None),
+            {"INFO.CSQ": {"$elemMatch": {"Consequence": {"$in": settings["filter_conseq"]}}}},
+        ],
+    }
+
+
+def _solid_query(settings: dict) -> dict:
+    """
+    Query template for the solid assay group.
+    """
+    # Promoter variants in TERT and NFKBIE
+    promoter_conseq = ["regulatory_region_variant", "TF_binding_site_variant"]
+    promoter_rescue = {
+        "$and": [
+            {"$or": [{"genes": {"$in": ["TERT", "NFKBIE"]}}]},
+            {
+                "$or": [
+                    {"INFO.selected_CSQ.Consequence": {"$in": promoter_conseq}},
+                    {"INFO.CSQ": {"$elemMatch": {"Consequence": {"$in": promoter_conseq}}}},
+                ]
+            },
+        ]
+    }
+    return {
+        "SAMPLE_ID": settings["id"],
+        "$and": [
+            build_pos_genes_filter(settings),
+            {
+                "$or": [
+                    {"FILTER": {"$in": ["GERMLINE"]}},
+                    {
+                        "$and": [
+                            _case_gt_filter(settings),
+                            _control_gt_filter(settings),
+                            _popfreq_filter(settings),
+                            _conseq_filter(settings["filter_conseq"], promoter_rescue),
+                        ]
+                    },
+                ],
+            },
+        ],
+    }
+
+
+# Query template per assay group
+QUERY_TEMPLATES = {
+    "myeloid": _myeloid_query,
+    "hematology": _myeloid_query,
+    "fusion": _myeloid_query,
+    "tumwgs": _myeloid_query,
+    "unknown": _myeloid_query,
+    "swea": _swea_query,
+    "gmsonco": _swea_query,
+    "solid": _solid_query,
+}
 
 
 def build_pos_genes_filter(settings: dict) -> dict:
@@ -21,26 +21,47 @@ from flask import (
     render_template,
     request,
     url_for,
-    send_from_directory,
     flash,
-    send_file,
+    jsonify,
+    g,
     Response,
 )
 from pprint import pformat
 from copy import deepcopy
 from wtforms import BooleanField
 from coyote.extensions import store, util
-from coyote.blueprints.dna import dna_bp, filters
+from coyote.blueprints.dna import dna_bp
 from coyote.blueprints.dna.varqueries import build_query
 from coyote.blueprints.dna.cnvqueries import build_cnv_query
 from coyote.blueprints.dna.forms import DNAFilterForm
 from coyote.errors.exceptions import AppError
 from coyote.util.decorators.access import require_sample_access
 from coyote.util.misc import get_sample_and_assay_config
+from coyote.util.section_loader import SectionLoader
+from coyote.util import plot_assets, report_queue
 from coyote.services.auth.decorators import require
-from PIL import Image
+from werkzeug.security import safe_join
 import os
-import io
+
+
+@dna_bp.after_request
+def bump_report_stamps(response: Response) -> Response:
+    """
+    Retire the cached report previews affected by a successful POST on a sample.
+
+    Every POST handled for a sample (flags, comments, classifications, filters) bumps the
+    sample report stamp. Classifications and global comments bump the annotation stamp
+    where they are written (`AnnotationsHandler`), as they appear in other reports.
+    """
+    sample = g.get("sample")
+    if (
+        request.method == "POST"
+        and sample
+        and response.status_code < 400
+        and request.endpoint != "dna_bp.generate_dna_report"
+    ):
+        util.dna.bump_report_stamp(f"sample:{sample['_id']}")
+    return response
 
 
 @dna_bp.route("/sample/<string:sample_id>", methods=["GET", "POST"])
@@ -69,11 +90,6 @@ def list_variants(sample_id: str) -> Response | str:
     # sample = store.sample_handler.get_sample(sample_id)  # sample_id = name/id
     sample_has_filters = sample.get("filters", None)
 
-    # Get case and control samples
-    sample_ids = util.common.get_case_and_control_sample_ids(sample)
-    if not sample_ids:
-        sample_ids = store.variant_handler.get_sample_ids(str(sample["_id"]))
-
     ## get the assay from the sample, fallback to the first group if not set
     sample_assay = sample.get("assay")
 
@@ -96,15 +112,11 @@ def list_variants(sample_id: str) -> Response | str:
     all_panel_genelist_names = util.common.get_assay_genelist_names(insilico_panel_genelists)
 
     # Adding the default gene lists to the assay_config, if the use_diagnosis_genelist is set to true
-    if assay_config.get("use_diagnosis_genelist", False) and subpanel:
-        assay_default_config_genelist_ids = store.isgl_handler.get_isgl_ids(
-            sample_assay, subpanel, "genelist", is_active=True
-        )
-        assay_config["filters"]["genelists"].extend(assay_default_config_genelist_ids)
+    assay_config = util.dna.add_diagnosis_genelists(assay_config, sample)
 
     # Get filter settings from the sample and merge with assay config if sample does not have values
     sample = util.common.merge_sample_settings_with_assay_config(sample, assay_config)
-    sample_filters = deepcopy(sample.get("filters", {}))
+    sample_filters = sample.get("filters", {})
 
     # Update the sample filters with the default values from the assay config if the sample is new and does not have any filters set
     if not sample_has_filters:
@@ -135,7 +147,7 @@ def list_variants(sample_id: str) -> Response | str:
 
         ## get sample again to receive updated forms!
         sample = store.sample_handler.get_sample_by_id(_id)
-        sample_filters = deepcopy(sample.get("filters"))
+        sample_filters = sample.get("filters")
 
     ############################################################################
 
@@ -152,7 +164,6 @@ def list_variants(sample_id: str) -> Response | str:
         sample, assay_panel_doc, checked_genelists_genes_dict
     )
 
-    filter_conseq = util.dna.get_filter_conseq_terms(sample_filters.get("vep_consequences", []))
     filter_cnveffects = util.dna.create_cnveffectlist(cnv_effects)
 
     # Add them to the form and update with the requested settings
@@ -168,86 +179,95 @@ def list_variants(sample_id: str) -> Response | str:
     form.process(data=form_data)
 
     # this is in config, but needs to be tested (2024-05-14) with a HD-sample of relevant name
-    disp_pos = []
-    verification_sample_used = None
-    if assay_config.get("verification_samples"):
-        verification_samples = assay_config.get("verification_samples")
-        for veri_key, veri_value in verification_samples.items():
-            if veri_key in sample["name"]:
-                disp_pos = verification_samples[veri_key]
-                verification_sample_used = veri_key
+    disp_pos, verification_sample_used = util.dna.get_verification_positions(
+        sample["name"], assay_config
+    )
 
     ## SNV FILTRATION STARTS HERE ! ##
     ##################################
     ## The query should really be constructed according to some configured rules for a specific assay
-    query = build_query(
+    snv_settings = util.dna.build_snv_settings(sample, sample_filters, filter_genes, disp_pos)
+
+    # The sections below are independent round trips, fetched concurrently and joined here
+    loader = SectionLoader("list_variants")
+    # Large lists fetch and enrich only their first page, the table loads the rest from
+    # list_variants_page
+    loader.add(
+        "snvs",
+        util.dna.get_snv_list,
         assay_group,
-        {
-            "id": str(sample["_id"]),
-            "max_freq": sample_filters["max_freq"],
-            "min_freq": sample_filters["min_freq"],
-            "max_control_freq": sample_filters["max_control_freq"],
-            "min_depth": sample_filters["min_depth"],
-            "min_alt_reads": sample_filters["min_alt_reads"],
-            "max_popfreq": sample_filters["max_popfreq"],
-            "filter_conseq": filter_conseq,
-            "filter_genes": filter_genes,
-            "disp_pos": disp_pos,
-        },
+        subpanel,
+        snv_settings,
+        app.config.get("DNA_VARIANT_PAGE_SIZE", 200),
+    )
+    loader.add("bams", util.bpcommon.get_sample_bams, sample)
+    loader.add(
+        "vep_variant_class",
+        store.vep_meta_handler.get_variant_class_translations,
+        sample.get("vep", 103),
     )
+    loader.add("vep_conseq", store.vep_meta_handler.get_conseq_translations, sample.get("vep", 103))
 
-    variants_iter = store.variant_handler.get_case_variants(query)
-    variants = list(variants_iter)
+    ## GET Other sections CNVs TRANSLOCS and OTHER BIOMARKERS ##
+    if "CNV" in analysis_sections:
+        cnv_query = build_cnv_query(
+            str(sample["_id"]),
+            filters={**sample_filters, "filter_genes": filter_genes},
+        )
+        loader.add("cnvs", util.dna.get_filtered_cnvs, cnv_query, filter_cnveffects)
+        loader.add(
+            "interesting_cnvs",
+            lambda: list(
+                store.cnv_handler.get_interesting_sample_cnvs(sample_id=str(sample["_id"]))
+            ),
+        )
 
-    # Add blacklist data
-    variants = store.blacklist_handler.add_blacklist_data(variants, assay_group)
+    if "BIOMARKER" in analysis_sections:
+        loader.add(
+            "biomarkers",
+            lambda: list(
+                store.biomarker_handler.get_sample_biomarkers(sample_id=str(sample["_id"]))
+            ),
+        )
 
-    # Add global annotations for the variants
-    variants, tiered_variants = util.dna.add_global_annotations(variants, assay_group, subpanel)
+    if "TRANSLOCATION" in analysis_sections:
+        loader.add(
+            "translocs",
+            store.transloc_handler.get_sample_translocations,
+            sample_id=str(sample["_id"]),
+        )
 
-    summary_sections_data["snvs"] = tiered_variants
+    if "FUSION" in analysis_sections:
+        loader.add(
+            "interesting_translocs",
+            store.transloc_handler.get_interesting_sample_translocations,
+            sample_id=str(sample["_id"]),
+        )
 
-    # Add hotspot data
-    variants = util.dna.hotspot_variant(variants)
+    sections = loader.run()
 
-    display_sections_data["snvs"] = deepcopy(variants)
+    # Only the fields rendered in the list are fetched (no full INFO.CSQ transcript list),
+    # with blacklist, global annotation and hotspot data added to the rendered rows
+    snv_rows, tiered_variants, snv_total, snv_next_cursor = sections["snvs"]
+    summary_sections_data["snvs"] = tiered_variants
+    display_sections_data["snvs"] = snv_rows
 
     ### SNV FILTRATION ENDS HERE ###
 
-    ## GET Other sections CNVs TRANSLOCS and OTHER BIOMARKERS ##
     if "CNV" in analysis_sections:
-        cnv_query = build_cnv_query(
-            str(sample["_id"]),
-            filters={**sample_filters, "filter_genes": filter_genes},
-        )
-        cnvs = store.cnv_handler.get_sample_cnvs(cnv_query)
-        if filter_cnveffects:
-            cnvs = util.dna.cnvtype_variant(cnvs, filter_cnveffects)
-        cnvs = util.dna.cnv_organizegenes(cnvs)
-
-        display_sections_data["cnvs"] = deepcopy(cnvs)
-        summary_sections_data["cnvs"] = list(
-            store.cnv_handler.get_interesting_sample_cnvs(sample_id=str(sample["_id"]))
-        )
+        display_sections_data["cnvs"] = sections["cnvs"]
+        summary_sections_data["cnvs"] = sections["interesting_cnvs"]
 
     if "BIOMARKER" in analysis_sections:
-        display_sections_data["biomarkers"] = list(
-            store.biomarker_handler.get_sample_biomarkers(sample_id=str(sample["_id"]))
-        )
+        display_sections_data["biomarkers"] = sections["biomarkers"]
         summary_sections_data["biomarkers"] = display_sections_data["biomarkers"]
 
     if "TRANSLOCATION" in analysis_sections:
-        display_sections_data["translocs"] = store.transloc_handler.get_sample_translocations(
-            sample_id=str(sample["_id"])
-        )
+        display_sections_data["translocs"] = sections["translocs"]
 
     if "FUSION" in analysis_sections:
         display_sections_data["fusions"] = []
-        summary_sections_data["translocs"] = (
-            store.transloc_handler.get_interesting_sample_translocations(
-                sample_id=str(sample["_id"])
-            )
-        )
+        summary_sections_data["translocs"] = sections["interesting_translocs"]
 
     #################################################
 
@@ -256,25 +276,13 @@ def list_variants(sample_id: str) -> Response | str:
         if sample["cnv"].lower().endswith((".png", ".jpg", ".jpeg")):
             sample["cnvprofile"] = sample["cnv"]
 
-    # Get bams
-    bam_id = store.bam_service_handler.get_bams(sample_ids)
+    # Get bams and Vep Meta data
+    sample_ids, bam_id = sections["bams"]
+    vep_variant_class_meta = sections["vep_variant_class"]
+    vep_conseq_meta = sections["vep_conseq"]
 
-    # Get Vep Meta data
-    vep_variant_class_meta = store.vep_meta_handler.get_variant_class_translations(
-        sample.get("vep", 103)
-    )
-    vep_conseq_meta = store.vep_meta_handler.get_conseq_translations(sample.get("vep", 103))
-
-    # Oncokb information
-    oncokb_genes = []
-    for variant in variants:
-        oncokb_gene = store.oncokb_handler.get_oncokb_action_gene(
-            variant["INFO"]["selected_CSQ"]["SYMBOL"]
-        )
-        if oncokb_gene and "Hugo Symbol" in oncokb_gene:
-            name = oncokb_gene["Hugo Symbol"]
-            if name not in oncokb_genes:
-                oncokb_genes.append(name)
+    # Oncokb information for the rendered rows, resolved in one query
+    oncokb_genes = util.dna.get_oncokb_gene_names(snv_rows)
 
     app.logger.info(f"oncokb_selected_genes : {oncokb_genes} ")
 
@@ -309,9 +317,109 @@ def list_variants(sample_id: str) -> Response | str:
         ai_text=ai_text,
         verification_sample_used=verification_sample_used,
         oncokb_genes=oncokb_genes,
+        snv_rows=snv_rows,
+        snv_total=snv_total,
+        snv_next_cursor=snv_next_cursor,
     )
 
 
+@dna_bp.route("/sample/<string:sample_id>/variants")
+@require_sample_access("sample_id")
+def list_variants_page(sample_id: str) -> Response | tuple:
+    """
+    Returns one page of the filtered SNV list of a sample as JSON.
+
+    The page is filtered with the saved sample filters (as in `list_variants`), sorted and paged
+    server-side, and only its variants are enriched. Rows are rendered with the same template
+    as the variant list, so the table can append them as they arrive.
+
+    Query args:
+        sort: gene, af, depth or tier (default: af).
+        order: asc or desc (default: desc).
+        cursor: The `next_cursor` of the previous page; omit for the first page.
+        limit: Page size, capped by `DNA_VARIANT_PAGE_MAX`.
+
+    Args:
+        sample_id (str): The unique identifier of the sample.
+
+    Returns:
+        Response | tuple: JSON with `rows_html`, `count` and `next_cursor` (null on the last page),
+        plus `total` on the first page; or a JSON error with status 400/404.
+    """
+    result = get_sample_and_assay_config(sample_id)
+    if isinstance(result, Response):
+        return jsonify({"error": f"Sample or assay config not found: {sample_id}"}), 404
+    sample, assay_config, _ = result
+
+    sort = request.args.get("sort", "af")
+    direction = -1 if request.args.get("order", "desc") == "desc" else 1
+    limit = min(
+        request.args.get("limit", app.config.get("DNA_VARIANT_PAGE_SIZE", 200), type=int),
+        app.config.get("DNA_VARIANT_PAGE_MAX", 1000),
+    )
+    if sort not in ("gene", "af", "depth", "tier") or limit < 1:
+        return jsonify({"error": "Invalid sort field or page size"}), 400
+
+    after = None
+    if request.args.get("cursor"):
+        try:
+            after = util.dna.decode_variant_cursor(request.args["cursor"], sort, direction)
+        except ValueError as exc:
+            return jsonify({"error": str(exc)}), 400
+
+    assay_group: str = assay_config.get("asp_group", "unknown")
+    subpanel: str | None = sample.get("subpanel")
+    # Same effective filters as list_variants
+    assay_config = util.dna.add_diagnosis_genelists(assay_config, sample)
+    sample = util.common.merge_sample_settings_with_assay_config(sample, assay_config)
+    sample_filters = sample.get("filters", {})
+
+    assay_panel_doc = store.asp_handler.get_asp(asp_name=sample.get("assay"))
+    checked_genelists_genes_dict = store.isgl_handler.get_isgl_by_ids(
+        sample_filters.get("genelists", [])
+    )
+    _, filter_genes = util.common.get_sample_effective_genes(
+        sample, assay_panel_doc, checked_genelists_genes_dict
+    )
+    disp_pos, _ = util.dna.get_verification_positions(sample["name"], assay_config)
+    settings = util.dna.build_snv_settings(sample, sample_filters, filter_genes, disp_pos)
+
+    variants, has_more = util.dna.get_variant_page(
+        assay_group, subpanel, settings, sort=sort, direction=direction, after=after, limit=limit
+    )
+
+    _, bam_id = util.bpcommon.get_sample_bams(sample)
+    rows_html = render_template(
+        "snv_table_rows.html",
+        variant_rows=variants,
+        sample=sample,
+        assay_group=assay_group,
+        all_samples_bam_paths=util.dna.get_igv_bam_paths(bam_id),
+        vep_var_class_translations=store.vep_meta_handler.get_variant_class_translations(
+            sample.get("vep", 103)
+        ),
+        vep_conseq_translations=store.vep_meta_handler.get_conseq_translations(
+            sample.get("vep", 103)
+        ),
+        oncokb_genes=util.dna.get_oncokb_gene_names(variants),
+    )
+
+    page = {
+        "sort": sort,
+        "order": "desc" if direction < 0 else "asc",
+        "count": len(variants),
+        "next_cursor": (
+            util.dna.encode_variant_cursor(variants[-1], sort, direction) if has_more else None
+        ),
+        "rows_html": rows_html,
+    }
+    if after is None:
+        page["total"] = store.variant_handler.count_case_variants(
+            build_query(assay_group, settings)
+        )
+    return jsonify(page)
+
+
 @dna_bp.route("/<sample_id>/multi_class", methods=["POST"])
 @require_sample_access("sample_id")
 @require("manage_snvs", min_role="user", min_level=9)
@@ -339,63 +447,10 @@ def classify_multi_variant(sample_id: str) -> Response:
     false_positive = request.form.get("false_positive")
 
     if tier and action == "apply":
-        bulk_docs = []
-        for variant_id in variants_to_modify:
-            var = store.variant_handler.get_variant(str(variant_id))
-            if not var:
-                continue
-
-            selected_csq = var.get("INFO", {}).get("selected_CSQ", {})
-            transcript = selected_csq.get("Feature")
-            gene = selected_csq.get("SYMBOL")
-            hgvs_p = selected_csq.get("HGVSp")
-            hgvs_c = selected_csq.get("HGVSc")
-            hgvs_g = f"{var['CHROM']}:{var['POS']}:{var['REF']}/{var['ALT']}"
-            consequence = selected_csq.get("Consequence")
-            gene_oncokb = store.oncokb_handler.get_oncokb_gene(gene)
-
-            text = util.bpcommon.create_annotation_text_from_gene(
-                gene, consequence, assay_group, gene_oncokb=gene_oncokb
-            )
-
-            nomenclature = "p"
-            if hgvs_p != "" and hgvs_p is not None:
-                variant = hgvs_p
-            elif hgvs_c != "" and hgvs_c is not None:
-                variant = hgvs_c
-                nomenclature = "c"
-            else:
-                variant = hgvs_g
-                nomenclature = "g"
-
-            variant_data = {
-                "gene": gene,
-                "assay_group": assay_group,
-                "subpanel": subpanel,
-                "transcript": transcript,
-            }
-
-            class_doc = util.common.create_classified_variant_doc(
-                variant=variant,
-                nomenclature=nomenclature,
-                class_num=3,
-                variant_data=variant_data,
-            )
-
-            bulk_docs.append(deepcopy(class_doc))
-
-            # Add the annotation text to the database
-            text_doc = util.common.create_classified_variant_doc(
-                variant=variant,
-                nomenclature=nomenclature,
-                class_num=3,
-                variant_data=variant_data,
-                text=text,
-            )
-            bulk_docs.append(deepcopy(text_doc))
-
-        if bulk_docs:
-            store.annotation_handler.insert_annotation_bulk(bulk_docs)
+        results = util.bpcommon.classify_variants_bulk(
+            variants_to_modify, class_num=3, assay_group=assay_group, subpanel=subpanel
+        )
+        util.bpcommon.flash_classification_results(results)
 
     if false_positive:
         if action == "apply":
@@ -430,28 +485,20 @@ def show_any_plot(sample_id: str, fn: str, angle: int = 90) -> Response | str:
         return result
     sample, assay_config, assay_config_schema = result
     base_dir = assay_config.get("reporting", {}).get("plots_path", None)
+    file_path = safe_join(base_dir, fn) if base_dir else None
 
-    if base_dir:
-        file_path = os.path.join(base_dir, fn)
-        if not os.path.exists(file_path):
-            flash(f"File not found: {file_path}", "red")
-            return request.url
+    if not file_path or not os.path.isfile(file_path):
+        flash(f"File not found: {file_path or fn}", "red")
+        return request.url
 
-    if request.endpoint == "dna_bp.show_any_plot_rotated":
-        # Rotate the image by the specified angle (default is 90 degrees)
-        try:
-            with Image.open(os.path.join(base_dir, fn)) as img:
-                rotated_img = img.rotate(-angle, expand=True)
-                img_io = io.BytesIO()
-                rotated_img.save(img_io, format="PNG")
-                img_io.seek(0)
-                return send_file(img_io, mimetype="image/png")
-        except Exception as e:
-            app.logger.error(f"Error rotating image: {e}")
-            flash("Error processing image", "red")
-            return request.url
-
-    return send_from_directory(base_dir, fn)
+    # Served with an ETag (304 on revalidation); rotated renditions are cached on disk
+    angle = angle if request.endpoint == "dna_bp.show_any_plot_rotated" else 0
+    try:
+        return plot_assets.send_plot(file_path, angle=angle)
+    except Exception as e:
+        app.logger.error(f"Error serving plot {file_path}: {e}")
+        flash("Error processing image", "red")
+        return request.url
 
 
 ## Individual variant view ##
@@ -489,69 +536,24 @@ def show_variant(sample_id: str, var_id: str) -> Response | str:
 
     # Get assay groups mappings with the sample assay
     assay_group_mappings = store.asp_handler.get_asp_group_mappings()
-    # Get sample data if the variant is present in other samples
-    in_other = store.variant_handler.get_variant_in_other_samples(variant)
+    # Recurrence of the variant in other samples, one page of the most recent samples
+    occ_page = max(request.args.get("occ_page", 0, type=int), 0)
+    occurrences = store.variant_handler.get_variant_occurrences(
+        variant, sample, page=occ_page, limit=app.config.get("VARIANT_OCCURRENCE_PAGE_SIZE", 20)
+    )
 
     # Check if variant has hidden comments
     has_hidden_comments = store.variant_handler.hidden_var_comments(var_id)
 
-    # TODO: We have to find a way to present this data
-    expression = store.expression_handler.get_expression_data(list(variant.get("transcripts")))
-
     variant = store.blacklist_handler.add_blacklist_data([variant], assay_group)[0]
 
-    # Find civic data
-    variant_desc = "NOTHING_IN_HERE"
-    if (
-        variant["INFO"]["selected_CSQ"]["SYMBOL"] == "CALR"
-        and variant["INFO"]["selected_CSQ"]["EXON"] == "9/9"
-        and "frameshift_variant" in variant["INFO"]["selected_CSQ"]["Consequence"]
-    ):
-        variant_desc = "EXON 9 FRAMESHIFT"
-    if (
-        variant["INFO"]["selected_CSQ"]["SYMBOL"] == "FLT3"
-        and "SVLEN" in variant["INFO"]
-        and variant["INFO"]["SVLEN"] > 10
-    ):
-        variant_desc = "ITD"
-
-    civic = store.civic_handler.get_civic_data(variant, variant_desc)
-
-    civic_gene = store.civic_handler.get_civic_gene_info(variant["INFO"]["selected_CSQ"]["SYMBOL"])
-
-    # Find OncoKB data
-    oncokb_hgvsp = []
-    if len(variant["INFO"]["selected_CSQ"]["HGVSp"]) > 0:
-        hgvsp = filters.one_letter_p(variant["INFO"]["selected_CSQ"]["HGVSp"])
-        hgvsp = hgvsp.replace("p.", "")
-        oncokb_hgvsp.append(hgvsp)
-
-    if variant["INFO"]["selected_CSQ"]["Consequence"] in [
-        "frameshift_variant",
-        "stop_gained",
-        "frameshift_deletion",
-        "frameshift_insertion",
-    ]:
-        oncokb_hgvsp.append("Truncating Mutations")
-
-    oncokb = store.oncokb_handler.get_oncokb_anno(variant, oncokb_hgvsp)
-    oncokb_action = store.oncokb_handler.get_oncokb_action(variant, oncokb_hgvsp)
-    oncokb_gene = store.oncokb_handler.get_oncokb_gene(variant["INFO"]["selected_CSQ"]["SYMBOL"])
-
-    # Find BRCA-exchange data
-    brca_exchange = store.brca_handler.get_brca_data(variant, assay_group)
-
-    # Find IARC TP53 data
-    iarc_tp53 = store.iarc_tp53_handler.find_iarc_tp53(variant)
+    # CIViC, OncoKB, BRCA Exchange, IARC TP53 and expression data, cached per variant
+    # TODO: We have to find a way to present the expression data
+    kb = util.dna.get_knowledge_bundle(variant, assay_group, sample.get("vep", 103))
 
     # Get bams
     # TODO: This should be set in the sample doc and get it by the sample ids in the sample
-    sample_ids = util.common.get_case_and_control_sample_ids(sample)
-    if not sample_ids:
-        # If no case and control samples found, get sample ids from the variant
-        # This is a fallback for older samples that do not have case/control samples set
-        sample_ids = store.variant_handler.get_sample_ids(str(sample["_id"]))
-    bam_id = store.bam_service_handler.get_bams(sample_ids)
+    sample_ids, bam_id = util.bpcommon.get_sample_bams(sample)
 
     # Format PON (panel of normals) data
     pon = util.dna.format_pon(variant)
@@ -578,19 +580,20 @@ def show_variant(sample_id: str, var_id: str) -> Response | str:
     return render_template(
         "show_variant_vep.html",
         variant=variant,
-        in_other=in_other,
+        in_other=occurrences["samples"],
+        occurrences=occurrences,
         annotations=annotations,
         hidden_comments=has_hidden_comments,
         latest_classification=latest_classification,
-        expression=expression,
-        civic=civic,
-        civic_gene=civic_gene,
-        oncokb=oncokb,
-        oncokb_action=oncokb_action,
-        oncokb_gene=oncokb_gene,
+        expression=kb["expression"],
+        civic=kb["civic"],
+        civic_gene=kb["civic_gene"],
+        oncokb=kb["oncokb"],
+        oncokb_action=kb["oncokb_action"],
+        oncokb_gene=kb["oncokb_gene"],
         sample=sample,
-        brca_exchange=brca_exchange,
-        iarc_tp53=iarc_tp53,
+        brca_exchange=kb["brca_exchange"],
+        iarc_tp53=kb["iarc_tp53"],
         assay_group=assay_group,
         pon=pon,
         other_classifications=other_classifications,
@@ -927,12 +930,7 @@ def show_cnv(sample_id: str, cnv_id: str) -> Response | str:
     # Get assay group and subpanel for the sample, sections to display
     assay_group: str = assay_config.get("asp_group", "unknown")  # myeloid, solid, lymphoid
 
-    sample_ids = util.common.get_case_and_control_sample_ids(sample)
-    if not sample_ids:
-        # If no case and control samples found, get sample ids from the variant
-        # This is a fallback for older samples that do not have case/control samples set
-        sample_ids = store.variant_handler.get_sample_ids(str(sample["_id"]))
-    bam_id = store.bam_service_handler.get_bams(sample_ids)
+    sample_ids, bam_id = util.bpcommon.get_sample_bams(sample)
     hidden_cnv_comments = store.cnv_handler.hidden_cnv_comments(cnv_id)
 
     annotations = store.cnv_handler.get_cnv_annotations(cnv)
@@ -1125,12 +1123,7 @@ def show_transloc(sample_id: str, transloc_id: str) -> Response | str:
     # Get assay group and subpanel for the sample, sections to display
     assay_group: str = assay_config.get("asp_group", "unknown")  # myeloid, solid, lymphoid
 
-    sample_ids = util.common.get_case_and_control_sample_ids(sample)
-    if not sample_ids:
-        # If no case and control samples found, get sample ids from the variant
-        # This is a fallback for older samples that do not have case/control samples set
-        sample_ids = store.variant_handler.get_sample_ids(str(sample["_id"]))
-    bam_id = store.bam_service_handler.get_bams(sample_ids)
+    sample_ids, bam_id = util.bpcommon.get_sample_bams(sample)
     hidden_transloc_comments = store.transloc_handler.hidden_transloc_comments(transloc_id)
 
     vep_conseq_meta = store.vep_meta_handler.get_conseq_translations(sample.get("vep", 103))
@@ -1324,6 +1317,8 @@ def generate_dna_report(sample_id: str, **kwargs) -> Response | str:
     This endpoint builds the complete DNA report content using the shared
     report payload builder and returns the rendered HTML for preview purposes
     only. No files are written to disk and no database state is modified.
+    Repeated previews are served from Redis until the sample, its variants, the
+    annotations or the configuration change (`DNAUtility.get_dna_report_preview`).
 
     The same underlying report-building logic is reused by the report save
     endpoint, ensuring that the preview accurately reflects the final
@@ -1375,10 +1370,7 @@ def generate_dna_report(sample_id: str, **kwargs) -> Response | str:
 
     save = kwargs.get("save", 0)
     try:
-        html, _ = util.dna.build_dna_report_payload(
-            sample, assay_config, save=save, include_snapshot=False
-        )
-        return html
+        return util.dna.get_dna_report_preview(sample, assay_config, save=save)
     except Exception as exc:
         app.logger.exception(f"Failed to generate preview report: {exc}")
         flash("Failed to generate report preview.", "red")
@@ -1390,131 +1382,215 @@ def generate_dna_report(sample_id: str, **kwargs) -> Response | str:
 @require("create_report", min_role="admin")
 def save_dna_report(sample_id: str) -> Response:
     """
-    Generate and persist a DNA report for the specified sample.
+    Queue the generation of a DNA report for the specified sample.
 
-    This endpoint builds the DNA report using the shared report payload builder,
-    writes the rendered HTML to disk, registers the report in the sample document,
+    The report is rendered and persisted by the background report queue
+    (`coyote.util.report_queue`), so this endpoint returns immediately. The job key
+    is derived from the sample and the next report number, so saving the same
+    report again while it is queued or rendering does not start a second render.
+
+    Args:
+        sample_id (str):
+            Identifier (name or ObjectId) of the sample for which the DNA report
+            should be generated and saved.
+
+    Returns:
+        Response:
+            A redirect response to the samples home screen with a user-facing
+            message, or a `202` JSON job status when JSON is requested.
+
+    Notes:
+        - The job is processed by `_run_dna_report_job`, which writes the report
+          file, registers it on the sample and persists the reported variants.
+        - The job status is served by `dna_report_job_status`.
+        - With `REPORT_JOBS_ENABLED` off the report is rendered within this request.
+    """
+    result = get_sample_and_assay_config(sample_id)
+    if isinstance(result, Response):
+        return result
+    sample, assay_config, assay_config_schema = result
+
+    report_num: int = sample.get("report_num", 0) + 1
+    job_key = f"dna_report:{sample['_id']}:{report_num}"
+    job, created = report_queue.submit(
+        "dna_report", job_key, sample, params={"report_num": report_num}
+    )
+
+    if request.accept_mimetypes.best == "application/json":
+        return jsonify(_report_job_status(job)), 202
+
+    if job.get("status") == "done":
+        flash(f"Report {job['result'].get('report_id')}.html has been successfully saved.", "green")
+    elif job.get("status") == "failed":
+        flash(job.get("error") or "Failed to save the report.", "red")
+    elif created:
+        flash(
+            f"Report {report_num} for {sample.get('name')} is being generated, "
+            "it will be listed with the sample reports when finished.",
+            "green",
+        )
+    else:
+        flash(f"Report {report_num} for {sample.get('name')} is already being generated.", "yellow")
+
+    return redirect(url_for("home_bp.samples_home", reload=True))
+
+
+@dna_bp.route("/sample/<string:sample_id>/report/jobs/<path:job_id>")
+@require_sample_access("sample_id")
+@require("create_report", min_role="admin")
+def dna_report_job_status(sample_id: str, job_id: str) -> Response:
+    """
+    Return the status of a DNA report job as JSON, for polling clients.
+
+    Args:
+        sample_id (str): Identifier (name or ObjectId) of the sample.
+        job_id (str): The report job key returned by `save_dna_report`.
+
+    Returns:
+        Response: The job status, or a `404` if the job does not belong to the sample.
+    """
+    sample = store.sample_handler.get_sample(sample_id)
+    job = store.report_jobs_handler.get_job(job_id)
+    if not sample or not job or job.get("sample_id") != str(sample.get("_id")):
+        return jsonify({"error": f"Report job not found: {job_id}"}), 404
+
+    if job.get("status") == store.report_jobs_handler.QUEUED:
+        report_queue.wake()
+    return jsonify(_report_job_status(job))
+
+
+def _report_job_status(job: dict) -> dict:
+    """
+    Return the client facing fields of a report job.
+    """
+    return {
+        "job_id": job["_id"],
+        "status": job.get("status"),
+        "sample": job.get("sample_name"),
+        "report_id": (job.get("result") or {}).get("report_id"),
+        "error": job.get("error"),
+        "time_created": job.get("time_created"),
+        "time_finished": job.get("time_finished"),
+        "status_url": url_for(
+            "dna_bp.dna_report_job_status", sample_id=job.get("sample_name"), job_id=job["_id"]
+        ),
+    }
+
+
+def _run_dna_report_job(job: dict) -> dict:
+    """
+    Render and persist a queued DNA report.
+
+    Writes the rendered HTML to disk, registers the report in the sample document,
     and persists an immutable snapshot of the reported variants and their tiers.
 
     Reported variant snapshots are stored **only after** the report file has been
     successfully written and the report entry has been created in the sample
     record, ensuring audit safety and historical correctness.
 
+    The report id and file are recorded as the job checkpoint before the file is written.
+    A job claimed again after its worker died resumes with them: an existing file and
+    report entry of the checkpoint are kept, and the snapshot upsert is repeated.
+
     Args:
-        sample_id (str):
-            Identifier (name or ObjectId) of the sample for which the DNA report
-            should be generated and saved.
+        job (dict): The claimed report job; runs as the submitting user.
 
     Returns:
-        Response:
-            A redirect response to the samples home screen with user-facing
-            success or error messages.
+        dict: The saved `report_id` and `report_file`.
 
     Raises:
         AppError:
+            - If the sample or its assay config no longer exists.
             - If a report with the same name already exists.
             - If the report file cannot be written to disk.
-            - If saving the report metadata fails.
-
-    Notes:
-        - This endpoint performs persistence:
-          - Writes the report HTML file to disk.
-          - Appends a report entry to `samples.reports`.
-          - Persists reported variant tier snapshots to `reported_variants`.
-        - The same report-building logic is reused by the preview endpoint,
-          guaranteeing that the previewed report exactly matches the saved report.
-        - Reported variant snapshots are immutable and are not affected by
-          subsequent global re-tiering or annotation changes.
-        - Previewing a report does not create any persistent state.
-
-    Side Effects:
-        - Creates directories on disk if they do not already exist.
-        - Writes report files to the filesystem.
-        - Inserts documents into the `reported_variants` collection.
-        - Logs informational and error messages.
-        - Displays user-facing flash messages on success or failure.
     """
-    result = get_sample_and_assay_config(sample_id)
+    result = get_sample_and_assay_config(job["sample_id"])
     if isinstance(result, Response):
-        return result
+        raise AppError(status_code=404, message=f"Sample {job.get('sample_name')} not found.")
     sample, assay_config, assay_config_schema = result
 
-    name = sample.get("name", "unknown_sample")
     case_id = sample.get("case_id")
     control_id = sample.get("control_id")
     clarity_case_id = sample.get("case", {}).get("clarity_id")
     clarity_control_id = sample.get("control", {}).get("clarity_id")
 
     assay_group: str = assay_config.get("asp_group", "unknown")
-    report_num: int = sample.get("report_num", 0) + 1
-    report_timestamp: str = util.dna.get_report_timestamp()
-
-    # Report Name format for paired samples: "{CASE_ID}_{CLARITY_CASE_ID}-{CONTROL_ID}_{CLARITY_CONTROL_ID}.{REPORT_NUM}.html
-    # Report Name format for unpaired samples: "{CASE_ID}_{CLARITY_CASE_ID}.{REPORT_NUM}.html
-    # Clarity ID is always unique
+    report_num: int = job["params"]["report_num"]
+    checkpoint: dict = job.get("checkpoint") or {}
 
-    if control_id:
-        report_id: str = (
-            f"{case_id}_{clarity_case_id}-{control_id}_{clarity_control_id}.{report_timestamp}"
-        )
+    if checkpoint:
+        report_id: str = checkpoint["report_id"]
+        report_file: str = checkpoint["report_file"]
+        app.logger.info(f"Resuming report job {job['_id']} with report {report_id}")
     else:
-        report_id: str = f"{case_id}_{clarity_case_id}.{report_timestamp}"
+        report_timestamp: str = util.dna.get_report_timestamp()
 
-    report_path: str = os.path.join(
-        app.config.get("REPORTS_BASE_PATH", "reports"),
-        assay_config.get("reporting", {}).get("report_path", assay_group),
-    )
-    os.makedirs(report_path, exist_ok=True)
-    report_file: str = os.path.join(report_path, f"{report_id}.html")
+        # Report Name format for paired samples: "{CASE_ID}_{CLARITY_CASE_ID}-{CONTROL_ID}_{CLARITY_CONTROL_ID}.{REPORT_NUM}.html
+        # Report Name format for unpaired samples: "{CASE_ID}_{CLARITY_CASE_ID}.{REPORT_NUM}.html
+        # Clarity ID is always unique
 
-    if os.path.exists(report_file):
-        flash("Report already exists.", "red")
-        app.logger.warning(f"Report file already exists: {report_file}")
-        raise AppError(
-            status_code=409,
-            message="Report already exists with the requested name.",
-            details=f"File name: {os.path.basename(report_file)}",
-        )
+        if control_id:
+            report_id: str = (
+                f"{case_id}_{clarity_case_id}-{control_id}_{clarity_control_id}.{report_timestamp}"
+            )
+        else:
+            report_id: str = f"{case_id}_{clarity_case_id}.{report_timestamp}"
 
-    try:
-        html, snapshot_rows = util.dna.build_dna_report_payload(
-            sample,
-            assay_config,
-            save=1,
-            include_snapshot=True,
+        report_path: str = os.path.join(
+            app.config.get("REPORTS_BASE_PATH", "reports"),
+            assay_config.get("reporting", {}).get("report_path", assay_group),
         )
+        os.makedirs(report_path, exist_ok=True)
+        report_file: str = os.path.join(report_path, f"{report_id}.html")
 
-        # Write file
-        if not util.common.write_report(html, report_file):
+        if os.path.exists(report_file):
+            app.logger.warning(f"Report file already exists: {report_file}")
             raise AppError(
-                status_code=500,
-                message=f"Failed to save report {report_id}.html",
-                details="Could not write the report to the file system.",
+                status_code=409,
+                message="Report already exists with the requested name.",
+                details=f"File name: {os.path.basename(report_file)}",
             )
-        # Save report entry (must return report_oid)
+        store.report_jobs_handler.save_checkpoint(
+            job["_id"], job["worker"], {"report_id": report_id, "report_file": report_file}
+        )
+
+    html, snapshot_rows = util.dna.build_dna_report_payload(
+        sample,
+        assay_config,
+        save=1,
+        include_snapshot=True,
+    )
+
+    # Write file, unless an earlier attempt of this job already did
+    if not os.path.exists(report_file) and not util.common.write_report(html, report_file):
+        raise AppError(
+            status_code=500,
+            message=f"Failed to save report {report_id}.html",
+            details="Could not write the report to the file system.",
+        )
+    # Save report entry (must return report_oid), unless an earlier attempt already did
+    saved_report = store.sample_handler.get_report(sample.get("name"), report_id)
+    if saved_report:
+        report_oid = saved_report["_id"]
+    else:
         report_oid = store.sample_handler.save_report(
-            sample_id=sample_id,
+            sample_id=sample.get("name"),
             report_num=report_num,
             report_id=report_id,
             filepath=report_file,
         )
-        # Only now persist reported variants snapshot
-        store.reported_variants_handler.bulk_upsert_from_snapshot_rows(
-            sample_name=sample.get("name"),
-            sample_oid=sample.get("_id"),
-            report_oid=report_oid,
-            report_id=report_id,
-            snapshot_rows=snapshot_rows or [],
-            created_by=current_user.username,
-        )
+    # Only now persist reported variants snapshot
+    store.reported_variants_handler.bulk_upsert_from_snapshot_rows(
+        sample_name=sample.get("name"),
+        sample_oid=sample.get("_id"),
+        report_oid=report_oid,
+        report_id=report_id,
+        snapshot_rows=snapshot_rows or [],
+        created_by=job.get("created_by") or current_user.username,
+    )
 
-        flash(f"Report {report_id}.html has been successfully saved.", "green")
-        app.logger.info(f"Report saved: {report_file}")
-    except AppError as app_err:
-        flash(app_err.message, "red")
-        app.logger.error(f"AppError: {app_err.message} | Details: {app_err.details}")
-    except Exception as exc:
-        flash("An unexpected error occurred while saving the report.", "red")
-        app.logger.exception(f"Unexpected error: {exc}")
+    app.logger.info(f"Report saved: {report_file}")
+    return {"report_id": report_id, "report_file": report_file}
 
-    return redirect(url_for("home_bp.samples_home", reload=True))
+
+report_queue.register_runner("dna_report", _run_dna_report_job)
@@ -87,8 +87,17 @@ def samples_home(
     if request.method == "POST" and form.validate_on_submit():
         search_str = form.sample_search.data
         search_mode = search_slider_values[int(form.search_mode_slider.data)]
+    # The "Older samples" links of a search carry it in the query string
+    elif request.args.get("search_mode") in search_slider_values.values():
+        search_str = request.args.get("search", "")
+        search_mode = request.args["search_mode"]
+
+    search_args = {"search": search_str, "search_mode": search_mode} if search_mode else {}
 
     limit_done_samples = app.config.get("REPORTED_SAMPLES_SEARCH_LIMIT", 50)
+    page_size = app.config.get("SAMPLES_HOME_PAGE_SIZE", 500)
+    live_after = request.args.get("live_after")
+    done_after = request.args.get("done_after")
 
     # Determine the search mode and status
     if not search_mode:
@@ -122,6 +131,7 @@ def samples_home(
             limit=limit_done_samples,
             use_cache=True,
             reload=reload,
+            after=done_after,
         )
         app.home_logger.info(
             f"Searching samples with search string '{search_str}', status '{status}', "
@@ -137,8 +147,10 @@ def samples_home(
             search_str=search_str,
             report=True,
             time_limit=time_limit,
+            limit=page_size,
             use_cache=True,
             reload=reload,
+            after=done_after,
         )
         app.home_logger.info(
             f"Searching samples with search string '{search_str}', status '{status}', "
@@ -156,8 +168,10 @@ def samples_home(
             user_envs=user_envs,
             search_str=search_str,
             report=False,
+            limit=page_size,
             use_cache=True,
             reload=reload,
+            after=live_after,
         )
         app.home_logger.info(
             f"Searching samples with search string '{search_str}', status '{status}', "
@@ -174,6 +188,19 @@ def samples_home(
             else 0
         )
 
+    # Keyset cursors for the next page of a full list
+    done_limit = limit_done_samples if status == "done" else page_size
+    next_done_after = (
+        store.sample_handler.list_cursor(done_samples[-1])
+        if done_samples and len(done_samples) >= done_limit
+        else None
+    )
+    next_live_after = (
+        store.sample_handler.list_cursor(live_samples[-1])
+        if live_samples and len(live_samples) >= page_size
+        else None
+    )
+
     # Render the samples home page with the filtered samples and form data
     return render_template(
         "samples_home.html",
@@ -185,6 +212,10 @@ def samples_home(
         panel_tech=panel_tech,
         status=status,
         search_mode=search_mode,
+        search_str=search_str,
+        search_args=search_args,
+        next_live_after=next_live_after,
+        next_done_after=next_done_after,
     )
 
 
@@ -115,16 +115,36 @@ def load_user(user_id: str) -> User | None:
     """
     Load a user for Flask-Login session management.
 
+    The merged user model (user, role and accessible ASPs) is served from
+    `store.identity_cache` and only rebuilt from MongoDB when the identity change
+    stamp has been bumped by a user, role or ASP update.
+
     Args:
         user_id (str): The unique identifier of the user.
 
     Returns:
         User | None: The authenticated User object if found, otherwise None.
     """
+    user_model = store.identity_cache.get_user_model(user_id, _build_user_model)
+    if user_model is None:
+        return None
+    return User(user_model)
+
+
+def _build_user_model(user_id: str) -> UserModel | None:
+    """
+    Build the merged user model for a user from the users, roles and ASP collections.
+
+    Args:
+        user_id (str): The unique identifier of the user.
+
+    Returns:
+        UserModel | None: The merged user model, or None if the user does not exist.
+    """
     user_doc = store.user_handler.user_with_id(user_id)
     if not user_doc:
         return None
 
     role_doc = store.roles_handler.get_role(user_doc.get("role")) or {}
-    user_model = UserModel.from_mongo(user_doc, role_doc)
-    return User(user_model)
+    asp_docs = store.asp_handler.get_all_asps(is_active=True)
+    return UserModel.from_mongo(user_doc, role_doc, asp_docs)
@@ -21,17 +21,21 @@ from flask import (
     render_template,
     request,
     url_for,
+    send_file,
     Response,
 )
-from flask_login import current_user, login_required
+from flask_login import login_required
 
 from coyote.blueprints.rna.forms import FusionFilter
 
 from coyote.extensions import store, util
 from coyote.blueprints.rna import rna_bp
 from datetime import datetime
-from flask_weasyprint import HTML, render_pdf
+from coyote.errors.exceptions import AppError
+from coyote.util import pdf_renderer
 from coyote.util.decorators.access import require_sample_access
+import os
+import shutil
 
 
 @rna_bp.route("/sample/<string:id>K=", methods=["GET", "POST"])
@@ -363,30 +367,27 @@ def generate_report_pdf(id):
     # PDF file name
     pdf_file = "static/reports/" + id + "_" + str(report_num) + ".pdf"
 
-    # Generate PDF
-    html = ""
+    # Generate PDF (rendered once per report HTML, then served from the PDF cache)
     html = generate_rna_report(id, pdf=1)
-    HTML(string=html).write_pdf(pdf_file)
+    try:
+        cached_pdf = pdf_renderer.render_pdf_file(html)
+    except Exception as exc:
+        app.logger.exception(f"Failed to render PDF report for {id}: {exc}")
+        raise AppError(
+            status_code=500,
+            message="Failed to generate the PDF report.",
+            details=str(exc),
+        )
+    os.makedirs(os.path.dirname(pdf_file), exist_ok=True)
+    shutil.copyfile(cached_pdf, pdf_file)
 
     # Add to database
-    store.sample_handler.get_sample(id).update(
-        {"name": id},
-        {
-            "$push": {
-                "reports": {
-                    "_id": ObjectId(),
-                    "report_num": report_num,
-                    "filepath": pdf_file,
-                    "author": current_user.get_id(),
-                    "time_created": util.common.utc_now(),
-                }
-            },
-            "$set": {"report_num": report_num},
-        },
-    )
+    store.sample_handler.save_pdf_report(id, report_num, pdf_file)
 
-    # Render it!
-    return render_pdf(HTML(string=html))
+    # Serve the stored file
+    return send_file(
+        cached_pdf, mimetype="application/pdf", download_name=os.path.basename(pdf_file)
+    )
 
 
 @rna_bp.route("/multi_class/<id>", methods=["POST"])
@@ -416,64 +417,22 @@ def classify_multi_variant(id: str) -> Response:
     false_positive = request.form.get("false_positive", None)
 
     if tier and action == "apply":
-        variants_iter = []
-        for variant in variants_to_modify:
-            var_iter = store.variant_handler.get_variant(str(variant))
-            variants_iter.append(var_iter)
-
-        for var in variants_iter:
-            selectec_csq = var["INFO"]["selected_CSQ"]
-            transcript = selectec_csq.get("Feature", None)
-            gene = selectec_csq.get("SYMBOL", None)
-            hgvs_p = selectec_csq.get("HGVSp", None)
-            hgvs_c = selectec_csq.get("HGVSc", None)
-            hgvs_g = f"{var['CHROM']}:{var['POS']}:{var['REF']}/{var['ALT']}"
-            consequence = selectec_csq.get("Consequence", None)
-            gene_oncokb = store.oncokb_handler.get_oncokb_gene(gene)
-            text = util.bpcommon.create_annotation_text_from_gene(
-                gene, consequence, assay, gene_oncokb=gene_oncokb
-            )
-
-            nomenclature = "p"
-            if hgvs_p != "" and hgvs_p is not None:
-                variant = hgvs_p
-            elif hgvs_c != "" and hgvs_c is not None:
-                variant = hgvs_c
-                nomenclature = "c"
-            else:
-                variant = hgvs_g
-                nomenclature = "g"
-
-            variant_data = {
-                "gene": gene,
-                "assay": assay,
-                "subpanel": subpanel,
-                "transcript": transcript,
-            }
-
-            # Add the variant to the database with class
-            store.annotation_handler.insert_classified_variant(
-                variant, nomenclature, tier, variant_data
-            )
-
-            # Add the annotation text to the database
-            store.annotation_handler.insert_classified_variant(
-                variant, nomenclature, tier, variant_data, text=text
-            )
-            if irrelevant:
-                store.variant_handler.mark_irrelevant_var(var["_id"])
+        results = util.bpcommon.classify_variants_bulk(
+            variants_to_modify,
+            class_num=tier,
+            assay_group=assay,
+            subpanel=subpanel,
+            flags={"irrelevant": True} if irrelevant else None,
+        )
+        util.bpcommon.flash_classification_results(results)
     elif false_positive:
         if action == "apply":
-            for variant in variants_to_modify:
-                store.variant_handler.mark_false_positive_var(variant)
+            store.variant_handler.mark_false_positive_var_bulk(variants_to_modify)
         elif action == "remove":
-            for variant in variants_to_modify:
-                store.variant_handler.unmark_false_positive_var(variant)
+            store.variant_handler.unmark_false_positive_var_bulk(variants_to_modify)
     elif irrelevant:
         if action == "apply":
-            for variant in variants_to_modify:
-                store.variant_handler.mark_irrelevant_var(variant)
+            store.variant_handler.mark_irrelevant_var_bulk(variants_to_modify)
         elif action == "remove":
-            for variant in variants_to_modify:
-                store.variant_handler.unmark_irrelevant_var(variant)
+            store.variant_handler.unmark_irrelevant_var_bulk(variants_to_modify)
     return redirect(url_for("rna_bp.list_fusions", id=id))
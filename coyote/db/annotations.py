@@ -18,14 +18,21 @@ AnnotationsHandler module for Coyote3
 This module defines the `AnnotationsHandler` class used for accessing and managing
 annotation data in MongoDB.
 
+Every write bumps the `report_stamp:annotations` change stamp in the shared flask-caching
+backend (Redis): classifications and global comments appear in the reports of other samples,
+so this retires all cached DNA report previews.
+
 It is part of the `coyote.db` package and extends the base handler functionality.
 """
 
 from copy import deepcopy
+import uuid
 
 # -------------------------------------------------------------------------
 # Imports
 # -------------------------------------------------------------------------
+from pymongo import ASCENDING, DESCENDING
+from pymongo.errors import BulkWriteError
 from coyote.db.base import BaseHandler
 from datetime import datetime
 from pymongo.results import DeleteResult
@@ -51,6 +58,8 @@ class AnnotationsHandler(BaseHandler):
     querying annotation-related data in the database.
     """
 
+    STAMP_KEY = "report_stamp:annotations"
+
     def __init__(self, adapter):
         """
         Initialize the handler with a given adapter and bind the collection.
@@ -58,6 +67,55 @@ class AnnotationsHandler(BaseHandler):
         super().__init__(adapter)
         self.set_collection(self.adapter.annotations_collection)
 
+    def get_stamp(self) -> str | None:
+        """
+        Read the annotation change stamp from the shared cache backend.
+
+        Returns:
+            str | None: The stamp (`"0"` if never bumped), or None if it cannot be read.
+        """
+        shared = getattr(self.app, "cache", None)
+        if shared is None:
+            return None
+        try:
+            return shared.get(self.STAMP_KEY) or "0"
+        except Exception as exc:
+            self.app.logger.warning(f"[ANNOTATIONS] Stamp lookup failed: {exc}")
+            return None
+
+    def bump_stamp(self) -> None:
+        """
+        Publish a new annotation change stamp after a classification or comment was written.
+        """
+        shared = getattr(self.app, "cache", None)
+        if shared is None:
+            return
+        try:
+            shared.set(self.STAMP_KEY, uuid.uuid4().hex, timeout=0)
+        except Exception as exc:
+            self.app.logger.warning(f"[ANNOTATIONS] Could not publish new stamp: {exc}")
+
+    def ensure_indexes(self) -> None:
+        """
+        Create indexes for global annotation, classification and comment lookups.
+        """
+        # Global annotation and classification lookups (single and bulk)
+        self.create_index(
+            [
+                ("gene", ASCENDING),
+                ("nomenclature", ASCENDING),
+                ("variant", ASCENDING),
+                ("time_created", DESCENDING),
+            ],
+            name="ix_gene_nomenclature_variant_time",
+        )
+
+        # CNV, translocation and fusion annotations by variant string
+        self.create_index(
+            [("variant", ASCENDING), ("time_created", ASCENDING)],
+            name="ix_variant_time",
+        )
+
     def get_annotation_by_oid(self, oid: str) -> dict | None:
         """
         Retrieve an annotation by its ObjectId.
@@ -112,12 +170,43 @@ class AnnotationsHandler(BaseHandler):
         # Create a deep copy to avoid modifying the original list
         annotations_copy = deepcopy(annotations)
         if self.get_collection().insert_many(annotations_copy):
+            self.bump_stamp()
             flash(f"Inserted {len(annotations_copy)} annotations", "green")
             return True
         else:
             flash("Failed to insert annotations", "red")
             return False
 
+    def insert_classifications_bulk(self, documents: list[dict]) -> list[bool]:
+        """
+        Insert classification and annotation text documents with one unordered `insert_many`.
+
+        Unlike `insert_annotation_bulk`, a failing document does not hide the outcome of the
+        others: the result tells which documents were written.
+
+        Args:
+            documents (list[dict]): Documents built with `create_classified_variant_doc`.
+
+        Returns:
+            list[bool]: Whether each document was inserted, in input order.
+        """
+        if not documents:
+            return []
+
+        inserted = [True] * len(documents)
+        try:
+            self.get_collection().insert_many(deepcopy(documents), ordered=False)
+        except BulkWriteError as exc:
+            for error in exc.details.get("writeErrors", []):
+                inserted[error["index"]] = False
+            self.app.logger.warning(
+                f"[ANNOTATIONS] {inserted.count(False)} of {len(documents)} classification "
+                f"documents not inserted"
+            )
+        if any(inserted):
+            self.bump_stamp()
+        return inserted
+
     def get_global_annotations(self, variant: dict, assay_group: str, subpanel: str) -> tuple:
         """
         Retrieve global annotations for a given variant, assay, and subpanel.
@@ -204,6 +293,25 @@ class AnnotationsHandler(BaseHandler):
                 .sort("time_created", 1)
             )
 
+        return self._summarize_global_annotations(annotations, assay_group, subpanel)
+
+    @staticmethod
+    def _summarize_global_annotations(annotations, assay_group: str, subpanel: str) -> tuple:
+        """
+        Reduce time-ordered annotation documents into the global annotation four-tuple.
+
+        Annotations must be ordered by `time_created` ascending so that the latest
+        classification for the current assay (and subpanel for `solid`) wins.
+
+        Args:
+            annotations (Iterable[dict]): Annotation documents sorted by creation time.
+            assay_group (str): The type of assay being used (e.g., 'solid').
+            subpanel (str): The subpanel identifier used when assay is 'solid'.
+
+        Returns:
+            tuple: `(annotations_arr, latest_classification, latest_other_arr, annotations_interesting)`
+                as documented in `get_global_annotations`.
+        """
         latest_classification = {"class": 999}
         latest_classification_other = {}
         annotations_arr = []
@@ -302,6 +410,172 @@ class AnnotationsHandler(BaseHandler):
 
         return list(self.get_collection().find(query).sort("time_created", -1).limit(1))
 
+    @staticmethod
+    def _global_annotation_keys(variant: dict) -> tuple[str, list[tuple[str, str]]]:
+        """
+        Build the `(nomenclature, variant)` lookup keys used by `get_global_annotations`.
+
+        The keys follow the same HGVSp > HGVSc > genomic priority as the single-variant
+        query, so the bulk resolver matches exactly the same annotation documents.
+
+        Args:
+            variant (dict): A variant document with `CHROM`, `POS`, `REF`, `ALT` and
+                `INFO.selected_CSQ`.
+
+        Returns:
+            tuple[str, list[tuple[str, str]]]: The gene symbol and the list of
+                `(nomenclature, variant)` keys to match for that gene.
+        """
+        genomic_location = (
+            f"{str(variant['CHROM'])}:{str(variant['POS'])}:{variant['REF']}/{variant['ALT']}"
+        )
+        selected_CSQ = variant["INFO"]["selected_CSQ"]
+        hgvsp = unquote(selected_CSQ.get("HGVSp", ""))
+        hgvsc = unquote(selected_CSQ.get("HGVSc", ""))
+
+        if len(hgvsp) > 0:
+            keys = [("p", hgvsp), ("c", hgvsc), ("g", genomic_location)]
+        elif len(hgvsc) > 0:
+            keys = [("c", hgvsc), ("g", genomic_location)]
+        else:
+            keys = [("g", genomic_location)]
+
+        return selected_CSQ["SYMBOL"], keys
+
+    def get_global_annotations_bulk(
+        self, variants: list, assay_group: str, subpanel: str, classified_only: bool = False
+    ) -> list[tuple]:
+        """
+        Retrieve global annotations for a list of variants in a single query.
+
+        This is the bulk counterpart of `get_global_annotations`. All candidate
+        annotations are fetched with one `$in` query on gene and variant, sorted by
+        `time_created`, and then distributed to each variant by its exact
+        `(gene, nomenclature, variant)` keys. The assay/subpanel precedence rules are
+        shared with the single-variant method through `_summarize_global_annotations`.
+
+        Args:
+            variants (list): A list of variant documents.
+            assay_group (str): The type of assay being used (e.g., 'solid').
+            subpanel (str): The subpanel identifier for further filtering when
+                            assay is 'solid'.
+            classified_only (bool): Fetch only classification documents. The classifications
+                of the result are unchanged, the text annotations are left out.
+
+        Returns:
+            list[tuple]: One four-tuple per input variant, in input order, identical
+                to the return value of `get_global_annotations`.
+        """
+        variant_keys = [self._global_annotation_keys(var) for var in variants]
+        genes = {gene for gene, _ in variant_keys}
+        variant_values = {value for _, keys in variant_keys for _, value in keys}
+
+        annotations_by_key = defaultdict(list)
+        if variant_keys:
+            query = {
+                "gene": {"$in": list(genes)},
+                "variant": {"$in": list(variant_values)},
+                "nomenclature": {"$in": ["p", "c", "g"]},
+            }
+            if classified_only:
+                query["class"] = {"$exists": True}
+            cursor = self.get_collection().find(query).sort("time_created", 1)
+            for order, anno in enumerate(cursor):
+                key = (anno.get("gene"), anno.get("nomenclature"), anno.get("variant"))
+                annotations_by_key[key].append((order, anno))
+
+        results = []
+        for gene, keys in variant_keys:
+            matched = []
+            for nomenclature, value in keys:
+                matched.extend(annotations_by_key.get((gene, nomenclature, value), []))
+            # keep the server side time_created order, and give every variant its own copies
+            matched.sort(key=lambda item: item[0])
+            results.append(
+                self._summarize_global_annotations(
+                    (dict(anno) for _, anno in matched), assay_group, subpanel
+                )
+            )
+
+        return results
+
+    def get_additional_classifications_bulk(
+        self, variants: list, assay_group: str, subpanel: str
+    ) -> list[list]:
+        """
+        Retrieve additional classifications for a list of variants in a single query.
+
+        This is the bulk counterpart of `get_additional_classifications`. One query
+        fetches every classification for the assay (and subpanel for `solid`) that
+        matches any of the variants' genes and HGVSp/HGVSc/simple_id values. The
+        candidates are indexed by `(gene, nomenclature, variant)`, each variant looks up
+        its own keys, applies the transcript rule in Python and gets the latest match.
+
+        Args:
+            variants (list): A list of variant documents with 'transcripts', 'HGVSp',
+                            'HGVSc', 'genes' and 'simple_id'; like the single-variant query,
+                            a missing field raises a `KeyError` instead of matching loosely.
+            assay_group (str): The type of assay being used (e.g., 'solid').
+            subpanel (str): The subpanel identifier for further filtering when assay is 'solid'.
+
+        Returns:
+            list[list]: One list per input variant, in input order, containing at most one
+                annotation document (the latest match), like `get_additional_classifications`.
+        """
+        if not variants:
+            return []
+
+        genes = set()
+        variant_values = set()
+        for var in variants:
+            genes.update(var["genes"])
+            variant_values.update(var["HGVSp"])
+            variant_values.update(var["HGVSc"])
+            variant_values.add(var["simple_id"])
+
+        query = {
+            "gene": {"$in": list(genes)},
+            "variant": {"$in": list(variant_values)},
+            "assay": assay_group,
+            "class": {"$exists": True},
+        }
+        if assay_group == "solid":
+            query["subpanel"] = subpanel
+
+        candidates_by_key = defaultdict(list)
+        cursor = self.get_collection().find(query).sort("time_created", -1)
+        for order, anno in enumerate(cursor):
+            if not isinstance(anno.get("transcript"), str):
+                continue
+            key = (anno.get("gene"), anno.get("nomenclature"), anno.get("variant"))
+            candidates_by_key[key].append((order, anno))
+
+        results = []
+        for var in variants:
+            transcripts = var["transcripts"]
+            keys = {(gene, "g", var["simple_id"]) for gene in var["genes"]}
+            keys.update((gene, "p", value) for gene in var["genes"] for value in var["HGVSp"])
+            keys.update((gene, "c", value) for gene in var["genes"] for value in var["HGVSc"])
+            matched = sorted(
+                (item for key in keys for item in candidates_by_key.get(key, [])),
+                key=lambda item: item[0],
+            )
+
+            match = []
+            for _, anno in matched:
+                transcript = anno["transcript"]
+                # mirrors the `^<transcript>(\..*)?$` regex of the single-variant query; with
+                # no transcripts that regex is empty and matches any transcript
+                if transcripts and not any(
+                    transcript == tx or transcript.startswith(f"{tx}.") for tx in transcripts
+                ):
+                    continue
+                match = [dict(anno)]
+                break
+            results.append(match)
+
+        return results
+
     def insert_classified_variant(
         self,
         variant: str,
@@ -357,6 +631,7 @@ class AnnotationsHandler(BaseHandler):
 
         result = self.get_collection().insert_one(document)
         if result:
+            self.bump_stamp()
             flash("Variant classified", "green")
         else:
             flash("Variant classification failed", "red")
@@ -421,6 +696,8 @@ class AnnotationsHandler(BaseHandler):
                     "subpanel": variant_data.get("subpanel", None),
                 }
             )
+            if delete_result.deleted_count:
+                self.bump_stamp()
 
         return delete_result
 
@@ -457,6 +734,7 @@ class AnnotationsHandler(BaseHandler):
             Any: The result of the insert operation
         """
         self.add_comment(comment)
+        self.bump_stamp()
 
     def get_assay_classified_stats(self) -> tuple:
         """
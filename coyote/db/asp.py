@@ -48,6 +48,8 @@ class ASPHandler(BaseHandler):
     and organized access to assay specific panel information.
     """
 
+    REQUEST_CACHE_NAMESPACE = "asp"
+
     def __init__(self, adapter):
         """
         Initialize the handler with a given adapter and bind the collection.
@@ -67,9 +69,13 @@ class ASPHandler(BaseHandler):
 
         Returns:
             dict: A dictionary representing the panel document, or None if no
-            document is found.
+            document is found. Memoized for the request (see `RequestCache`).
         """
-        return self.get_collection().find_one({"_id": asp_name})
+        return self.adapter.request_cache.get_or_load(
+            self.REQUEST_CACHE_NAMESPACE,
+            asp_name,
+            lambda: self.get_collection().find_one({"_id": asp_name}),
+        )
 
     def get_all_asps(self, is_active: bool | None = None) -> list:
         """
@@ -110,7 +116,11 @@ class ASPHandler(BaseHandler):
             Any: The result of the insert operation, typically an instance of
             `pymongo.results.InsertOneResult` that includes the ID of the inserted document.
         """
-        return self.get_collection().insert_one(data)
+        result = self.get_collection().insert_one(data)
+        self.adapter.identity_cache.bump()
+        self.evict_request_cache()
+        self.adapter.dashboard_stats_handler.refresh_panels()
+        return result
 
     def update_asp(self, asp_id, asp_data) -> None:
         """
@@ -121,7 +131,11 @@ class ASPHandler(BaseHandler):
         Returns:
             None
         """
-        return self.get_collection().replace_one({"_id": asp_id}, asp_data)
+        result = self.get_collection().replace_one({"_id": asp_id}, asp_data)
+        self.adapter.identity_cache.bump()
+        self.evict_request_cache()
+        self.adapter.dashboard_stats_handler.refresh_panels()
+        return result
 
     def toggle_asp_active(self, asp_id: str, active_status: bool) -> bool:
         """
@@ -137,7 +151,9 @@ class ASPHandler(BaseHandler):
         Returns:
             bool: True if the update was successful, False otherwise.
         """
-        return self.toggle_active(asp_id, active_status)
+        result = self.toggle_active(asp_id, active_status)
+        self.adapter.identity_cache.bump()
+        return result
 
     def delete_asp(self, asp_id: str) -> None:
         """
@@ -153,6 +169,9 @@ class ASPHandler(BaseHandler):
             None
         """
         self.get_collection().delete_one({"_id": asp_id})
+        self.adapter.identity_cache.bump()
+        self.evict_request_cache()
+        self.adapter.dashboard_stats_handler.refresh_panels()
 
     def get_all_asps_unique_gene_count(self) -> int:
         """
@@ -40,6 +40,8 @@ class ASPConfigHandler(BaseHandler):
     a key component for handling assay-related data efficiently in the database.
     """
 
+    REQUEST_CACHE_NAMESPACE = "aspc"
+
     def __init__(self, adapter):
         """
         Initialize the handler with a given adapter and bind the collection.
@@ -99,16 +101,21 @@ class ASPConfigHandler(BaseHandler):
 
         Returns:
             dict: The filtered assay configuration document if found, otherwise `None`.
+            Memoized for the request (see `RequestCache`).
         """
         aspc_id = f"{assay_id}:{profile.lower()}"
-        return self.get_collection().find_one(
-            {"_id": aspc_id, "is_active": True},
-            {
-                "updated_on": 0,
-                "updated_by": 0,
-                "created_on": 0,
-                "created_by": 0,
-            },
+        return self.adapter.request_cache.get_or_load(
+            self.REQUEST_CACHE_NAMESPACE,
+            ("no_meta", aspc_id),
+            lambda: self.get_collection().find_one(
+                {"_id": aspc_id, "is_active": True},
+                {
+                    "updated_on": 0,
+                    "updated_by": 0,
+                    "created_on": 0,
+                    "created_by": 0,
+                },
+            ),
         )
 
     def update_aspc(self, aspc_id: str, data: dict) -> Any:
@@ -122,9 +129,11 @@ class ASPConfigHandler(BaseHandler):
         Returns:
             Any: The result of the update operation, typically a `pymongo.results.UpdateResult` object.
         """
-        return self.get_collection().update_one(
+        result = self.get_collection().update_one(
             {"_id": aspc_id}, {"$set": data}
         )
+        self.evict_request_cache()
+        return result
 
     def create_aspc(self, data: dict) -> Any:
         """
@@ -136,7 +145,9 @@ class ASPConfigHandler(BaseHandler):
         Returns:
             Any: The result of the insert operation, typically a `pymongo.results.InsertOneResult` object.
         """
-        return self.get_collection().insert_one(data)
+        result = self.get_collection().insert_one(data)
+        self.evict_request_cache()
+        return result
 
     def delete_aspc(self, assay_id: str) -> Any:
         """
@@ -148,7 +159,9 @@ class ASPConfigHandler(BaseHandler):
         Returns:
             Any: The result of the delete operation, typically a `pymongo.results.DeleteResult` object.
         """
-        return self.get_collection().delete_one({"_id": assay_id})
+        result = self.get_collection().delete_one({"_id": assay_id})
+        self.evict_request_cache()
+        return result
 
     def toggle_aspc_active(self, aspc_id: str, active_status: bool) -> bool:
         """
@@ -25,7 +25,11 @@ It is part of the `coyote.db` package and extends the base handler functionality
 # -------------------------------------------------------------------------
 # Imports
 # -------------------------------------------------------------------------
+from copy import deepcopy
+from pymongo import ASCENDING
 from coyote.db.base import BaseHandler
+import threading
+import time
 
 
 # -------------------------------------------------------------------------
@@ -39,19 +43,35 @@ class BamServiceHandler(BaseHandler):
     including retrieving BAM file paths for specific sample IDs.
     """
 
+    # Upper bound of cached sample ids per process
+    CACHE_MAX_ENTRIES = 10000
+
     def __init__(self, adapter):
         """
         Initialize the handler with a given adapter and bind the collection.
         """
         super().__init__(adapter)
         self.set_collection(self.adapter.bam_samples)
+        self._cache: dict[str, tuple[float, list]] = {}
+        self._cache_lock = threading.Lock()
+
+    def ensure_indexes(self) -> None:
+        """
+        Create the sample id index used to resolve BAM paths.
+        """
+        # BAM paths by sample id
+        self.create_index([("id", ASCENDING)], name="ix_id")
 
-    def get_bams(self, sample_ids):
+    def get_bams(self, sample_ids: dict) -> dict:
         """
         Retrieve BAM file paths for a list of sample IDs.
 
-        This method queries the `BAM_Service["samples"]` collection to find
-        BAM file paths associated with the provided sample IDs.
+        This method queries the `BAM_Service["samples"]` collection once, with an `$in` over
+        the provided sample IDs, to find the BAM file paths associated with them. BAM paths
+        do not change once registered, so the paths of every sample ID that has BAMs are kept
+        in process memory for `BAM_PATH_CACHE_TTL` seconds. IDs without BAMs are not cached
+        and are looked up again on the next call, so a BAM registered later (e.g. the control)
+        shows up immediately.
 
         Args:
             sample_ids (dict): A dictionary where keys are sample names and
@@ -61,16 +81,42 @@ class BamServiceHandler(BaseHandler):
             dict: A dictionary where keys are sample IDs and values are lists
                   of BAM file paths associated with those IDs.
         """
+        ids = [sample_ids[sample] for sample in sample_ids]
+        if not ids:
+            return {}
+
+        ttl = self.app.config.get("BAM_PATH_CACHE_TTL", 3600)
+        now = time.monotonic()
+        bams_by_id = {}
+        with self._cache_lock:
+            for sample_id in ids:
+                cached = self._cache.get(str(sample_id))
+                if cached and cached[0] > now:
+                    bams_by_id[str(sample_id)] = deepcopy(cached[1])
+
+        missing = list(dict.fromkeys(str(i) for i in ids if str(i) not in bams_by_id))
+        if missing:
+            found = {}
+            for bam in self.get_collection().find(
+                {"id": {"$in": missing}}, {"_id": 0, "id": 1, "bam_path": 1}
+            ):
+                found.setdefault(bam["id"], []).append(bam["bam_path"])
+            bams_by_id.update(found)
+
+            # Only IDs with BAMs are cached: the others may still be registered later
+            if found and ttl:
+                with self._cache_lock:
+                    for sample_id, paths in found.items():
+                        self._cache[sample_id] = (now + ttl, deepcopy(paths))
+                    if len(self._cache) > self.CACHE_MAX_ENTRIES:
+                        expired = [
+                            key for key, (expires, _) in self._cache.items() if expires <= now
+                        ]
+                        for key in expired or list(self._cache)[: len(self._cache) // 2]:
+                            del self._cache[key]
+
         bam_id = {}
-        for sample in sample_ids:
-            bams = list(
-                self.get_collection().find({"id": str(sample_ids[sample])})
-            )
-            for bam in bams:
-                if sample_ids[sample] == bam["id"]:
-                    if bam["id"] in bam_id:
-                        bam_id[bam["id"]].append(bam["bam_path"])
-                    else:
-                        bam_id[bam["id"]] = [bam["bam_path"]]
-                    # bam_id[bam['id']] = bam['bam_path']
+        for sample_id in ids:
+            if sample_id in bams_by_id and sample_id not in bam_id:
+                bam_id[sample_id] = bams_by_id[sample_id]
         return bam_id
@@ -30,6 +30,7 @@ from flask import current_app as app
 from flask import flash
 from datetime import datetime
 import pymongo
+from pymongo import UpdateMany
 from coyote.util.common_utility import CommonUtility
 
 
@@ -46,6 +47,9 @@ class BaseHandler:
     be extended by other handler classes.
     """
 
+    # Namespace of the documents the handler memoizes in `adapter.request_cache`, if any
+    REQUEST_CACHE_NAMESPACE: str | None = None
+
     def __init__(self, adapter):
         """
         Initialize the handler with a given adapter and bind the collection.
@@ -88,6 +92,48 @@ class BaseHandler:
         else:
             raise NotImplementedError("get_collection or set_collection must be implemented")
 
+    def evict_request_cache(self) -> None:
+        """
+        Drop the documents of this handler from the request cache after a write.
+        """
+        if self.REQUEST_CACHE_NAMESPACE:
+            self.adapter.request_cache.evict(self.REQUEST_CACHE_NAMESPACE)
+
+    def ensure_indexes(self) -> None:
+        """
+        Create the indexes required by the queries this handler issues.
+
+        Called once per handler from `MongoAdapter.ensure_indexes` at startup. The default
+        implementation does nothing; handlers with hot query paths override it.
+        """
+        return None
+
+    def create_index(
+        self,
+        keys: list[tuple[str, int]],
+        name: str,
+        collection: pymongo.collection.Collection | None = None,
+        **kwargs,
+    ) -> None:
+        """
+        Create a single index in the background on the handler collection.
+
+        An index that already exists with another name or other options is left untouched
+        and reported as a warning, so one conflicting index does not block the others.
+
+        Args:
+            keys (list[tuple[str, int]]): Index key specification, e.g. `[("SAMPLE_ID", 1)]`.
+            name (str): The index name.
+            collection (pymongo.collection.Collection | None): Collection to index; defaults
+                to the handler collection.
+            **kwargs: Extra options passed to `create_index` (e.g. `unique=True`).
+        """
+        col = collection if collection is not None else self.get_collection()
+        try:
+            col.create_index(keys, name=name, background=True, **kwargs)
+        except pymongo.errors.OperationFailure as exc:
+            self.app.logger.warning(f"[INDEXES] {col.name}.{name} not created: {exc}")
+
     def hide_comment(self, var_id: str, comment_id: str) -> Any:
         """
         Hide a comment for a variant, translocation, or CNV.
@@ -113,6 +159,7 @@ class BaseHandler:
                 }
             },
         ):
+            self.evict_request_cache()
             flash("Comment hidden", "green")
         else:
             flash("Comment failed to remove", "red")
@@ -139,10 +186,73 @@ class BaseHandler:
                 }
             },
         ):
+            self.evict_request_cache()
             flash("Comment unhidden", "green")
         else:
             flash("Failed to unhide comment", "red")
 
+    def set_flag(self, doc_ids: list, field: str, value: Any) -> dict[str, int]:
+        """
+        Set a flag field (e.g. `fp`, `interesting`) on a batch of documents.
+
+        Documents that already have the value are skipped by a `$ne` filter, so re-marking
+        costs no writes. Ids are sent as one `UpdateMany` per chunk of
+        `FLAG_UPDATE_CHUNK_SIZE` ids, all in one unordered `bulk_write`.
+
+        Args:
+            doc_ids (list): Document ids, as ObjectIds or strings.
+            field (str): The flag field to set.
+            value (Any): The value to set.
+
+        Returns:
+            dict[str, int]: `requested` ids, `matched` documents that needed the change and
+            `modified` documents.
+        """
+        object_ids = list(
+            dict.fromkeys(
+                doc_id if isinstance(doc_id, ObjectId) else ObjectId(doc_id) for doc_id in doc_ids
+            )
+        )
+        counts = {"requested": len(object_ids), "matched": 0, "modified": 0}
+        if not object_ids:
+            return counts
+
+        chunk_size = self.app.config.get("FLAG_UPDATE_CHUNK_SIZE", 5000)
+        result = self.get_collection().bulk_write(
+            [
+                UpdateMany(
+                    {"_id": {"$in": object_ids[start : start + chunk_size]}, field: {"$ne": value}},
+                    {"$set": {field: value}},
+                )
+                for start in range(0, len(object_ids), chunk_size)
+            ],
+            ordered=False,
+        )
+        self.evict_request_cache()
+        counts["matched"] = result.matched_count
+        counts["modified"] = result.modified_count
+        return counts
+
+    def _set_flag_bulk(self, var_ids: list[str], field: str, value: bool, label: str) -> Any:
+        """
+        Set a flag on several variants and flash the outcome, see `set_flag`.
+        """
+        if not var_ids:
+            flash(f"No variants provided for {label.lower()} update.", "yellow")
+            return None
+
+        try:
+            counts = self.set_flag(var_ids, field, value)
+        except Exception as e:
+            flash(f"Bulk update failed: {str(e)}", "red")
+            return None
+
+        flash(
+            f"{counts['modified']} variant(s) {'marked' if value else 'unmarked'} as {label}",
+            "green",
+        )
+        return counts
+
     def mark_false_positive(self, var_id: str, fp: bool) -> Any:
         """
         Mark / Unmark a variant as false positive.
@@ -155,21 +265,11 @@ class BaseHandler:
             fp (bool): A boolean value indicating whether to mark the variant as false positive.
 
         Returns:
-            Any: The result of the update operation.
+            Any: The update counts, see `set_flag`.
         """
-        if self.get_collection().update_one(
-            {"_id": ObjectId(var_id)},
-            {"$set": {"fp": fp}},
-        ):
-            flash(
-                f"Variant {'marked' if fp else 'unmarked'} as False Positive",
-                "green",
-            )
-        else:
-            flash(
-                f"Failed to {'mark' if fp else 'unmark'} variant as False Positive",
-                "red",
-            )
+        counts = self.set_flag([var_id], "fp", fp)
+        flash(f"Variant {'marked' if fp else 'unmarked'} as False Positive", "green")
+        return counts
 
     def mark_false_positive_bulk(self, var_ids: list[str], fp: bool) -> Any:
         """
@@ -180,29 +280,9 @@ class BaseHandler:
             fp (bool): True to mark as false positive, False to unmark.
 
         Returns:
-            Any: The result of the bulk write operation.
+            Any: The update counts, see `set_flag`, or None if the update failed.
         """
-        if not var_ids:
-            flash("No variants provided for false positive update.", "yellow")
-            return None
-
-        bulk = self.get_collection().initialize_unordered_bulk_op()
-
-        for vid in var_ids:
-            bulk.find({"_id": ObjectId(vid)}).update({"$set": {"fp": fp}})
-
-        try:
-            result = bulk.execute()
-            modified = result.get("nModified", 0)
-            flash(
-                f"{modified} variant(s) {'marked' if fp else 'unmarked'} as False Positive",
-                "green",
-            )
-        except Exception as e:
-            flash(f"Bulk update failed: {str(e)}", "red")
-            return None
-
-        return result
+        return self._set_flag_bulk(var_ids, "fp", fp, "False Positive")
 
     def mark_interesting(self, var_id: str, interesting: bool) -> Any:
         """
@@ -216,21 +296,11 @@ class BaseHandler:
             interesting (bool): A boolean value indicating whether to mark the variant as interesting.
 
         Returns:
-            Any: The result of the update operation.
+            Any: The update counts, see `set_flag`.
         """
-        if self.get_collection().update_one(
-            {"_id": ObjectId(var_id)},
-            {"$set": {"interesting": interesting}},
-        ):
-            flash(
-                f"Variant {'marked' if interesting else 'unmarked'} as Interesting",
-                "green",
-            )
-        else:
-            flash(
-                f"Failed to {'mark' if interesting else 'unmark'} variant as Interesting",
-                "red",
-            )
+        counts = self.set_flag([var_id], "interesting", interesting)
+        flash(f"Variant {'marked' if interesting else 'unmarked'} as Interesting", "green")
+        return counts
 
     def mark_irrelevant(self, var_id: str, irrelevant: bool) -> Any:
         """
@@ -244,21 +314,11 @@ class BaseHandler:
             irrelevant (bool): A boolean value indicating whether to mark the variant as irrelevant.
 
         Returns:
-            Any: The result of the update operation.
+            Any: The update counts, see `set_flag`.
         """
-        if self.get_collection().update_one(
-            {"_id": ObjectId(var_id)},
-            {"$set": {"irrelevant": irrelevant}},
-        ):
-            flash(
-                f"Variant {'marked' if irrelevant else 'unmarked'} as Irrelevant",
-                "green",
-            )
-        else:
-            flash(
-                f"Failed to {'mark' if irrelevant else 'unmark'} variant as Irrelevant",
-                "red",
-            )
+        counts = self.set_flag([var_id], "irrelevant", irrelevant)
+        flash(f"Variant {'marked' if irrelevant else 'unmarked'} as Irrelevant", "green")
+        return counts
 
     def mark_irrelevant_bulk(self, var_ids: list[str], irrelevant: bool) -> Any:
         """
@@ -269,29 +329,9 @@ class BaseHandler:
             irrelevant (bool): True to mark as irrelevant, False to unmark.
 
         Returns:
-            Any: The result of the bulk write operation.
+            Any: The update counts, see `set_flag`, or None if the update failed.
         """
-        if not var_ids:
-            flash("No variants provided for irrelevant update.", "yellow")
-            return None
-
-        bulk = self.get_collection().initialize_unordered_bulk_op()
-
-        for vid in var_ids:
-            bulk.find({"_id": ObjectId(vid)}).update({"$set": {"irrelevant": irrelevant}})
-
-        try:
-            result = bulk.execute()
-            modified = result.get("nModified", 0)
-            flash(
-                f"{modified} variant(s) {'marked' if irrelevant else 'unmarked'} as Irrelevant",
-                "green",
-            )
-        except Exception as e:
-            flash(f"Bulk update failed: {str(e)}", "red")
-            return None
-
-        return result
+        return self._set_flag_bulk(var_ids, "irrelevant", irrelevant, "Irrelevant")
 
     def mark_noteworthy(self, var_id: str, noteworthy: bool) -> Any:
         """
@@ -307,21 +347,11 @@ class BaseHandler:
             noteworthy (bool): A boolean value indicating whether to mark the variant as noteworthy.
 
         Returns:
-            Any: The result of the update operation.
+            Any: The update counts, see `set_flag`.
         """
-        if self.get_collection().update_one(
-            {"_id": ObjectId(var_id)},
-            {"$set": {"noteworthy": noteworthy}},
-        ):
-            flash(
-                f"Variant {'marked' if noteworthy else 'unmarked'} as Note Worthy",
-                "green",
-            )
-        else:
-            flash(
-                f"Failed to {'mark' if noteworthy else 'unmark'} variant as Note Worthy",
-                "red",
-            )
+        counts = self.set_flag([var_id], "noteworthy", noteworthy)
+        flash(f"Variant {'marked' if noteworthy else 'unmarked'} as Note Worthy", "green")
+        return counts
 
     def add_comment(self, comment_doc: dict) -> Any:
         """
@@ -339,6 +369,7 @@ class BaseHandler:
             Any: The result of the insert operation.
         """
         self.get_collection().insert_one(comment_doc)
+        self.evict_request_cache()
 
     def update_comment(self, id: str, comment_doc: dict) -> Any:
         """
@@ -356,6 +387,7 @@ class BaseHandler:
             Any: The result of the update operation.
         """
         self.get_collection().update({"_id": ObjectId(id)}, comment_doc)
+        self.evict_request_cache()
 
     def hidden_comments(self, id: str) -> bool:
         """
@@ -389,7 +421,9 @@ class BaseHandler:
         Returns:
             Any: The result of the update operation.
         """
-        return self.get_collection().update_one({"_id": doc_id}, {"$set": {"active": active}})
+        result = self.get_collection().update_one({"_id": doc_id}, {"$set": {"active": active}})
+        self.evict_request_cache()
+        return result
 
     def get_latest_comment(self, doc_id: str) -> dict | None:
         """
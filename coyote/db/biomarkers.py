@@ -23,6 +23,7 @@ It is part of the `coyote.db` package and extends the base handler functionality
 # -------------------------------------------------------------------------
 # Imports
 # -------------------------------------------------------------------------
+from pymongo import ASCENDING
 from coyote.db.base import BaseHandler
 
 
@@ -46,6 +47,13 @@ class BiomarkerHandler(BaseHandler):
         super().__init__(adapter)
         self.set_collection(self.adapter.biomarkers_collection)
 
+    def ensure_indexes(self) -> None:
+        """
+        Create the per-sample index for biomarker lookups.
+        """
+        # Biomarkers for one sample
+        self.create_index([("SAMPLE_ID", ASCENDING)], name="ix_sample_id")
+
     def get_sample_biomarkers_doc(self, sample_id: str, normal: bool = False):
         """
         Retrieve the full biomarkers document for a given sample.
@@ -18,12 +18,20 @@ BlacklistHandler module for Coyote3
 This module defines the `BlacklistHandler` class used for accessing and managing
 blacklist data in MongoDB.
 
+Blacklisted positions are served from a per-assay in-process snapshot. Each assay has a
+change stamp in the shared flask-caching backend (Redis) that is bumped on every write, so
+a lookup needs one stamp read and the snapshot is reloaded only after a change.
+
 It is part of the `coyote.db` package and extends the base handler functionality.
 """
 
 # -------------------------------------------------------------------------
 # Imports
 # -------------------------------------------------------------------------
+from typing import Iterable
+import threading
+import uuid
+from pymongo import ASCENDING, UpdateOne
 from coyote.db.base import BaseHandler
 from flask import flash
 from flask import current_app as app
@@ -44,21 +52,105 @@ class BlacklistHandler(BaseHandler):
     of the `BaseHandler` class.
     """
 
+    STAMP_KEY_PREFIX = "blacklist_stamp"
+
     def __init__(self, adapter):
         """
         Initialize the handler with a given adapter and bind the collection.
         """
         super().__init__(adapter)
         self.set_collection(self.adapter.blacklist_collection)
+        self._snapshot_lock = threading.Lock()
+        self._snapshots: dict[str, tuple[str, dict]] = {}
+
+    def ensure_indexes(self) -> None:
+        """
+        Create the assay/position index used when flagging blacklisted variants.
+        """
+        # Blacklist lookups for the positions of a variant list
+        self.create_index([("assay", ASCENDING), ("pos", ASCENDING)], name="ix_assay_pos")
+
+    def get_stamp(self, assay: str) -> str | None:
+        """
+        Read the blacklist change stamp of an assay from the shared cache backend.
+
+        Returns:
+            str | None: The stamp (`"0"` if never bumped), or None if it cannot be read.
+        """
+        shared = getattr(self.app, "cache", None)
+        if shared is None:
+            return None
+        try:
+            return shared.get(f"{self.STAMP_KEY_PREFIX}:{assay}") or "0"
+        except Exception as exc:
+            self.app.logger.warning(f"[BLACKLIST] Stamp lookup failed for {assay}: {exc}")
+            return None
+
+    def bump_stamp(self, assay: str) -> None:
+        """
+        Publish a new blacklist change stamp for an assay so every worker reloads its snapshot.
+
+        Args:
+            assay (str): The assay whose blacklist changed.
+        """
+        with self._snapshot_lock:
+            self._snapshots.pop(assay, None)
+        self.adapter.dashboard_stats_handler.refresh_blacklisted()
+
+        shared = getattr(self.app, "cache", None)
+        if shared is None:
+            return
+        try:
+            shared.set(f"{self.STAMP_KEY_PREFIX}:{assay}", uuid.uuid4().hex, timeout=0)
+        except Exception as exc:
+            self.app.logger.warning(f"[BLACKLIST] Could not publish new stamp for {assay}: {exc}")
+
+    def get_blacklist_snapshot(self, assay: str) -> dict | None:
+        """
+        Return the blacklisted positions of an assay from the in-process snapshot.
+
+        The snapshot is reloaded with one query when the assay stamp has changed. Nothing is
+        served from memory when the stamp cannot be read or `BLACKLIST_SNAPSHOT_ENABLED`
+        is off.
+
+        Args:
+            assay (str): The assay group.
+
+        Returns:
+            dict | None: Mapping of `simple_id` to `in_normal_perc` (read-only), or None when
+            the snapshot is not available.
+        """
+        if not self.app.config.get("BLACKLIST_SNAPSHOT_ENABLED", True):
+            return None
+        stamp = self.get_stamp(assay)
+        if stamp is None:
+            return None
+
+        with self._snapshot_lock:
+            cached = self._snapshots.get(assay)
+        if cached and cached[0] == stamp:
+            return cached[1]
+
+        positions = {
+            elem["pos"]: elem.get("in_normal_perc")
+            for elem in self.get_collection().find(
+                {"assay": assay}, {"pos": 1, "in_normal_perc": 1, "_id": 0}
+            )
+        }
+        with self._snapshot_lock:
+            self._snapshots[assay] = (stamp, positions)
+        self.app.logger.debug(f"[BLACKLIST] Loaded {len(positions)} positions for {assay}")
+        return positions
 
     def add_blacklist_data(self, variants: list, assay: str) -> dict:
         """
         Add blacklist data to variants.
 
-        This method enriches a list of variants with blacklist data from the database.
-        It checks if each variant's `simple_id` exists in the blacklist collection
-        for the specified assay and adds the corresponding `in_normal_perc` value
-        to the variant if found.
+        This method enriches a list of variants with blacklist data.
+        It checks if each variant's `simple_id` exists in the blacklist snapshot
+        of the specified assay (or the blacklist collection when no snapshot is
+        available) and adds the corresponding `in_normal_perc` value to the
+        variant if found.
 
         Args:
             variants (list): A list of variant dictionaries, each containing a `simple_id` key.
@@ -67,13 +159,14 @@ class BlacklistHandler(BaseHandler):
         Returns:
             list: The updated list of variants with blacklist data added where applicable.
         """
-        short_pos = [var.get("simple_id") for var in variants]
-
-        blacklisted = self.get_collection().find(
-            {"assay": assay, "pos": {"$in": short_pos}},
-            {"pos": 1, "in_normal_perc": 1, "_id": 0},
-        )
-        blacklisted_dict = {elem["pos"]: elem["in_normal_perc"] for elem in list(blacklisted)}
+        blacklisted_dict = self.get_blacklist_snapshot(assay)
+        if blacklisted_dict is None:
+            short_pos = [var.get("simple_id") for var in variants]
+            blacklisted = self.get_collection().find(
+                {"assay": assay, "pos": {"$in": short_pos}},
+                {"pos": 1, "in_normal_perc": 1, "_id": 0},
+            )
+            blacklisted_dict = {elem["pos"]: elem["in_normal_perc"] for elem in list(blacklisted)}
 
         for var in variants:
             if var["simple_id"] in blacklisted_dict:
@@ -104,12 +197,65 @@ class BlacklistHandler(BaseHandler):
         if self.get_collection().insert_one(
             {"assay": assay, "in_normal_perc": 1, "pos": short_pos}
         ):
+            self.bump_stamp(assay)
             flash(f"Variant {short_pos} added to blacklist", "green")
             return True
         else:
             flash(f"Failed to add variant {short_pos} to blacklist", "red")
             return False
 
+    def import_blacklist(
+        self, entries: Iterable[tuple[str, float]], assay: str, replace: bool = False
+    ) -> dict:
+        """
+        Bulk import blacklisted positions for an assay.
+
+        Positions are upserted on `(assay, pos)`, so importing the same file twice does not
+        create duplicates. The assay stamp is bumped once at the end.
+
+        Args:
+            entries (Iterable[tuple[str, float]]): `(simple_id, in_normal_perc)` pairs.
+            assay (str): The assay group the positions belong to.
+            replace (bool): Remove positions of the assay that are not in `entries`.
+
+        Returns:
+            dict: Counts of `upserted`, `modified` and `removed` positions.
+        """
+        batch_size = self.app.config.get("BLACKLIST_IMPORT_BATCH_SIZE", 1000)
+        counts = {"upserted": 0, "modified": 0, "removed": 0}
+        positions = set()
+        operations = []
+
+        def _flush() -> None:
+            if operations:
+                result = self.get_collection().bulk_write(operations, ordered=False)
+                counts["upserted"] += result.upserted_count
+                counts["modified"] += result.modified_count
+                operations.clear()
+
+        for pos, in_normal_perc in entries:
+            positions.add(pos)
+            operations.append(
+                UpdateOne(
+                    {"assay": assay, "pos": pos},
+                    {"$set": {"in_normal_perc": in_normal_perc}},
+                    upsert=True,
+                )
+            )
+            if len(operations) >= batch_size:
+                _flush()
+        _flush()
+
+        if replace:
+            counts["removed"] = (
+                self.get_collection()
+                .delete_many({"assay": assay, "pos": {"$nin": list(positions)}})
+                .deleted_count
+            )
+
+        self.bump_stamp(assay)
+        return counts
+
     def get_blacklisted_count(self) -> int:
         """
         Get the count of blacklisted entries.
@@ -23,6 +23,7 @@ It is part of the `coyote.db` package and extends the base handler functionality
 # -------------------------------------------------------------------------
 # Imports
 # -------------------------------------------------------------------------
+from pymongo import ASCENDING
 from coyote.db.base import BaseHandler
 
 
@@ -45,6 +46,16 @@ class BRCAHandler(BaseHandler):
         super().__init__(adapter)
         self.set_collection(self.adapter.brcaexchange_collection)
 
+    def ensure_indexes(self) -> None:
+        """
+        Create the position indexes used for BRCA Exchange lookups on both genome builds.
+        """
+        # BRCA Exchange lookups by GRCh37 position
+        self.create_index([("chr", ASCENDING), ("pos", ASCENDING)], name="ix_chr_pos")
+
+        # BRCA Exchange lookups by GRCh38 position
+        self.create_index([("chr38", ASCENDING), ("pos38", ASCENDING)], name="ix_chr38_pos38")
+
     def get_brca_data(self, variant: dict, assay: str) -> dict:
         """
         Retrieve BRCA data for a specific variant.
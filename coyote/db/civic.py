@@ -23,6 +23,7 @@ It is part of the `coyote.db` package and extends the base handler functionality
 # -------------------------------------------------------------------------
 # Imports
 # -------------------------------------------------------------------------
+from pymongo import ASCENDING
 from coyote.db.base import BaseHandler
 
 
@@ -45,6 +46,26 @@ class CivicHandler(BaseHandler):
         super().__init__(adapter)
         self.set_collection(self.adapter.civic_variants_collection)
 
+    def ensure_indexes(self) -> None:
+        """
+        Create indexes on the CIViC variant and gene collections.
+        """
+        # CIViC variants by position
+        self.create_index(
+            [("chromosome", ASCENDING), ("start", ASCENDING)],
+            name="ix_chromosome_start",
+        )
+
+        # CIViC variants by gene
+        self.create_index([("gene", ASCENDING)], name="ix_gene")
+
+        # CIViC gene documents by name
+        self.create_index(
+            [("name", ASCENDING)],
+            name="ix_name",
+            collection=self.adapter.civic_gene_collection,
+        )
+
     def get_civic_data(self, variant: dict, variant_desc: str) -> dict:
         """
         Retrieve CIViC variant data for a given variant or gene.
@@ -99,4 +120,8 @@ class CivicHandler(BaseHandler):
         Returns:
             dict: A dictionary containing the CIViC gene data if found, or None if no match is found.
         """
-        return self.adapter.civic_gene_collection.find_one({"name": gene_smbl})
+        return self.adapter.reference_cache.get(
+            "civic_genes",
+            gene_smbl,
+            lambda name: self.adapter.civic_gene_collection.find_one({"name": name}),
+        )
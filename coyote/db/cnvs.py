@@ -25,6 +25,7 @@ It is part of the `coyote.db` package and extends the base handler functionality
 # Imports
 # -------------------------------------------------------------------------
 from bson.objectid import ObjectId
+from pymongo import ASCENDING
 from coyote.db.base import BaseHandler
 from flask import current_app as app
 
@@ -49,6 +50,13 @@ class CNVsHandler(BaseHandler):
         super().__init__(adapter)
         self.set_collection(self.adapter.cnvs_collection)
 
+    def ensure_indexes(self) -> None:
+        """
+        Create the per-sample index for CNV lists.
+        """
+        # CNVs for one sample
+        self.create_index([("SAMPLE_ID", ASCENDING)], name="ix_sample_id")
+
     def get_sample_cnvs(self, query: dict) -> list[dict | None]:
         """
         Retrieve CNVs for a specific sample based on the provided query.
@@ -24,6 +24,7 @@ It is part of the `coyote.db` package and extends the base handler functionality
 # -------------------------------------------------------------------------
 # Imports
 # -------------------------------------------------------------------------
+from pymongo import ASCENDING
 from coyote.db.base import BaseHandler
 from typing import Any
 
@@ -49,6 +50,13 @@ class CoverageHandler(BaseHandler):
         super().__init__(adapter)
         self.set_collection(self.adapter.coverage_collection)
 
+    def ensure_indexes(self) -> None:
+        """
+        Create the per-sample index for coverage documents.
+        """
+        # Coverage for one sample
+        self.create_index([("sample", ASCENDING)], name="ix_sample")
+
     def get_sample_coverage(self, sample_name: str) -> list[dict]:
         """
         Retrieve coverage data for a specific sample.
@@ -23,6 +23,7 @@ It is part of the `coyote.db` package and extends the base handler functionality
 # -------------------------------------------------------------------------
 # Imports
 # -------------------------------------------------------------------------
+from pymongo import ASCENDING
 from coyote.db.base import BaseHandler
 from flask import current_app as app
 
@@ -48,6 +49,13 @@ class CoverageHandler2(BaseHandler):
         super().__init__(adapter)
         self.set_collection(self.adapter.coverage2_collection)
 
+    def ensure_indexes(self) -> None:
+        """
+        Create the per-sample index for coverage documents.
+        """
+        # Coverage for one sample
+        self.create_index([("SAMPLE_ID", ASCENDING)], name="ix_sample_id")
+
     def get_sample_coverage(self, sample_name: str) -> dict:
         """
         Retrieve coverage data for a specific sample.
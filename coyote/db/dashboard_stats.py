@@ -0,0 +1,317 @@
+#  Copyright (c) 2025 Coyote3 Project Authors
+#  All rights reserved.
+#
+#  This source file is part of the Coyote3 codebase.
+#  The Coyote3 project provides a framework for genomic data analysis,
+#  interpretation, reporting, and clinical diagnostics.
+#
+#  Unauthorized use, distribution, or modification of this software or its
+#  components is strictly prohibited without prior written permission from
+#  the copyright holders.
+#
+
+"""
+DashboardStatsHandler module for Coyote3
+========================================
+
+This module defines the `DashboardStatsHandler` class, which keeps the statistics shown
+on the dashboard materialized in one document of the `dashboard_stats` collection:
+
+    {
+        "_id": "global",
+        "samples": {"total": 0, "analysed": 0},
+        "assays": {"<assay>": {"<profile>": {"total": 0, "analysed": 0}}},
+        "profiles": {...}, "omics_layers": {...}, "sequencing_scopes": {...},
+        "pair_count": {"paired": 0, "unpaired": 0, "unknown": 0},
+        "variants": {
+            "total_variants": 0, "total_snps": 0, "total_cnvs": 0, "total_translocs": 0,
+            "total_fusions": 0, "blacklisted": 0, "fps": 0
+        },
+        "genes": {"unique_all_panels": 0, "panels": [...]},
+        "time_reconciled": ISODate(...), "time_reconcile_started": ISODate(...)
+    }
+
+The counters are incremented by the ingest (`VariantOccurrencesHandler.record_sample`),
+report, delete and false positive paths; the blacklist and panel sections are refreshed
+when those collections change. `reconcile` recomputes everything from the source
+collections and corrects any drift; it runs when the document is older than
+`DASHBOARD_STATS_RECONCILE_SECONDS` and from `scripts/reconcile_dashboard_stats.py`.
+
+It is part of the `coyote.db` package and extends the base handler functionality.
+MongoDB 3.4 compatible.
+"""
+
+# -------------------------------------------------------------------------
+# Imports
+# -------------------------------------------------------------------------
+from datetime import timedelta
+import threading
+from bson.objectid import ObjectId
+from pymongo import ReturnDocument
+from coyote.db.base import BaseHandler
+from coyote.util.common_utility import CommonUtility
+
+
+# -------------------------------------------------------------------------
+# Class Definition
+# -------------------------------------------------------------------------
+class DashboardStatsHandler(BaseHandler):
+    """
+    The `DashboardStatsHandler` class manages the `dashboard_stats` collection, the
+    materialized dashboard statistics shared by all users.
+    """
+
+    STATS_ID = "global"
+
+    def __init__(self, adapter):
+        """
+        Initialize the handler with a given adapter and bind the collection.
+        """
+        super().__init__(adapter)
+        self.set_collection(self.adapter.dashboard_stats_collection)
+
+    @staticmethod
+    def _key(value) -> str:
+        """
+        Return a sample field value as a safe field name for the counter maps.
+        """
+        return str(value if value is not None else "unknown").replace(".", "_").replace("$", "_")
+
+    @staticmethod
+    def _pair_key(paired) -> str:
+        """
+        Return the `pair_count` bucket of a sample `paired` value.
+        """
+        if paired is True:
+            return "paired"
+        if paired is False:
+            return "unpaired"
+        return "unknown"
+
+    def get_stats(self) -> dict | None:
+        """
+        Return the materialized dashboard statistics, or None before the first reconcile.
+        """
+        return self.get_collection().find_one({"_id": self.STATS_ID})
+
+    def increment(self, counters: dict) -> None:
+        """
+        Apply `$inc` counters (dotted field paths) to the statistics document.
+
+        Nothing is written before the first reconcile; the reconcile counts everything.
+
+        Args:
+            counters (dict): e.g. `{"variants.fps": 3}`; zero counters are dropped.
+        """
+        counters = {field: value for field, value in counters.items() if value}
+        if not counters:
+            return
+        try:
+            self.get_collection().update_one({"_id": self.STATS_ID}, {"$inc": counters})
+        except Exception as exc:
+            self.app.logger.warning(f"[DASHBOARD STATS] Counter update failed: {exc}")
+
+    def record_sample(self, sample_oid: str, sign: int = 1) -> None:
+        """
+        Count a sample and its variants in, or out with `sign=-1`.
+
+        Called when a sample has been loaded and before a sample and its data are deleted.
+        A sample is counted once: by the last reconcile if it was added before it, else by
+        this method, which marks it with `dashboard_counted`. Samples that are already
+        counted are not added again (backfills, rebuilds) and samples that are not counted
+        are not removed.
+
+        Args:
+            sample_oid (str): The sample ObjectId as a string.
+            sign (int): `1` to add the sample, `-1` to remove it.
+        """
+        stats = self.get_collection().find_one({"_id": self.STATS_ID}, {"time_reconciled": 1})
+        if not stats:
+            return
+        sample = self.adapter.samples_collection.find_one({"_id": ObjectId(sample_oid)})
+        if not sample:
+            return
+        if self._is_counted(sample, stats.get("time_reconciled")) == (sign > 0):
+            return
+        analysed = 1 if (sample.get("report_num") or 0) > 0 else 0
+        assay_path = f"assays.{self._key(sample.get('assay'))}.{self._key(sample.get('profile'))}"
+        by_sample = {"SAMPLE_ID": sample_oid}
+        counters = {
+            "samples.total": 1,
+            "samples.analysed": analysed,
+            f"{assay_path}.total": 1,
+            f"{assay_path}.analysed": analysed,
+            f"profiles.{self._key(sample.get('profile'))}": 1,
+            f"omics_layers.{self._key(sample.get('omics_layer'))}": 1,
+            f"sequencing_scopes.{self._key(sample.get('sequencing_scope'))}": 1,
+            f"pair_count.{self._pair_key(sample.get('paired'))}": 1,
+            "variants.total_variants": self.adapter.variants_collection.count_documents(by_sample),
+            "variants.total_snps": self.adapter.variants_collection.count_documents(
+                {**by_sample, "variant_class": "SNV"}
+            ),
+            "variants.fps": self.adapter.variants_collection.count_documents(
+                {**by_sample, "fp": True}
+            ),
+            "variants.total_cnvs": self.adapter.cnvs_collection.count_documents(by_sample),
+            "variants.total_translocs": self.adapter.transloc_collection.count_documents(by_sample),
+            "variants.total_fusions": self.adapter.fusions_collection.count_documents(by_sample),
+        }
+        self.increment({field: sign * value for field, value in counters.items()})
+        if sign > 0:
+            self.adapter.samples_collection.update_one(
+                {"_id": sample["_id"]}, {"$set": {"dashboard_counted": CommonUtility.utc_now()}}
+            )
+
+    @staticmethod
+    def _is_counted(sample: dict, time_reconciled) -> bool:
+        """
+        Return True if a sample is included in the statistics.
+
+        Samples added before the last reconcile (or without `time_added`) are counted by
+        it; later samples only once `record_sample` marked them with `dashboard_counted`.
+        """
+        if sample.get("dashboard_counted"):
+            return True
+        time_added = sample.get("time_added")
+        return not time_added or not time_reconciled or time_added <= time_reconciled
+
+    def record_first_report(self, sample: dict) -> None:
+        """
+        Count a sample as analysed after its first report was saved.
+
+        Args:
+            sample (dict): The sample document (`assay` and `profile` are used).
+        """
+        assay_path = f"assays.{self._key(sample.get('assay'))}.{self._key(sample.get('profile'))}"
+        self.increment({"samples.analysed": 1, f"{assay_path}.analysed": 1})
+
+    def refresh_blacklisted(self) -> None:
+        """
+        Recount the distinct blacklisted positions after the blacklist changed.
+        """
+        self._set(
+            {"variants.blacklisted": self.adapter.blacklist_handler.get_unique_blacklist_count()}
+        )
+
+    def refresh_panels(self) -> None:
+        """
+        Recompute the panel gene counts after an assay specific panel changed.
+        """
+        self._set({"genes": self._panel_stats()})
+
+    def _set(self, fields: dict) -> None:
+        """
+        Set fields on the statistics document if it exists.
+        """
+        try:
+            self.get_collection().update_one({"_id": self.STATS_ID}, {"$set": fields})
+        except Exception as exc:
+            self.app.logger.warning(f"[DASHBOARD STATS] Refresh failed: {exc}")
+
+    def _panel_stats(self) -> dict:
+        """
+        Return the gene statistics of all assay specific panels.
+        """
+        return {
+            "unique_all_panels": self.adapter.asp_handler.get_all_asps_unique_gene_count(),
+            "panels": list(self.adapter.asp_handler.get_all_asp_gene_counts()),
+        }
+
+    def _assay_stats(self) -> dict:
+        """
+        Return total and analysed sample counts per assay and profile.
+        """
+        stats = {}
+        for doc in self.adapter.samples_collection.aggregate(
+            [
+                {
+                    "$group": {
+                        "_id": {"assay": "$assay", "profile": "$profile"},
+                        "total": {"$sum": 1},
+                        "analysed": {"$sum": {"$cond": [{"$gt": ["$report_num", 0]}, 1, 0]}},
+                    }
+                }
+            ]
+        ):
+            assay = stats.setdefault(self._key(doc["_id"].get("assay")), {})
+            assay[self._key(doc["_id"].get("profile"))] = {
+                "total": doc["total"],
+                "analysed": doc["analysed"],
+            }
+        return stats
+
+    def reconcile(self) -> dict:
+        """
+        Recompute all statistics from the source collections and store them.
+
+        Returns:
+            dict: The new statistics document.
+        """
+        samples = self.adapter.sample_handler
+        stats = {
+            "_id": self.STATS_ID,
+            "samples": {
+                "total": samples.get_all_sample_counts(),
+                "analysed": samples.get_all_sample_counts(report=True),
+            },
+            "assays": self._assay_stats(),
+            "profiles": {self._key(k): v for k, v in samples.get_profile_counts().items()},
+            "omics_layers": {self._key(k): v for k, v in samples.get_omics_counts().items()},
+            "sequencing_scopes": {
+                self._key(k): v for k, v in samples.get_sequencing_scope_counts().items()
+            },
+            "pair_count": samples.get_paired_sample_counts(),
+            "variants": {
+                "total_variants": self.adapter.variant_handler.get_total_variant_counts(),
+                "total_snps": self.adapter.variant_handler.get_total_snp_counts(),
+                "total_cnvs": self.adapter.cnv_handler.get_total_cnv_count(),
+                "total_translocs": self.adapter.transloc_handler.get_total_transloc_count(),
+                "total_fusions": self.adapter.fusion_handler.get_total_fusion_count(),
+                "blacklisted": self.adapter.blacklist_handler.get_unique_blacklist_count(),
+                "fps": self.adapter.variant_handler.get_fp_counts(),
+            },
+            "genes": self._panel_stats(),
+            "time_reconciled": CommonUtility.utc_now(),
+            "time_reconcile_started": None,
+        }
+        self.get_collection().replace_one({"_id": self.STATS_ID}, stats, upsert=True)
+        self.app.logger.info("[DASHBOARD STATS] Reconciled")
+        return stats
+
+    def reconcile_if_stale(self, max_age: int) -> None:
+        """
+        Reconcile in a background thread when the statistics are older than `max_age`.
+
+        One process claims the reconcile atomically; a claim older than `max_age` is taken
+        over (the claiming process died).
+
+        Args:
+            max_age (int): Maximum age of the statistics in seconds.
+        """
+        cutoff = CommonUtility.utc_now() - timedelta(seconds=max_age)
+        claimed = self.get_collection().find_one_and_update(
+            {
+                "_id": self.STATS_ID,
+                "time_reconciled": {"$lt": cutoff},
+                "$or": [
+                    {"time_reconcile_started": None},
+                    {"time_reconcile_started": {"$lt": cutoff}},
+                ],
+            },
+            {"$set": {"time_reconcile_started": CommonUtility.utc_now()}},
+            projection={"_id": 1},
+            return_document=ReturnDocument.AFTER,
+        )
+        if claimed is None:
+            return
+
+        app = self.app._get_current_object()
+
+        def run() -> None:
+            with app.app_context():
+                try:
+                    self.reconcile()
+                except Exception as exc:
+                    app.logger.exception(f"[DASHBOARD STATS] Reconcile failed: {exc}")
+
+        threading.Thread(target=run, name="coyote-dashboard-stats", daemon=True).start()
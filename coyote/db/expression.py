@@ -24,6 +24,7 @@ It is part of the `coyote.db` package and extends the base handler functionality
 # -------------------------------------------------------------------------
 # Imports
 # -------------------------------------------------------------------------
+from pymongo import ASCENDING
 from coyote.db.base import BaseHandler
 
 
@@ -48,6 +49,13 @@ class ExpressionHandler(BaseHandler):
         super().__init__(adapter)
         self.set_collection(self.adapter.expression_collection)
 
+    def ensure_indexes(self) -> None:
+        """
+        Create the transcript index used for expression lookups.
+        """
+        # Expression values by transcript
+        self.create_index([("tid", ASCENDING)], name="ix_tid")
+
     def get_expression_data(self, transcripts: list) -> dict:
         """
         Retrieve expression data for a list of transcripts.
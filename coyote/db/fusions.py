@@ -25,6 +25,7 @@ It is part of the `coyote.db` package and extends the base handler functionality
 # Imports
 # -------------------------------------------------------------------------
 from bson.objectid import ObjectId
+from pymongo import ASCENDING
 from coyote.db.base import BaseHandler
 from flask import current_app as app
 from typing import Any
@@ -53,6 +54,13 @@ class FusionsHandler(BaseHandler):
         super().__init__(adapter)
         self.set_collection(self.adapter.fusions_collection)
 
+    def ensure_indexes(self) -> None:
+        """
+        Create the per-sample index for fusion lists.
+        """
+        # Fusions for one sample
+        self.create_index([("SAMPLE_ID", ASCENDING)], name="ix_sample_id")
+
     def get_sample_fusions(self, query: dict) -> Any:
         """
         Retrieve fusions based on a constructed query.
@@ -23,6 +23,7 @@ It is part of the `coyote.db` package and extends the base handler functionality
 # -------------------------------------------------------------------------
 # Imports
 # -------------------------------------------------------------------------
+from pymongo import ASCENDING
 from coyote.db.base import BaseHandler
 from bson.objectid import ObjectId
 
@@ -45,6 +46,21 @@ class GroupCoverageHandler(BaseHandler):
         super().__init__(adapter)
         self.set_collection(self.adapter.groupcov_collection)
 
+    def ensure_indexes(self) -> None:
+        """
+        Create the index behind the coverage region and gene blacklist checks.
+        """
+        # Region/gene blacklist checks; prefixes also serve group-only and gene+group queries
+        self.create_index(
+            [
+                ("group", ASCENDING),
+                ("gene", ASCENDING),
+                ("region", ASCENDING),
+                ("coord", ASCENDING),
+            ],
+            name="ix_group_gene_region_coord",
+        )
+
     def blacklist_coord(
         self, gene: str, coord: str, region: str, group: str
     ) -> dict:
@@ -23,6 +23,7 @@ It is part of the `coyote.db` package and extends the base handler functionality
 # -------------------------------------------------------------------------
 # Imports
 # -------------------------------------------------------------------------
+from pymongo import ASCENDING
 from coyote.db.base import BaseHandler
 from flask import current_app as app
 
@@ -47,6 +48,13 @@ class HGNCHandler(BaseHandler):
         super().__init__(adapter)
         self.set_collection(self.adapter.hgnc_collection)
 
+    def ensure_indexes(self) -> None:
+        """
+        Create the symbol index for HGNC gene metadata lookups.
+        """
+        # Gene metadata by symbol
+        self.create_index([("hgnc_symbol", ASCENDING)], name="ix_hgnc_symbol")
+
     def get_metadata_by_hgnc_id(self, hgnc_id: str) -> dict:
         """
         Retrieve metadata for a gene using its HGNC ID.
@@ -57,7 +65,11 @@ class HGNCHandler(BaseHandler):
         Returns:
             dict: The metadata dictionary for the specified gene.
         """
-        return self.get_collection().find_one({"_id": f"HGNC:{hgnc_id}"})
+        return self.adapter.reference_cache.get(
+            "hgnc",
+            f"id:{hgnc_id}",
+            lambda _key: self.get_collection().find_one({"_id": f"HGNC:{hgnc_id}"}),
+        )
 
     def get_metadata_by_symbol(self, symbol: str) -> dict:
         """
@@ -69,7 +81,11 @@ class HGNCHandler(BaseHandler):
         Returns:
             dict: The metadata of the gene.
         """
-        return self.get_collection().find_one({"hgnc_symbol": symbol})
+        return self.adapter.reference_cache.get(
+            "hgnc",
+            f"symbol:{symbol}",
+            lambda _key: self.get_collection().find_one({"hgnc_symbol": symbol}),
+        )
 
     def get_metadata_by_symbols(self, symbols: list[str]) -> list[dict]:
         """
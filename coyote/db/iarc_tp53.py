@@ -24,6 +24,7 @@ It is part of the `coyote.db` package and extends the base handler functionality
 # -------------------------------------------------------------------------
 # Imports
 # -------------------------------------------------------------------------
+from pymongo import ASCENDING
 from coyote.db.base import BaseHandler
 
 
@@ -49,6 +50,13 @@ class IARCTP53Handler(BaseHandler):
         super().__init__(adapter)
         self.set_collection(self.adapter.iarc_tp53_collection)
 
+    def ensure_indexes(self) -> None:
+        """
+        Create the HGVSc index used for IARC TP53 lookups.
+        """
+        # TP53 lookups by HGVSc
+        self.create_index([("var", ASCENDING)], name="ix_var")
+
     def find_iarc_tp53(self, variant: dict) -> dict | None:
         """
         Find IARC TP53 data for a given variant.
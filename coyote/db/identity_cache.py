@@ -0,0 +1,133 @@
+#  Copyright (c) 2025 Coyote3 Project Authors
+#  All rights reserved.
+#
+#  This source file is part of the Coyote3 codebase.
+#  The Coyote3 project provides a framework for genomic data analysis,
+#  interpretation, reporting, and clinical diagnostics.
+#
+#  Unauthorized use, distribution, or modification of this software or its
+#  components is strictly prohibited without prior written permission from
+#  the copyright holders.
+#
+
+"""
+IdentityCache module for Coyote3
+================================
+
+This module defines the `IdentityCache` class, which keeps the merged user model
+(user document + role + accessible ASPs) of logged-in users in process memory.
+
+A single change stamp in the shared flask-caching backend (Redis) guards the cache.
+The users, roles and ASP handlers bump the stamp whenever they write, so a request
+only needs one stamp lookup to know whether its cached user model is still current.
+
+It is part of the `coyote.db` package.
+"""
+
+# -------------------------------------------------------------------------
+# Imports
+# -------------------------------------------------------------------------
+from typing import Any, Callable
+import threading
+import time
+import uuid
+
+
+# -------------------------------------------------------------------------
+# Class Definition
+# -------------------------------------------------------------------------
+class IdentityCache:
+    """
+    Stamp-guarded cache of user models used for Flask-Login session loading.
+
+    Entries are rebuilt when the shared change stamp differs from the stamp they were
+    built under, when they are older than `max_age` seconds, or when the stamp cannot
+    be read (the shared backend is down), in which case nothing is served from memory.
+    """
+
+    STAMP_KEY = "identity_stamp"
+
+    def __init__(self):
+        self.app = None
+        self.max_age = 300
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._entries: dict[str, tuple[str, float, Any]] = {}
+
+    def init_app(self, app) -> None:
+        """
+        Bind the cache to the Flask application and read its settings.
+
+        Args:
+            app: The Flask application instance.
+        """
+        self.app = app
+        self.max_age = app.config.get("IDENTITY_CACHE_MAX_AGE", 300)
+        self.enabled = app.config.get("IDENTITY_CACHE_ENABLED", True)
+
+    def _shared_cache(self):
+        """
+        Return the shared flask-caching backend, if it has been initialised.
+        """
+        return getattr(self.app, "cache", None) if self.app else None
+
+    def stamp(self) -> str | None:
+        """
+        Read the current identity change stamp from the shared cache backend.
+
+        Returns:
+            str | None: The stamp (`"0"` if never bumped), or None if it cannot be read.
+        """
+        shared = self._shared_cache()
+        if shared is None:
+            return None
+        try:
+            return shared.get(self.STAMP_KEY) or "0"
+        except Exception as exc:
+            self.app.logger.warning(f"[IDENTITY CACHE] Stamp lookup failed: {exc}")
+            return None
+
+    def bump(self) -> None:
+        """
+        Publish a new identity change stamp so every worker rebuilds its cached user models.
+
+        Called by the users, roles and ASP handlers after any write.
+        """
+        with self._lock:
+            self._entries.clear()
+
+        shared = self._shared_cache()
+        if shared is None:
+            return
+        try:
+            shared.set(self.STAMP_KEY, uuid.uuid4().hex, timeout=0)
+        except Exception as exc:
+            self.app.logger.warning(f"[IDENTITY CACHE] Could not publish new stamp: {exc}")
+
+    def get_user_model(self, user_id: str, loader: Callable[[str], Any]) -> Any:
+        """
+        Return the cached user model for `user_id`, rebuilding it with `loader` when stale.
+
+        Args:
+            user_id (str): The unique identifier of the user.
+            loader (Callable): Builds the user model from MongoDB; a `None` result is not cached.
+
+        Returns:
+            Any: A copy of the cached user model, or the freshly built one.
+        """
+        stamp = self.stamp() if self.enabled else None
+        if stamp is None:
+            return loader(user_id)
+
+        now = time.monotonic()
+        with self._lock:
+            cached = self._entries.get(user_id)
+        if cached and cached[0] == stamp and now - cached[1] < self.max_age:
+            return cached[2].model_copy(deep=True)
+
+        user_model = loader(user_id)
+        if user_model is not None:
+            with self._lock:
+                self._entries[user_id] = (stamp, now, user_model.model_copy(deep=True))
+            self.app.logger.debug(f"[IDENTITY CACHE] Rebuilt user model: {user_id}")
+        return user_model
@@ -40,6 +40,8 @@ class ISGLHandler(BaseHandler):
     related to gene asp, assays, diagnoses, and associated metadata.
     """
 
+    REQUEST_CACHE_NAMESPACE = "isgl"
+
     def __init__(self, adapter):
         """
         Initialize the handler with a given adapter and bind the collection.
@@ -112,7 +114,9 @@ class ISGLHandler(BaseHandler):
             pymongo.results.InsertOneResult: The result of the insert operation,
             including the ID of the inserted document.
         """
-        return self.get_collection().insert_one(data)
+        result = self.get_collection().insert_one(data)
+        self.evict_request_cache()
+        return result
 
     def update_isgl(self, isgl_id: str, updated_data: dict) -> Any:
         """
@@ -128,7 +132,9 @@ class ISGLHandler(BaseHandler):
         Returns:
             Any: The result of the replace operation, typically a `pymongo.results.UpdateResult` object.
         """
-        return self.get_collection().replace_one({"_id": isgl_id}, updated_data)
+        result = self.get_collection().replace_one({"_id": isgl_id}, updated_data)
+        self.evict_request_cache()
+        return result
 
     def toggle_isgl_active(self, isgl_id: str, active_status: bool) -> bool:
         """
@@ -160,7 +166,9 @@ class ISGLHandler(BaseHandler):
             pymongo.results.DeleteResult: The result of the delete operation,
             including information about the deletion.
         """
-        return self.get_collection().delete_one({"_id": isgl_id})
+        result = self.get_collection().delete_one({"_id": isgl_id})
+        self.evict_request_cache()
+        return result
 
     def get_subpanels_for_asp(
         self, asp_names: list[str], is_public: bool | None = None, adhoc: bool | None = None
@@ -356,7 +364,7 @@ class ISGLHandler(BaseHandler):
         Returns:
             dict: A dictionary where the keys are the IDs of the gene lists and the
             values are dictionaries containing the selected fields. Returns an empty
-            dictionary if `isgl_ids` is empty.
+            dictionary if `isgl_ids` is empty. Memoized for the request (see `RequestCache`).
         """
         if not isgl_ids:
             return {}
@@ -364,11 +372,16 @@ class ISGLHandler(BaseHandler):
         # Define the fields to include in the query result
         projection = {"_id": 1, "is_active": 1, "displayname": 1, "genes": 1, "adhoc": 1}
 
-        # Query the database for documents with matching IDs
-        cursor = self.get_collection().find({"_id": {"$in": isgl_ids}}, projection)
+        def load() -> dict:
+            # Query the database for documents with matching IDs
+            cursor = self.get_collection().find({"_id": {"$in": list(isgl_ids)}}, projection)
+
+            # Format the result as a dictionary with IDs as keys
+            return {doc.pop("_id"): doc for doc in cursor}
 
-        # Format the result as a dictionary with IDs as keys
-        return {doc.pop("_id"): doc for doc in cursor}
+        return self.adapter.request_cache.get_or_load(
+            self.REQUEST_CACHE_NAMESPACE, ("by_ids", tuple(sorted(map(str, isgl_ids)))), load
+        )
 
     def get_public_isgl_genes_by_diagnosis(
         self, diagnosis: str, is_public: bool = True, is_active: bool = True
@@ -24,6 +24,7 @@ It is part of the `coyote.db` package.
 # Imports
 # -------------------------------------------------------------------------
 import pymongo
+from coyote.db.base import BaseHandler
 from coyote.db.samples import SampleHandler
 from coyote.db.users import UsersHandler
 from coyote.db.asp import ASPHandler
@@ -52,6 +53,13 @@ from coyote.db.vep_meta import VEPMetaHandler
 from coyote.db.isgl import ISGLHandler
 from coyote.db.hgnc import HGNCHandler
 from coyote.db.reported_variants import ReportedVariantsHandler
+from coyote.db.variant_occurrences import VariantOccurrencesHandler
+from coyote.db.report_jobs import ReportJobsHandler
+from coyote.db.dashboard_stats import DashboardStatsHandler
+from coyote.db.reference_cache import ReferenceCache
+from coyote.db.request_cache import RequestCache
+from coyote.db.query_stats import QueryStats
+from coyote.db.identity_cache import IdentityCache
 
 
 # -------------------------------------------------------------------------
@@ -68,11 +76,15 @@ class MongoAdapter:
 
     def __init__(self, client: pymongo.MongoClient = None):
         self.client = client
+        self.reference_cache = ReferenceCache()
+        self.identity_cache = IdentityCache()
+        self.request_cache = RequestCache()
+        self.query_stats = QueryStats()
         if self.client:
             self._setup_dbs(self.client)
             self._setup_handlers()  # Initialize handlers here only if client is provided
 
-    def init_from_app(self, app) -> None:
+    def init_from_app(self, app, client: pymongo.MongoClient = None) -> None:
         """
         Initialize the adapter using the application configuration.
 
@@ -81,9 +93,15 @@ class MongoAdapter:
 
         Args:
             app: The Flask application instance containing the configuration.
+            client (pymongo.MongoClient, optional): Use this client instead of connecting to
+                `MONGO_URI`, e.g. a `mongomock.MongoClient` for the benchmarks.
         """
-        self.client = self._get_mongoclient(app.config["MONGO_URI"])
+        self.query_stats.init_app(app)
+        self.client = client or self._get_mongoclient(app.config["MONGO_URI"])
         self.app = app
+        self.reference_cache.init_app(app)
+        self.identity_cache.init_app(app)
+        self.request_cache.init_app(app)
         self._setup_dbs(self.client)
         self.setup()
         self._setup_handlers()
@@ -101,13 +119,16 @@ class MongoAdapter:
         """
         Retrieve a MongoDB client instance.
 
+        The client reports every command to `self.query_stats` when query statistics
+        are enabled.
+
         Args:
          mongo_uri (str): The MongoDB connection URI.
 
         Returns:
          pymongo.MongoClient: A MongoDB client instance connected to the specified URI.
         """
-        return pymongo.MongoClient(mongo_uri)
+        return pymongo.MongoClient(mongo_uri, event_listeners=self.query_stats.event_listeners())
 
     def _setup_dbs(self, client: pymongo.MongoClient) -> None:
         """
@@ -191,3 +212,35 @@ class MongoAdapter:
         self.isgl_handler = ISGLHandler(self)
         self.hgnc_handler = HGNCHandler(self)
         self.reported_variants_handler = ReportedVariantsHandler(self)
+        self.variant_occurrences_handler = VariantOccurrencesHandler(self)
+        self.report_jobs_handler = ReportJobsHandler(self)
+        self.dashboard_stats_handler = DashboardStatsHandler(self)
+
+        if getattr(self, "app", None) and self.app.config.get("MONGO_ENSURE_INDEXES", True):
+            self.ensure_indexes()
+
+    def handlers(self) -> dict[str, BaseHandler]:
+        """
+        Return all initialised handlers keyed by their attribute name on the adapter.
+
+        Returns:
+            dict[str, BaseHandler]: Mapping like `{"variant_handler": VariantsHandler, ...}`.
+        """
+        return {
+            name: handler
+            for name, handler in vars(self).items()
+            if isinstance(handler, BaseHandler)
+        }
+
+    def ensure_indexes(self) -> None:
+        """
+        Run `ensure_indexes` on every handler.
+
+        Index creation is idempotent and runs in the background on the server. A failure
+        in one handler is logged and does not stop the others or the application startup.
+        """
+        for name, handler in self.handlers().items():
+            try:
+                handler.ensure_indexes()
+            except pymongo.errors.PyMongoError as exc:
+                self.app.logger.warning(f"[INDEXES] ensure_indexes failed for {name}: {exc}")
@@ -24,6 +24,7 @@ It is part of the `coyote.db` package and extends the base handler functionality
 # -------------------------------------------------------------------------
 # Imports
 # -------------------------------------------------------------------------
+from pymongo import ASCENDING
 from coyote.db.base import BaseHandler
 
 
@@ -46,6 +47,37 @@ class OnkoKBHandler(BaseHandler):
         super().__init__(adapter)
         self.set_collection(self.adapter.oncokb_collection)
 
+    def ensure_indexes(self) -> None:
+        """
+        Create indexes on the OncoKB annotation, actionable and gene collections.
+        """
+        # Variant level OncoKB annotations
+        self.create_index(
+            [("Gene", ASCENDING), ("Alteration", ASCENDING)],
+            name="ix_gene_alteration",
+        )
+
+        # Actionable OncoKB annotations per variant
+        self.create_index(
+            [("Gene", ASCENDING), ("Alteration", ASCENDING)],
+            name="ix_gene_alteration",
+            collection=self.adapter.oncokb_actionable_collection,
+        )
+
+        # Actionable OncoKB genes by symbol
+        self.create_index(
+            [("Hugo Symbol", ASCENDING)],
+            name="ix_hugo_symbol",
+            collection=self.adapter.oncokb_actionable_collection,
+        )
+
+        # OncoKB gene documents by name
+        self.create_index(
+            [("name", ASCENDING)],
+            name="ix_name",
+            collection=self.adapter.oncokb_genes_collection,
+        )
+
     def get_oncokb_anno(self, variant: dict, oncokb_hgvsp: str) -> dict:
         """
         Get OncoKB annotation for a variant.
@@ -98,7 +130,11 @@ class OnkoKBHandler(BaseHandler):
         Returns:
             dict: The OncoKB gene document if found, otherwise None.
         """
-        return self.adapter.oncokb_genes_collection.find_one({"name": gene})
+        return self.adapter.reference_cache.get(
+            "oncokb_genes",
+            gene,
+            lambda name: self.adapter.oncokb_genes_collection.find_one({"name": name}),
+        )
 
     def get_oncokb_action_gene(self, gene: str) -> dict:
         """
@@ -113,6 +149,65 @@ class OnkoKBHandler(BaseHandler):
         Returns:
             dict: A cursor object containing actionable OncoKB documents matching the query.
         """
-        return self.adapter.oncokb_actionable_collection.find_one(
-            {"Hugo Symbol": gene}
+        return self.adapter.reference_cache.get(
+            "oncokb_action_genes",
+            gene,
+            lambda name: self.adapter.oncokb_actionable_collection.find_one({"Hugo Symbol": name}),
         )
+
+    def get_oncokb_genes(self, genes: list[str]) -> dict[str, dict]:
+        """
+        Get OncoKB gene documents for several genes at once.
+
+        This is the bulk counterpart of `get_oncokb_gene` and resolves all requested genes
+        with a single `$in` query, so callers that handle many variants can build the
+        gene index once per request instead of querying once per variant.
+
+        Args:
+            genes (list[str]): Gene symbols to look up. Duplicates and empty values are ignored.
+
+        Returns:
+            dict[str, dict]: A mapping of gene name to its OncoKB gene document. Genes that
+                are not described in OncoKB are absent from the mapping.
+        """
+        gene_set = {gene for gene in genes if gene}
+        if not gene_set:
+            return {}
+
+        def _load(names: list[str]) -> dict[str, dict]:
+            oncokb_genes = {}
+            for doc in self.adapter.oncokb_genes_collection.find({"name": {"$in": names}}):
+                oncokb_genes.setdefault(doc.get("name"), doc)
+            return oncokb_genes
+
+        cached = self.adapter.reference_cache.get_many("oncokb_genes", gene_set, _load)
+        return {name: doc for name, doc in cached.items() if doc}
+
+    def get_oncokb_action_genes(self, genes: list[str]) -> dict[str, dict]:
+        """
+        Get OncoKB actionable documents for several genes at once.
+
+        This is the bulk counterpart of `get_oncokb_action_gene` and resolves all requested
+        genes with a single `$in` query on `Hugo Symbol`.
+
+        Args:
+            genes (list[str]): Gene symbols to look up. Duplicates and empty values are ignored.
+
+        Returns:
+            dict[str, dict]: A mapping of Hugo symbol to the first actionable OncoKB document
+                found for that gene. Genes without actionable data are absent from the mapping.
+        """
+        gene_set = {gene for gene in genes if gene}
+        if not gene_set:
+            return {}
+
+        def _load(names: list[str]) -> dict[str, dict]:
+            action_genes = {}
+            for doc in self.adapter.oncokb_actionable_collection.find(
+                {"Hugo Symbol": {"$in": names}}
+            ):
+                action_genes.setdefault(doc.get("Hugo Symbol"), doc)
+            return action_genes
+
+        cached = self.adapter.reference_cache.get_many("oncokb_action_genes", gene_set, _load)
+        return {name: doc for name, doc in cached.items() if doc}
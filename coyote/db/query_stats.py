@@ -0,0 +1,320 @@
+#  Copyright (c) 2025 Coyote3 Project Authors
+#  All rights reserved.
+#
+#  This source file is part of the Coyote3 codebase.
+#  The Coyote3 project provides a framework for genomic data analysis,
+#  interpretation, reporting, and clinical diagnostics.
+#
+#  Unauthorized use, distribution, or modification of this software or its
+#  components is strictly prohibited without prior written permission from
+#  the copyright holders.
+#
+
+"""
+QueryStats module for Coyote3
+=============================
+
+This module defines the `QueryStats` class, which instruments every MongoDB command
+with a pymongo `CommandListener` and attributes it to the Flask endpoint of the
+request that issued it. It is exposed as `store.query_stats`.
+
+Per request it counts commands, their total time and documents returned (plus the reply
+bytes with `QUERY_STATS_MEASURE_BYTES`, which re-encodes every reply), and at the end of
+the request it:
+
+- adds a `Server-Timing` header (`mongo` plus the `flask.g.section_timings` of the
+  section loader), visible in the browser developer tools,
+- writes one JSON line to the `query_stats` logger (see `logging_setup.py`),
+- adds the request to the rolling per-endpoint statistics of this worker, shown on the
+  admin query stats page.
+
+Requests issuing more than `QUERY_BUDGET_MAX_QUERIES` commands are logged as warnings and
+flagged on the stats page, so N+1 query regressions show up immediately.
+
+It is part of the `coyote.db` package.
+"""
+
+# -------------------------------------------------------------------------
+# Imports
+# -------------------------------------------------------------------------
+from collections import Counter, deque
+import json
+import logging
+import threading
+import bson
+from flask import Response, g, has_request_context, request
+from pymongo import monitoring
+
+
+query_logger = logging.getLogger("query_stats")
+
+
+def _percentile(values, pct: float) -> float:
+    """
+    Return the `pct` percentile (0-100) of a sequence of numbers, 0 if empty.
+    """
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+# -------------------------------------------------------------------------
+# Class Definitions
+# -------------------------------------------------------------------------
+class RequestQueries:
+    """
+    The MongoDB commands of one request.
+
+    Shared by the request thread and the section loader threads of the request.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pending: dict[int, str] = {}
+        self.commands = 0
+        self.total_ms = 0.0
+        self.durations: list[float] = []
+        self.docs = 0
+        self.bytes = 0
+        self.by_command: Counter = Counter()
+        self.ms_by_command: Counter = Counter()
+
+    def started(self, request_id: int, label: str) -> None:
+        with self.lock:
+            self.pending[request_id] = label
+
+    def finished(self, request_id: int, ms: float, docs: int, size: int) -> None:
+        with self.lock:
+            label = self.pending.pop(request_id, "unknown")
+            self.commands += 1
+            self.total_ms += ms
+            self.durations.append(ms)
+            self.docs += docs
+            self.bytes += size
+            self.by_command[label] += 1
+            self.ms_by_command[label] += ms
+
+
+class EndpointStats:
+    """
+    Rolling statistics of one endpoint: the last `window` requests and cumulative
+    per-command counters.
+    """
+
+    def __init__(self, window: int):
+        self.requests = deque(maxlen=window)
+        self.command_ms = deque(maxlen=window * 20)
+        self.total_requests = 0
+        self.over_budget = 0
+        self.by_command: Counter = Counter()
+        self.ms_by_command: Counter = Counter()
+
+    def add(self, queries: RequestQueries, over_budget: bool) -> None:
+        self.requests.append((queries.commands, queries.total_ms, queries.docs, queries.bytes))
+        self.command_ms.extend(queries.durations)
+        self.total_requests += 1
+        self.over_budget += int(over_budget)
+        self.by_command.update(queries.by_command)
+        self.ms_by_command.update(queries.ms_by_command)
+
+    def summary(self, endpoint: str, top: int = 5) -> dict:
+        samples = len(self.requests) or 1
+        commands = [r[0] for r in self.requests]
+        mongo_ms = [r[1] for r in self.requests]
+        return {
+            "endpoint": endpoint,
+            "requests": self.total_requests,
+            "window": len(self.requests),
+            "avg_commands": sum(commands) / samples,
+            "max_commands": max(commands, default=0),
+            "avg_ms": sum(mongo_ms) / samples,
+            "p95_ms": _percentile(mongo_ms, 95),
+            "p95_command_ms": _percentile(self.command_ms, 95),
+            "avg_docs": sum(r[2] for r in self.requests) / samples,
+            "avg_bytes": sum(r[3] for r in self.requests) / samples,
+            "over_budget": self.over_budget,
+            "top_commands": [
+                {
+                    "command": label,
+                    "count": count,
+                    "total_ms": self.ms_by_command[label],
+                }
+                for label, count in self.by_command.most_common(top)
+            ],
+        }
+
+
+class QueryListener(monitoring.CommandListener):
+    """
+    pymongo command listener feeding `QueryStats`.
+
+    Runs synchronously in the thread that issued the command, so the current request
+    context identifies the endpoint. Commands outside a request are ignored.
+    """
+
+    def __init__(self, stats: "QueryStats"):
+        self.stats = stats
+
+    def started(self, event) -> None:
+        queries = self.stats.current()
+        if queries is None:
+            return
+        command = event.command
+        name = event.command_name
+        collection = command.get("collection") if name == "getMore" else command.get(name)
+        label = f"{collection}.{name}" if isinstance(collection, str) else name
+        queries.started(event.request_id, label)
+
+    def succeeded(self, event) -> None:
+        queries = self.stats.current()
+        if queries is None:
+            return
+        docs, size = self.stats.reply_size(event.reply, self.stats.measure_bytes)
+        queries.finished(event.request_id, event.duration_micros / 1000, docs, size)
+
+    def failed(self, event) -> None:
+        queries = self.stats.current()
+        if queries is None:
+            return
+        queries.finished(event.request_id, event.duration_micros / 1000, 0, 0)
+
+
+class QueryStats:
+    """
+    Per-endpoint MongoDB command statistics of this worker process.
+    """
+
+    ENVIRON_KEY = "coyote.query_stats"
+
+    def __init__(self):
+        self.app = None
+        self.enabled = False
+        self.max_queries = 0
+        self.window = 200
+        self.measure_bytes = False
+        self.listener = QueryListener(self)
+        self._lock = threading.Lock()
+        self._endpoints: dict[str, EndpointStats] = {}
+
+    def init_app(self, app) -> None:
+        """
+        Read the settings and register the end-of-request hook on the application.
+
+        Args:
+            app: The Flask application instance.
+        """
+        self.app = app
+        self.enabled = app.config.get("QUERY_STATS_ENABLED", True)
+        self.max_queries = app.config.get("QUERY_BUDGET_MAX_QUERIES", 0)
+        self.window = app.config.get("QUERY_STATS_WINDOW", 200)
+        self.measure_bytes = app.config.get("QUERY_STATS_MEASURE_BYTES", False)
+        if self.enabled:
+            app.after_request(self.after_request)
+
+    def event_listeners(self) -> list:
+        """
+        Return the listeners to pass to `pymongo.MongoClient`.
+        """
+        return [self.listener] if self.enabled else []
+
+    def current(self) -> RequestQueries | None:
+        """
+        Return the command counters of the current request, or None outside a request.
+
+        The counters are kept in the WSGI environ, which copied request contexts (section
+        loader threads) share with the request thread.
+        """
+        if not has_request_context():
+            return None
+        environ = request.environ
+        queries = environ.get(self.ENVIRON_KEY)
+        if queries is None:
+            queries = environ.setdefault(self.ENVIRON_KEY, RequestQueries())
+        return queries
+
+    @staticmethod
+    def reply_size(reply, measure_bytes: bool = False) -> tuple[int, int]:
+        """
+        Return the number of documents and, with `measure_bytes`, the BSON size of a
+        command reply.
+
+        Counting documents only reads the batch length. Measuring bytes encodes the
+        whole reply again, which is why it is opt-in.
+        """
+        cursor = reply.get("cursor") if isinstance(reply, dict) else None
+        if isinstance(cursor, dict):
+            docs = len(cursor.get("firstBatch") or cursor.get("nextBatch") or [])
+        else:
+            docs = 0
+        if not measure_bytes:
+            return docs, 0
+        try:
+            size = len(bson.encode(reply))
+        except Exception:
+            size = 0
+        return docs, size
+
+    def after_request(self, response: Response) -> Response:
+        """
+        Record the commands of the request and add the `Server-Timing` header.
+        """
+        queries = request.environ.get(self.ENVIRON_KEY)
+        endpoint = request.endpoint or "unknown"
+        if queries is None or endpoint == "static":
+            return response
+
+        with queries.lock:
+            over_budget = bool(self.max_queries) and queries.commands > self.max_queries
+            with self._lock:
+                stats = self._endpoints.get(endpoint)
+                if stats is None:
+                    stats = self._endpoints[endpoint] = EndpointStats(self.window)
+                stats.add(queries, over_budget)
+
+            desc = f"{queries.commands} queries, {queries.docs} docs"
+            if self.measure_bytes:
+                desc += f", {queries.bytes / 1024:.1f} KB"
+            timings = [f'mongo;dur={queries.total_ms:.1f};desc="{desc}"']
+            timings.extend(
+                f"section-{name};dur={ms:.1f}"
+                for name, ms in (g.get("section_timings") or {}).items()
+            )
+            response.headers.add("Server-Timing", ", ".join(timings))
+
+            record = {
+                "endpoint": endpoint,
+                "method": request.method,
+                "path": request.path,
+                "status": response.status_code,
+                "commands": queries.commands,
+                "mongo_ms": round(queries.total_ms, 1),
+                "docs": queries.docs,
+                "bytes": queries.bytes,
+                "over_budget": over_budget,
+            }
+            if over_budget:
+                record["top_commands"] = dict(queries.by_command.most_common(5))
+                query_logger.warning(json.dumps(record))
+            else:
+                query_logger.info(json.dumps(record))
+        return response
+
+    def stats(self) -> list[dict]:
+        """
+        Return the rolling statistics of every endpoint, most total MongoDB time first.
+
+        Returns:
+            list[dict]: One summary per endpoint, see `EndpointStats.summary`.
+        """
+        with self._lock:
+            summaries = [stats.summary(name) for name, stats in self._endpoints.items()]
+        return sorted(summaries, key=lambda s: -s["avg_ms"] * s["requests"])
+
+    def reset(self) -> None:
+        """
+        Drop the collected statistics of this worker.
+        """
+        with self._lock:
+            self._endpoints.clear()
@@ -0,0 +1,310 @@
+#  Copyright (c) 2025 Coyote3 Project Authors
+#  All rights reserved.
+#
+#  This source file is part of the Coyote3 codebase.
+#  The Coyote3 project provides a framework for genomic data analysis,
+#  interpretation, reporting, and clinical diagnostics.
+#
+#  Unauthorized use, distribution, or modification of this software or its
+#  components is strictly prohibited without prior written permission from
+#  the copyright holders.
+#
+
+"""
+ReferenceCache module for Coyote3
+=================================
+
+This module defines the `ReferenceCache` class, a read-through, versioned cache for
+static reference data (VEP metadata, CIViC genes, HGNC genes, OncoKB genes).
+
+Entries are loaded lazily from MongoDB and held in process memory. Each namespace has a
+version token stored in the shared flask-caching backend (Redis), so an invalidation in
+one worker is picked up by every other worker on its next version check. Tag namespaces
+(one per knowledge-base collection) hold no entries; their versions stamp the keys of the
+variant knowledge bundles cached in Redis.
+
+It is part of the `coyote.db` package.
+"""
+
+# -------------------------------------------------------------------------
+# Imports
+# -------------------------------------------------------------------------
+from collections import OrderedDict
+from typing import Any, Callable, Iterable
+import hashlib
+import threading
+import time
+import uuid
+
+
+# Sentinel used to tell "not cached" apart from a cached `None` (missing document)
+_MISSING = object()
+
+
+# -------------------------------------------------------------------------
+# Class Definition
+# -------------------------------------------------------------------------
+class ReferenceCache:
+    """
+    Read-through cache for reference data collections.
+
+    Values are cached per `(namespace, key)` in process memory. A namespace is dropped
+    from memory when its version token in the shared cache backend changes, which
+    happens through `invalidate()`. Cached documents are shared between requests and
+    must be treated as read-only by callers.
+    """
+
+    VERSION_KEY_PREFIX = "refdata_version"
+
+    # Namespaces served through the cache; `invalidate()` without a namespace resets all of them
+    NAMESPACES = (
+        "vep_metadata",
+        "civic_genes",
+        "hgnc",
+        "oncokb_genes",
+        "oncokb_action_genes",
+        "civic",
+        "oncokb",
+        "brca_exchange",
+        "iarc_tp53",
+        "expression",
+    )
+
+    # Tag namespaces only carry a version token, which is part of the keys of values cached
+    # elsewhere (e.g. the variant knowledge bundles in Redis). Invalidating a tag also
+    # invalidates the in-memory namespaces loaded from the same collections.
+    TAG_NAMESPACES = {
+        "civic": ("civic_genes",),
+        "oncokb": ("oncokb_genes", "oncokb_action_genes"),
+        "brca_exchange": (),
+        "iarc_tp53": (),
+        "expression": (),
+    }
+
+    def __init__(self):
+        self.app = None
+        self.max_entries = 20000
+        self.check_interval = 30
+        self.enabled = True
+        self._lock = threading.RLock()
+        self._entries: dict[str, OrderedDict] = {}
+        self._versions: dict[str, str] = {}
+        self._checked_at: dict[str, float] = {}
+        self._stats: dict[str, dict[str, int]] = {}
+
+    def init_app(self, app) -> None:
+        """
+        Bind the cache to the Flask application and read its settings.
+
+        Args:
+            app: The Flask application instance.
+        """
+        self.app = app
+        self.max_entries = app.config.get("REFERENCE_CACHE_MAX_ENTRIES", 20000)
+        self.check_interval = app.config.get("REFERENCE_CACHE_VERSION_CHECK_INTERVAL", 30)
+        self.enabled = app.config.get("REFERENCE_CACHE_ENABLED", True)
+
+    def _shared_cache(self):
+        """
+        Return the shared flask-caching backend, if it has been initialised.
+        """
+        return getattr(self.app, "cache", None) if self.app else None
+
+    def _version_key(self, namespace: str) -> str:
+        return f"{self.VERSION_KEY_PREFIX}:{namespace}"
+
+    def _read_shared_version(self, namespace: str) -> str:
+        """
+        Read the version token of a namespace from the shared cache backend.
+
+        Falls back to the locally known version when the backend is not available,
+        so the process keeps serving from memory instead of failing the request.
+        """
+        shared = self._shared_cache()
+        if shared is None:
+            return self._versions.get(namespace, "0")
+        try:
+            return shared.get(self._version_key(namespace)) or "0"
+        except Exception as exc:
+            self.app.logger.warning(f"[REFCACHE] Version lookup failed for {namespace}: {exc}")
+            return self._versions.get(namespace, "0")
+
+    def _ensure_current(self, namespace: str) -> dict:
+        """
+        Drop the in-memory entries of a namespace if its shared version has changed.
+
+        The shared version is checked at most once every `check_interval` seconds.
+
+        Returns:
+            dict: The (possibly fresh) entry map for the namespace.
+        """
+        now = time.monotonic()
+        if now - self._checked_at.get(namespace, 0.0) >= self.check_interval:
+            version = self._read_shared_version(namespace)
+            self._checked_at[namespace] = now
+            if self._versions.get(namespace) != version:
+                self._versions[namespace] = version
+                self._entries[namespace] = OrderedDict()
+        return self._entries.setdefault(namespace, OrderedDict())
+
+    def _count(self, namespace: str, counter: str, amount: int = 1) -> None:
+        stats = self._stats.setdefault(namespace, {"hits": 0, "misses": 0, "invalidations": 0})
+        stats[counter] += amount
+
+    def _store(self, entries: OrderedDict, key: Any, value: Any) -> None:
+        entries[key] = value
+        entries.move_to_end(key)
+        while len(entries) > self.max_entries:
+            entries.popitem(last=False)
+
+    def get(self, namespace: str, key: Any, loader: Callable[[Any], Any]) -> Any:
+        """
+        Return the cached value for `key`, loading it with `loader(key)` on a miss.
+
+        Args:
+            namespace (str): The reference data namespace (e.g. 'hgnc').
+            key (Any): A hashable lookup key within the namespace.
+            loader (Callable): Loads the value from MongoDB; `None` results are cached too.
+
+        Returns:
+            Any: The cached or freshly loaded value.
+        """
+        if not self.enabled:
+            return loader(key)
+
+        with self._lock:
+            entries = self._ensure_current(namespace)
+            value = entries.get(key, _MISSING)
+            if value is not _MISSING:
+                entries.move_to_end(key)
+                self._count(namespace, "hits")
+                return value
+            self._count(namespace, "misses")
+
+        value = loader(key)
+        with self._lock:
+            self._store(self._ensure_current(namespace), key, value)
+        return value
+
+    def get_many(
+        self,
+        namespace: str,
+        keys: Iterable[Any],
+        loader: Callable[[list], dict],
+    ) -> dict:
+        """
+        Return cached values for several keys, loading all misses with one `loader` call.
+
+        Args:
+            namespace (str): The reference data namespace.
+            keys (Iterable): Hashable lookup keys.
+            loader (Callable): Receives the list of missing keys and returns a mapping of
+                key to value. Keys absent from the mapping are cached as `None`.
+
+        Returns:
+            dict: A mapping of every requested key to its value (`None` when not found).
+        """
+        keys = list(dict.fromkeys(keys))
+        if not self.enabled:
+            loaded = loader(keys) if keys else {}
+            return {key: loaded.get(key) for key in keys}
+
+        found = {}
+        missing = []
+        with self._lock:
+            entries = self._ensure_current(namespace)
+            for key in keys:
+                value = entries.get(key, _MISSING)
+                if value is _MISSING:
+                    missing.append(key)
+                else:
+                    entries.move_to_end(key)
+                    found[key] = value
+            self._count(namespace, "hits", len(found))
+            self._count(namespace, "misses", len(missing))
+
+        if missing:
+            loaded = loader(missing)
+            with self._lock:
+                entries = self._ensure_current(namespace)
+                for key in missing:
+                    found[key] = loaded.get(key)
+                    self._store(entries, key, found[key])
+
+        return found
+
+    def version_stamp(self, namespaces: Iterable[str]) -> str:
+        """
+        Return a short stamp of the current versions of several namespaces.
+
+        The stamp changes whenever one of the namespaces is invalidated, so it can be used
+        in the keys of values derived from these namespaces and cached elsewhere.
+
+        Args:
+            namespaces (Iterable[str]): The namespaces (usually tags) the value depends on.
+
+        Returns:
+            str: A stamp of the namespace versions.
+        """
+        with self._lock:
+            versions = []
+            for ns in namespaces:
+                self._ensure_current(ns)
+                versions.append(f"{ns}={self._versions.get(ns, '0')}")
+        return hashlib.sha1(";".join(versions).encode()).hexdigest()[:16]
+
+    def invalidate(self, namespace: str | None = None) -> list[str]:
+        """
+        Invalidate one namespace, or every known namespace when `namespace` is None.
+
+        A new version token is written to the shared cache backend so all workers drop
+        their in-memory entries on their next version check. The local process drops its
+        entries immediately.
+
+        Args:
+            namespace (str | None): The namespace to invalidate, or None for all.
+
+        Returns:
+            list[str]: The invalidated namespaces.
+        """
+        with self._lock:
+            namespaces = (
+                [namespace, *self.TAG_NAMESPACES.get(namespace, ())]
+                if namespace
+                else sorted(set(self.NAMESPACES) | set(self._entries))
+            )
+            shared = self._shared_cache()
+            for ns in namespaces:
+                version = uuid.uuid4().hex
+                if shared is not None:
+                    try:
+                        shared.set(self._version_key(ns), version, timeout=0)
+                    except Exception as exc:
+                        self.app.logger.warning(
+                            f"[REFCACHE] Could not publish new version for {ns}: {exc}"
+                        )
+                self._versions[ns] = version
+                self._checked_at[ns] = time.monotonic()
+                self._entries[ns] = OrderedDict()
+                self._count(ns, "invalidations")
+
+        if self.app:
+            self.app.logger.info(f"[REFCACHE] Invalidated namespaces: {namespaces}")
+        return namespaces
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """
+        Return hit/miss/invalidation counters and entry counts per namespace.
+
+        Returns:
+            dict[str, dict[str, Any]]: Counters keyed by namespace.
+        """
+        with self._lock:
+            return {
+                ns: {
+                    **counters,
+                    "entries": len(self._entries.get(ns, {})),
+                    "version": self._versions.get(ns),
+                }
+                for ns, counters in self._stats.items()
+            }
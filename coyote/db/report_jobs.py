@@ -0,0 +1,315 @@
+#  Copyright (c) 2025 Coyote3 Project Authors
+#  All rights reserved.
+#
+#  This source file is part of the Coyote3 codebase.
+#  The Coyote3 project provides a framework for genomic data analysis,
+#  interpretation, reporting, and clinical diagnostics.
+#
+#  Unauthorized use, distribution, or modification of this software or its
+#  components is strictly prohibited without prior written permission from
+#  the copyright holders.
+#
+
+"""
+ReportJobsHandler module for Coyote3
+====================================
+
+This module defines the `ReportJobsHandler` class used for the background report
+rendering queue in MongoDB.
+
+One document per job, keyed by an idempotent job key (e.g. `dna_report:<sample>:<num>`):
+
+    {
+        "_id": "dna_report:65f0...:3",
+        "kind": "dna_report",
+        "status": "queued" | "running" | "done" | "failed",
+        "sample_id": "...", "sample_name": "...",
+        "params": {...}, "created_by": "<username>", "user_id": "...", "base_url": "...",
+        "attempts": 0, "worker": None, "result": None, "error": None, "checkpoint": None,
+        "time_created": ISODate(...), "time_started": None, "time_heartbeat": None,
+        "time_finished": None
+    }
+
+Submitting the same key again returns the existing job instead of queueing a second
+render, and workers claim jobs atomically, so several processes can share the queue.
+The running worker refreshes `time_heartbeat`; only jobs whose heartbeat stopped are
+claimed again, and only the worker holding a job can record its outcome. Runners keep
+what they already persisted in `checkpoint`, so a claimed-again job resumes instead of
+starting over.
+
+It is part of the `coyote.db` package and extends the base handler functionality.
+MongoDB 3.4 compatible.
+"""
+
+# -------------------------------------------------------------------------
+# Imports
+# -------------------------------------------------------------------------
+from datetime import timedelta
+from pymongo import ASCENDING, DESCENDING, ReturnDocument
+from coyote.db.base import BaseHandler
+from coyote.util.common_utility import CommonUtility
+
+
+# -------------------------------------------------------------------------
+# Class Definition
+# -------------------------------------------------------------------------
+class ReportJobsHandler(BaseHandler):
+    """
+    The `ReportJobsHandler` class manages the `report_jobs` collection, the queue of
+    report renders processed by the background workers in `coyote.util.report_queue`.
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+    def __init__(self, adapter):
+        """
+        Initialize the handler with a given adapter and bind the collection.
+        """
+        super().__init__(adapter)
+        self.set_collection(self.adapter.report_jobs_collection)
+
+    def ensure_indexes(self) -> None:
+        """
+        Create the indexes used when claiming jobs and listing the jobs of a sample.
+        """
+        # Workers claim the oldest queued (or stale running) job
+        self.create_index([("status", ASCENDING), ("time_created", ASCENDING)], name="ix_status")
+        # Job history of a sample
+        self.create_index(
+            [("sample_id", ASCENDING), ("time_created", DESCENDING)], name="ix_sample_created"
+        )
+
+    def enqueue(
+        self,
+        job_key: str,
+        kind: str,
+        sample: dict,
+        params: dict | None = None,
+        created_by: str | None = None,
+        user_id: str | None = None,
+        base_url: str | None = None,
+    ) -> tuple[dict, bool]:
+        """
+        Queue a job unless a job with the same key already exists.
+
+        A failed job with the same key is queued again; a queued, running or finished job
+        is returned as is, so repeated submits never render the same report twice.
+
+        Args:
+            job_key (str): The idempotent job key.
+            kind (str): The runner that processes the job (e.g. `dna_report`).
+            sample (dict): The sample document the job belongs to.
+            params (dict | None): Runner specific parameters.
+            created_by (str | None): Username of the submitting user.
+            user_id (str | None): Id of the submitting user; the job runs as this user.
+            base_url (str | None): Host URL of the submitting request, used for external links.
+
+        Returns:
+            tuple[dict, bool]: The job document and whether a new render was queued.
+        """
+        now = CommonUtility.utc_now()
+        result = self.get_collection().update_one(
+            {"_id": job_key},
+            {
+                "$setOnInsert": {
+                    "kind": kind,
+                    "status": self.QUEUED,
+                    "sample_id": str(sample.get("_id")),
+                    "sample_name": sample.get("name"),
+                    "params": params or {},
+                    "created_by": created_by,
+                    "user_id": user_id,
+                    "base_url": base_url,
+                    "attempts": 0,
+                    "worker": None,
+                    "result": None,
+                    "error": None,
+                    "checkpoint": None,
+                    "time_created": now,
+                    "time_started": None,
+                    "time_heartbeat": None,
+                    "time_finished": None,
+                }
+            },
+            upsert=True,
+        )
+        created = result.upserted_id is not None
+        if not created:
+            job = self.get_collection().find_one_and_update(
+                {"_id": job_key, "status": self.FAILED},
+                {
+                    "$set": {
+                        "status": self.QUEUED,
+                        "created_by": created_by,
+                        "user_id": user_id,
+                        "base_url": base_url,
+                        "attempts": 0,
+                        "error": None,
+                        "time_created": now,
+                        "time_started": None,
+                        "time_heartbeat": None,
+                        "time_finished": None,
+                    }
+                },
+                return_document=ReturnDocument.AFTER,
+            )
+            if job:
+                return job, True
+        return self.get_job(job_key), created
+
+    def claim_next(
+        self,
+        worker: str,
+        stale_after: int = 600,
+        max_attempts: int = 3,
+        job_key: str | None = None,
+    ) -> dict | None:
+        """
+        Atomically claim the oldest runnable job.
+
+        Running jobs without a heartbeat for more than `stale_after` seconds are considered
+        abandoned (e.g. the process was restarted) and are claimed again until they have been
+        attempted `max_attempts` times.
+
+        Args:
+            worker (str): Name of the claiming worker, stored on the job.
+            stale_after (int): Seconds without a heartbeat after which a running job can be
+                claimed again.
+            max_attempts (int): Maximum number of attempts per job.
+            job_key (str | None): Claim only this job.
+
+        Returns:
+            dict | None: The claimed job, or None if nothing is runnable.
+        """
+        now = CommonUtility.utc_now()
+        query = {
+            "$or": [
+                {"status": self.QUEUED},
+                {
+                    "status": self.RUNNING,
+                    "time_heartbeat": {"$lt": now - timedelta(seconds=stale_after)},
+                },
+            ],
+            "attempts": {"$lt": max_attempts},
+        }
+        if job_key is not None:
+            query["_id"] = job_key
+        return self.get_collection().find_one_and_update(
+            query,
+            {
+                "$set": {
+                    "status": self.RUNNING,
+                    "worker": worker,
+                    "time_started": now,
+                    "time_heartbeat": now,
+                },
+                "$inc": {"attempts": 1},
+            },
+            sort=[("time_created", ASCENDING)],
+            return_document=ReturnDocument.AFTER,
+        )
+
+    def fail_abandoned(self, stale_after: int = 600, max_attempts: int = 3) -> int:
+        """
+        Mark stale running jobs that used up their attempts as failed.
+
+        Returns:
+            int: The number of jobs marked as failed.
+        """
+        now = CommonUtility.utc_now()
+        result = self.get_collection().update_many(
+            {
+                "status": self.RUNNING,
+                "time_heartbeat": {"$lt": now - timedelta(seconds=stale_after)},
+                "attempts": {"$gte": max_attempts},
+            },
+            {
+                "$set": {
+                    "status": self.FAILED,
+                    "error": "The report job was abandoned by its worker.",
+                    "time_finished": now,
+                }
+            },
+        )
+        return result.modified_count
+
+    def heartbeat(self, job_key: str, worker: str) -> bool:
+        """
+        Refresh the heartbeat of a running job, so it is not claimed again.
+
+        Returns:
+            bool: False if the job is no longer held by `worker`.
+        """
+        result = self.get_collection().update_one(
+            {"_id": job_key, "status": self.RUNNING, "worker": worker},
+            {"$set": {"time_heartbeat": CommonUtility.utc_now()}},
+        )
+        return result.matched_count > 0
+
+    def save_checkpoint(self, job_key: str, worker: str, checkpoint: dict) -> None:
+        """
+        Store what a runner has persisted so far (e.g. the report id and file), so an
+        attempt that claims the job again can resume from it.
+        """
+        self.get_collection().update_one(
+            {"_id": job_key, "worker": worker}, {"$set": {"checkpoint": checkpoint}}
+        )
+
+    def mark_done(self, job_key: str, worker: str, result: dict | None = None) -> None:
+        """
+        Mark a job held by `worker` as finished and store the runner result (e.g. the
+        report id).
+        """
+        self.get_collection().update_one(
+            {"_id": job_key, "worker": worker},
+            {
+                "$set": {
+                    "status": self.DONE,
+                    "result": result or {},
+                    "error": None,
+                    "time_finished": CommonUtility.utc_now(),
+                }
+            },
+        )
+
+    def mark_failed(self, job_key: str, worker: str, error: str) -> None:
+        """
+        Mark a job held by `worker` as failed with a user facing error message.
+        """
+        self.get_collection().update_one(
+            {"_id": job_key, "worker": worker},
+            {
+                "$set": {
+                    "status": self.FAILED,
+                    "error": error,
+                    "time_finished": CommonUtility.utc_now(),
+                }
+            },
+        )
+
+    def get_job(self, job_key: str) -> dict | None:
+        """
+        Return a job by its key.
+        """
+        return self.get_collection().find_one({"_id": job_key})
+
+    def get_sample_jobs(self, sample_id: str, limit: int = 20) -> list[dict]:
+        """
+        Return the most recent jobs of a sample, newest first.
+
+        Args:
+            sample_id (str): The sample ObjectId as a string.
+            limit (int): Maximum number of jobs to return.
+
+        Returns:
+            list[dict]: The job documents.
+        """
+        return list(
+            self.get_collection()
+            .find({"sample_id": sample_id})
+            .sort("time_created", DESCENDING)
+            .limit(limit)
+        )
@@ -180,10 +180,8 @@ class ReportedVariantsHandler(BaseHandler):
         Safe to call multiple times; MongoDB will keep existing indexes.
         Compatible with MongoDB 3.4.
         """
-        col = self.get_collection()
-
         # Prevent duplicates: same variant cannot be recorded twice in the same report
-        col.create_index(
+        self.create_index(
             [
                 ("sample_oid", ASCENDING),
                 ("report_oid", ASCENDING),
@@ -191,38 +189,32 @@ class ReportedVariantsHandler(BaseHandler):
             ],
             unique=True,
             name="uq_sample_report_simple_id",
-            background=True,
         )
 
         # Fast "open report": fetch all reported variants for a given sample+report
-        col.create_index(
+        self.create_index(
             [("sample_oid", ASCENDING), ("report_oid", ASCENDING)],
             name="ix_sample_report",
-            background=True,
         )
 
         # Cross-sample variant queries by genomic identity + tier
-        col.create_index(
+        self.create_index(
             [("simple_id", ASCENDING), ("tier", ASCENDING)],
             name="ix_simple_id_tier",
-            background=True,
         )
 
         # Protein / transcript queries (tier distribution, most common, etc.)
-        col.create_index(
+        self.create_index(
             [("gene", ASCENDING), ("hgvsp", ASCENDING), ("tier", ASCENDING)],
             name="ix_gene_hgvsp_tier",
-            background=True,
         )
-        col.create_index(
+        self.create_index(
             [("gene", ASCENDING), ("hgvsc", ASCENDING), ("tier", ASCENDING)],
             name="ix_gene_hgvsc_tier",
-            background=True,
         )
 
         # Optional: time-based queries (recent reports, time-window stats)
-        col.create_index(
+        self.create_index(
             [("created_on", DESCENDING)],
             name="ix_created_on_desc",
-            background=True,
         )
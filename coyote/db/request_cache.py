@@ -0,0 +1,116 @@
+#  Copyright (c) 2025 Coyote3 Project Authors
+#  All rights reserved.
+#
+#  This source file is part of the Coyote3 codebase.
+#  The Coyote3 project provides a framework for genomic data analysis,
+#  interpretation, reporting, and clinical diagnostics.
+#
+#  Unauthorized use, distribution, or modification of this software or its
+#  components is strictly prohibited without prior written permission from
+#  the copyright holders.
+#
+
+"""
+RequestCache module for Coyote3
+===============================
+
+This module defines the `RequestCache` class, a request-scoped identity map of the
+documents a request reads repeatedly (samples, assay configs, schemas, ASPs and
+in-silico gene lists). It is exposed as `store.request_cache`.
+
+Entries live on `flask.g` and disappear with the request, so nothing is shared
+between requests or users. Every lookup returns its own copy, so callers can modify
+the documents they get (views add filters, drop `_id`, ...) without affecting later
+lookups. Handlers evict their namespace after every write, so a read after a write in
+the same request sees the new document. Outside a request (scripts, app context only)
+every lookup goes to MongoDB.
+
+It is part of the `coyote.db` package.
+"""
+
+# -------------------------------------------------------------------------
+# Imports
+# -------------------------------------------------------------------------
+from copy import deepcopy
+from typing import Any, Callable, Hashable
+from flask import g, has_request_context
+
+
+_MISSING = object()
+
+
+# -------------------------------------------------------------------------
+# Class Definition
+# -------------------------------------------------------------------------
+class RequestCache:
+    """
+    Memoizes document lookups for the life of a request.
+
+    Entries are grouped in namespaces (e.g. `sample`, `aspc`); a write evicts the whole
+    namespace of the handler that wrote. The cache keeps its own copy of every document
+    and hands out copies, so modifying a returned document never changes the cache.
+    """
+
+    G_ATTR = "_coyote_request_cache"
+
+    def __init__(self):
+        self.enabled = True
+
+    def init_app(self, app) -> None:
+        """
+        Read the cache settings from the Flask application.
+
+        Args:
+            app: The Flask application instance.
+        """
+        self.enabled = app.config.get("REQUEST_CACHE_ENABLED", True)
+
+    def _namespace(self, namespace: str) -> dict | None:
+        """
+        Return the entries of a namespace for the current request, or None outside one.
+        """
+        if not self.enabled or not has_request_context():
+            return None
+        entries = g.setdefault(self.G_ATTR, {})
+        return entries.setdefault(namespace, {})
+
+    def get_or_load(self, namespace: str, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value of `key`, loading and caching it on the first lookup.
+
+        Args:
+            namespace (str): The document namespace, e.g. `sample`.
+            key (Hashable): The lookup key within the namespace.
+            loader (Callable[[], Any]): Reads the value from MongoDB; `None` results are
+                cached too.
+
+        Returns:
+            Any: A copy of the cached value, or the freshly loaded value.
+        """
+        entries = self._namespace(namespace)
+        if entries is None:
+            return loader()
+        value = entries.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            entries[key] = deepcopy(value)
+            return value
+        return deepcopy(value)
+
+    def put(self, namespace: str, key: Hashable, value: Any) -> None:
+        """
+        Cache a value under another key, e.g. a sample loaded by name under its id.
+        """
+        entries = self._namespace(namespace)
+        if entries is not None:
+            entries[key] = deepcopy(value)
+
+    def evict(self, namespace: str) -> None:
+        """
+        Drop all entries of a namespace in the current request.
+
+        Args:
+            namespace (str): The document namespace written to.
+        """
+        if has_request_context():
+            g.get(self.G_ATTR, {}).pop(namespace, None)
@@ -103,6 +103,7 @@ class RolesHandler(BaseHandler):
             Any
         """
         self.get_collection().insert_one(role_data)
+        self.adapter.identity_cache.bump()
 
     def update_role(self, role_id: str, role_data: dict) -> dict:
         """
@@ -118,6 +119,7 @@ class RolesHandler(BaseHandler):
             dict: The updated role document.
         """
         self.get_collection().update_one({"_id": role_id}, {"$set": role_data})
+        self.adapter.identity_cache.bump()
         return self.get_role(role_id)
 
     def get_role(self, role_id: str) -> dict:
@@ -147,6 +149,7 @@ class RolesHandler(BaseHandler):
             Any: The result of the delete operation.
         """
         self.get_collection().delete_one({"_id": role_id})
+        self.adapter.identity_cache.bump()
 
     def toggle_role_active(self, role_id: str, active_status: bool) -> Any:
         """
@@ -161,7 +164,9 @@ class RolesHandler(BaseHandler):
         Returns:
             Any: The result of the update operation.
         """
-        return self.toggle_active(role_id, active_status)
+        result = self.toggle_active(role_id, active_status)
+        self.adapter.identity_cache.bump()
+        return result
 
     def get_all_roles_plus_permissions(self) -> list:
         """
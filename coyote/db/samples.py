@@ -24,7 +24,9 @@ It is part of the `coyote.db` package and extends the base handler functionality
 # -------------------------------------------------------------------------
 # Imports
 # -------------------------------------------------------------------------
+from bson.errors import InvalidId
 from bson.objectid import ObjectId
+from pymongo import ASCENDING, DESCENDING
 from coyote.db.base import BaseHandler
 from datetime import datetime
 from flask_login import current_user
@@ -52,6 +54,50 @@ class SampleHandler(BaseHandler):
         super().__init__(adapter)
         self.set_collection(self.adapter.samples_collection)
 
+    STAMP_KEY_PREFIX = "samples_stamp"
+    REQUEST_CACHE_NAMESPACE = "sample"
+
+    # Fields rendered by the samples home lists; full documents carry filters and comments
+    LIST_PROJECTION = {
+        "name": 1,
+        "assay": 1,
+        "profile": 1,
+        "subpanel": 1,
+        "sample_no": 1,
+        "sequencing_scope": 1,
+        "omics_layer": 1,
+        "case_id": 1,
+        "control_id": 1,
+        "case.clarity_id": 1,
+        "control.clarity_id": 1,
+        "bam": 1,
+        "QC": 1,
+        "time_added": 1,
+        "report_num": 1,
+        "comments.hidden": 1,
+        "reports.report_id": 1,
+        "reports.report_num": 1,
+        "reports.time_created": 1,
+    }
+
+    def ensure_indexes(self) -> None:
+        """
+        Create indexes for the sample lists on the home pages and lookups by name.
+        """
+        # Sample lists filtered by assay/profile/report status, newest first
+        self.create_index(
+            [
+                ("assay", ASCENDING),
+                ("profile", ASCENDING),
+                ("report_num", ASCENDING),
+                ("time_added", DESCENDING),
+            ],
+            name="ix_assay_profile_report_num_time_added",
+        )
+
+        # Sample lookup by name
+        self.create_index([("name", ASCENDING)], name="ix_name")
+
     def _query_samples(
         self,
         user_assays: list,
@@ -60,6 +106,7 @@ class SampleHandler(BaseHandler):
         search_str: str,
         limit=None,
         time_limit=None,
+        after: str | None = None,
     ):
         """
         Query samples based on user groups, report status, search string, and optional time limit.
@@ -69,14 +116,19 @@ class SampleHandler(BaseHandler):
             search_str (str): Search string to filter samples.
             limit (int, optional): Maximum number of samples to return (default: None).
             time_limit (datetime, optional): Time constraint for filtering samples (default: None).
+            after (str, optional): Keyset cursor (see `list_cursor`); only samples added
+                before the cursor sample are returned.
         Returns:
-            list: List of sample records matching the specified criteria.
+            list: List of sample records matching the specified criteria, newest first,
+            projected to `LIST_PROJECTION`.
         Notes:
             - If `report` is True, filters samples with report_num > 0 and time_created > time_limit.
             - If `report` is False, filters samples with report_num = 0 or not present.
             - If `search_str` is provided, filters samples by name using regex.
+            - Sort, limit and projection run in MongoDB on the
+              (assay, profile, report_num, time_added) index.
         """
-        query: dict[str, dict[str, Any]] = {
+        query: dict[str, Any] = {
             "assay": {"$in": user_assays},
             "profile": {"$in": user_envs},
         }
@@ -86,22 +138,99 @@ class SampleHandler(BaseHandler):
             if time_limit:
                 query["reports"] = {"$elemMatch": {"time_created": {"$gt": time_limit}}}
         else:
-            query["$or"] = [
-                {"report_num": {"$exists": False}},
-                {"report_num": 0},
-            ]
+            query["report_num"] = {"$in": [0, None]}
 
         if search_str:
             query["name"] = {"$regex": search_str}
 
-        app.home_logger.debug(f"Sample query: {query}")
+        keyset = self._parse_cursor(after)
+        if keyset:
+            time_added, oid = keyset
+            # Missing time_added sorts lowest, so undated samples come after all dated ones
+            if time_added is None:
+                query["time_added"] = None
+                query["_id"] = {"$lt": oid}
+            else:
+                query["$or"] = [
+                    {"time_added": {"$lt": time_added}},
+                    {"time_added": time_added, "_id": {"$lt": oid}},
+                    {"time_added": None},
+                ]
 
-        samples = list(self.get_collection().find(query).sort("time_added", -1))
+        app.home_logger.debug(f"Sample query: {query}")
 
+        cursor = (
+            self.get_collection()
+            .find(query, self.LIST_PROJECTION)
+            .sort([("time_added", DESCENDING), ("_id", DESCENDING)])
+        )
         if limit:
-            samples = samples[:limit]
+            cursor = cursor.limit(limit)
 
-        return samples
+        return list(cursor)
+
+    @staticmethod
+    def list_cursor(sample: dict) -> str:
+        """
+        Return the keyset cursor of a sample in the home lists (`<time_added>_<_id>`).
+
+        Samples without `time_added` sort after all dated ones and get `_<_id>`.
+        """
+        time_added = sample.get("time_added")
+        stamp = time_added.isoformat() if isinstance(time_added, datetime) else ""
+        return f"{stamp}_{sample['_id']}"
+
+    @staticmethod
+    def _parse_cursor(cursor: str | None) -> tuple[datetime | None, ObjectId] | None:
+        """
+        Parse a keyset cursor created by `list_cursor`; invalid cursors are logged and ignored.
+
+        Returns:
+            tuple[datetime | None, ObjectId] | None: The `time_added` (None for an undated
+            sample) and `_id` to continue after, or None for no or an invalid cursor.
+        """
+        if not cursor:
+            return None
+        try:
+            stamp, oid = cursor.rsplit("_", 1)
+            return (datetime.fromisoformat(stamp) if stamp else None), ObjectId(oid)
+        except (ValueError, TypeError, InvalidId):
+            app.logger.warning(f"[SAMPLES] Ignoring invalid list cursor {cursor!r}")
+            return None
+
+    def _assay_stamps(self, assays: list) -> list | None:
+        """
+        Read the sample list change stamps of several assays from the shared cache backend.
+
+        Returns:
+            list | None: The stamps (`"0"` if never bumped), or None if they cannot be read.
+        """
+        cache = getattr(app, "cache", None)
+        if cache is None:
+            return None
+        try:
+            stamps = cache.get_many(*[f"{self.STAMP_KEY_PREFIX}:{a}" for a in sorted(assays)])
+        except Exception as exc:
+            app.logger.warning(f"[SAMPLES CACHE] Stamp lookup failed: {exc}")
+            return None
+        return [stamp or "0" for stamp in stamps]
+
+    def bump_samples_stamp(self, assay: str | None) -> None:
+        """
+        Retire the cached sample lists that include an assay.
+
+        Called when a sample of the assay is added, reported or deleted.
+
+        Args:
+            assay (str | None): The assay of the changed sample.
+        """
+        cache = getattr(self.app, "cache", None)
+        if cache is None or not assay:
+            return
+        try:
+            cache.set(f"{self.STAMP_KEY_PREFIX}:{assay}", ObjectId().binary.hex(), timeout=0)
+        except Exception as exc:
+            self.app.logger.warning(f"[SAMPLES CACHE] Could not bump stamp for {assay}: {exc}")
 
     def get_samples(
         self,
@@ -115,6 +244,7 @@ class SampleHandler(BaseHandler):
         use_cache: bool = True,
         cache_timeout: int = 120,
         reload: bool = False,
+        after: str | None = None,
     ) -> Any | list:
         """
         Retrieve sample records for the specified user groups, optionally using caching for performance.
@@ -127,15 +257,22 @@ class SampleHandler(BaseHandler):
             time_limit (optional): Time constraint for filtering samples (default: None).
             use_cache (bool, optional): Whether to use cache for retrieving samples (default: True).
             cache_timeout (int, optional): Cache timeout in seconds (default: 120).
+            after (str, optional): Keyset cursor of the last sample of the previous page.
         Returns:
             list: List of sample records matching the specified criteria.
         Notes:
-            - Uses a cache key generated from user_assays, status, and search_str.
+            - Uses a cache key generated from the arguments and the change stamps of the
+              assays, so saving a report, deleting or recording a sample retires the lists
+              that include its assay.
             - If caching is enabled and a cache hit occurs, returns cached samples.
             - On cache miss or if caching is disabled, queries the database and updates the cache.
         """
         cache_timeout = app.config.get("CACHE_DEFAULT_TIMEOUT", 0)
 
+        # Part of the cache key (all locals are)
+        assay_stamps = self._assay_stamps(user_assays) if use_cache else None
+        use_cache = use_cache and assay_stamps is not None
+
         cache_key = CommonUtility.generate_sample_cache_key(**locals())
 
         if use_cache:
@@ -158,6 +295,7 @@ class SampleHandler(BaseHandler):
             search_str=search_str,
             limit=limit,
             time_limit=time_limit,
+            after=after,
         )
 
         if use_cache:
@@ -188,7 +326,8 @@ class SampleHandler(BaseHandler):
         """
         Retrieve a sample document by its name.
 
-        This method fetches a sample document from the database using its name.
+        This method fetches a sample document from the database using its name,
+        once per request (see `RequestCache`).
 
         Args:
             name (str): The name of the sample to retrieve.
@@ -196,13 +335,23 @@ class SampleHandler(BaseHandler):
         Returns:
             dict | None: The sample document if found, otherwise None.
         """
-        return self.get_collection().find_one({"name": name})
+        sample = self.adapter.request_cache.get_or_load(
+            self.REQUEST_CACHE_NAMESPACE,
+            ("name", name),
+            lambda: self.get_collection().find_one({"name": name}),
+        )
+        if sample:
+            self.adapter.request_cache.put(
+                self.REQUEST_CACHE_NAMESPACE, ("id", str(sample["_id"])), sample
+            )
+        return sample
 
     def get_sample_by_id(self, id: str) -> dict | None:
         """
         Retrieve a sample document by its unique identifier.
 
-        This method fetches a sample document from the database using its unique identifier.
+        This method fetches a sample document from the database using its unique identifier,
+        once per request (see `RequestCache`).
 
         Args:
             id (str): The unique identifier (ObjectId) of the sample.
@@ -210,12 +359,17 @@ class SampleHandler(BaseHandler):
         Returns:
             dict | None: The sample document if found, otherwise None.
         """
-        try:
-            sample = self.get_collection().find_one({"_id": ObjectId(id)})
-        except Exception as e:
-            app.logger.error(f"Error retrieving sample by id {id}: {e}")
-            sample = None
-        return sample
+
+        def load() -> dict | None:
+            try:
+                return self.get_collection().find_one({"_id": ObjectId(id)})
+            except Exception as e:
+                app.logger.error(f"Error retrieving sample by id {id}: {e}")
+                return None
+
+        return self.adapter.request_cache.get_or_load(
+            self.REQUEST_CACHE_NAMESPACE, ("id", str(id)), load
+        )
 
     def get_sample_name(self, id: str) -> str | None:
         """
@@ -286,6 +440,7 @@ class SampleHandler(BaseHandler):
             {"_id": ObjectId(sample_id)},
             {"$set": {"filters": default_filters}},
         )
+        self.evict_request_cache()
 
     def update_sample_filters(self, sample_id: str, filters: dict) -> None:
         """
@@ -304,6 +459,7 @@ class SampleHandler(BaseHandler):
             {"_id": ObjectId(sample_id)},
             {"$set": {"filters": filters}},
         )
+        self.evict_request_cache()
 
     # TODO: Remove
     def update_temp_isgl(self, sample_id: str, temp_isgl: list) -> None:
@@ -323,12 +479,15 @@ class SampleHandler(BaseHandler):
             {"_id": ObjectId(sample_id)},
             {"$set": {"filters.temp_isgl": temp_isgl}},
         )
+        self.evict_request_cache()
 
     def update_sample(self, sample_id: ObjectId, sample_doc: dict) -> None:
         """
         Update sample document
         """
-        return self.get_collection().replace_one({"_id": sample_id}, sample_doc)
+        result = self.get_collection().replace_one({"_id": sample_id}, sample_doc)
+        self.evict_request_cache()
+        return result
 
     def add_sample_comment(self, sample_id: str, comment_doc: dict) -> None:
         """
@@ -397,7 +556,7 @@ class SampleHandler(BaseHandler):
         """
         return self.get_latest_comment(sample_id)
 
-    def get_all_sample_counts(self, report: bool | None = None) -> list:
+    def get_all_sample_counts(self, report: bool | None = None) -> int:
         """
         Retrieve the total count of all samples in the database.
 
@@ -407,35 +566,13 @@ class SampleHandler(BaseHandler):
         - If `report` is False, it retrieves the count of samples without reports.
 
         Returns:
-            list: A list containing the total count of samples based on the specified criteria.
+            int: The count of samples based on the specified criteria.
         """
-        samples = []
         if report is None:
-            samples = self.get_collection().find().sort("time_added", -1).count()
-        elif report:
-            samples = (
-                self.get_collection()
-                .find({"report_num": {"$gt": 0}})
-                .sort("time_added", -1)
-                .count()
-            )
-        elif not report:
-            samples = (
-                self.get_collection()
-                .find(
-                    {
-                        "$or": [
-                            {"report_num": 0},
-                            {"report_num": None},
-                            {"report_num": {"$exists": False}},
-                        ]
-                    }
-                )
-                .sort("time_added", -1)
-                .count()
-            )
-
-        return samples
+            return self.get_collection().estimated_document_count()
+        if report:
+            return self.get_collection().count_documents({"report_num": {"$gt": 0}})
+        return self.get_collection().count_documents({"report_num": {"$in": [0, None]}})
 
     def user_sample_counts_by_assay(self, report: bool | None = None, assays: list = None) -> dict:
         """
@@ -557,7 +694,11 @@ class SampleHandler(BaseHandler):
         Returns:
             None
         """
-        return self.get_collection().delete_one({"_id": ObjectId(sample_oid)})
+        sample = self.get_collection().find_one({"_id": ObjectId(sample_oid)}, {"assay": 1})
+        result = self.get_collection().delete_one({"_id": ObjectId(sample_oid)})
+        self.evict_request_cache()
+        self.bump_samples_stamp((sample or {}).get("assay"))
+        return result
 
     def save_report(
         self, sample_id: str, report_num: int, report_id: str, filepath: str
@@ -593,10 +734,52 @@ class SampleHandler(BaseHandler):
                 "$set": {"report_num": report_num},
             },
         )
+        self.evict_request_cache()
         if result.get("ok"):
+            sample = self.get_collection().find_one({"name": sample_id}, {"assay": 1, "profile": 1})
+            self.bump_samples_stamp((sample or {}).get("assay"))
+            if sample and report_num == 1:
+                self.adapter.dashboard_stats_handler.record_first_report(sample)
             return report_oid
         return None
 
+    def save_pdf_report(self, sample_id: str, report_num: int, filepath: str) -> ObjectId | None:
+        """
+        Register a PDF report (RNA) in a sample document.
+
+        Args:
+            sample_id (str): The name of the sample.
+            report_num (int): The new running report number.
+            filepath (str): The file path where the PDF is stored.
+
+        Returns:
+            ObjectId | None: The id of the report entry, or None if the sample was not found.
+        """
+        report_oid = ObjectId()
+        result = self.get_collection().update_one(
+            {"name": sample_id},
+            {
+                "$push": {
+                    "reports": {
+                        "_id": report_oid,
+                        "report_num": report_num,
+                        "filepath": filepath,
+                        "author": current_user.get_id(),
+                        "time_created": CommonUtility.utc_now(),
+                    }
+                },
+                "$set": {"report_num": report_num},
+            },
+        )
+        self.evict_request_cache()
+        if not result.matched_count:
+            return None
+        sample = self.get_collection().find_one({"name": sample_id}, {"assay": 1, "profile": 1})
+        self.bump_samples_stamp((sample or {}).get("assay"))
+        if sample and report_num == 1:
+            self.adapter.dashboard_stats_handler.record_first_report(sample)
+        return report_oid
+
     def get_report(self, sample_id: str, report_id: str) -> dict | None:
         """
         Retrieve a specific report from the `reports` array of a sample document.
@@ -39,6 +39,8 @@ class SchemaHandler(BaseHandler):
     efficient interaction with the MongoDB collection storing schema data.
     """
 
+    REQUEST_CACHE_NAMESPACE = "schema"
+
     def __init__(self, adapter):
         """
         Initialize the handler with a given adapter and bind the collection.
@@ -63,9 +65,14 @@ class SchemaHandler(BaseHandler):
             schema_id (str): The unique identifier of the schema to retrieve.
 
         Returns:
-            dict: The schema document if found, otherwise None.
+            dict: The schema document if found, otherwise None. Memoized for the request
+            (see `RequestCache`).
         """
-        return self.get_collection().find_one({"_id": schema_id})
+        return self.adapter.request_cache.get_or_load(
+            self.REQUEST_CACHE_NAMESPACE,
+            schema_id,
+            lambda: self.get_collection().find_one({"_id": schema_id}),
+        )
 
     def list_schemas(self, schema_type: str = None) -> list:
         """
@@ -91,9 +98,11 @@ class SchemaHandler(BaseHandler):
         Returns:
             Any: The result of the update operation.
         """
-        return self.get_collection().replace_one(
+        result = self.get_collection().replace_one(
             {"_id": schema_id}, updated_doc
         )
+        self.evict_request_cache()
+        return result
 
     def toggle_schema_active(self, schema_id: str, active_status: bool) -> Any:
         """
@@ -119,6 +128,7 @@ class SchemaHandler(BaseHandler):
             Any: The result of the insert operation.
         """
         self.get_collection().insert_one(schema_doc)
+        self.evict_request_cache()
 
     def delete_schema(self, schema_id: str) -> Any:
         """
@@ -130,7 +140,9 @@ class SchemaHandler(BaseHandler):
         Returns:
             Any: The result of the delete operation.
         """
-        return self.get_collection().delete_one({"_id": schema_id})
+        result = self.get_collection().delete_one({"_id": schema_id})
+        self.evict_request_cache()
+        return result
 
     def get_schemas_by_category_type(
         self,
@@ -24,6 +24,7 @@ It is part of the `coyote.db` package and extends the base handler functionality
 # Imports
 # -------------------------------------------------------------------------
 from bson.objectid import ObjectId
+from pymongo import ASCENDING
 from coyote.db.base import BaseHandler
 from flask import current_app as app
 
@@ -48,6 +49,13 @@ class TranslocsHandler(BaseHandler):
         super().__init__(adapter)
         self.set_collection(self.adapter.transloc_collection)
 
+    def ensure_indexes(self) -> None:
+        """
+        Create the per-sample index for translocation lists.
+        """
+        # Translocations for one sample
+        self.create_index([("SAMPLE_ID", ASCENDING)], name="ix_sample_id")
+
     def get_sample_translocations(self, sample_id: str) -> list:
         """
         Retrieve all translocations for a given sample.
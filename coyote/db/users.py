@@ -23,6 +23,7 @@ It is part of the `coyote.db` package and extends the base handler functionality
 # -------------------------------------------------------------------------
 # Imports
 # -------------------------------------------------------------------------
+from pymongo import ASCENDING
 from coyote.db.base import BaseHandler
 from datetime import datetime
 from flask import flash
@@ -46,6 +47,13 @@ class UsersHandler(BaseHandler):
         super().__init__(adapter)
         self.set_collection(self.adapter.users_collection)
 
+    def ensure_indexes(self) -> None:
+        """
+        Create the email index used at login.
+        """
+        # Login by email
+        self.create_index([("email", ASCENDING)], name="ix_email")
+
     def user(self, user_mail: str) -> dict:
         """
         Retrieves a user document from the database by email.
@@ -76,9 +84,11 @@ class UsersHandler(BaseHandler):
         Returns:
             None
         """
-        if self.get_collection().update_one(
+        result = self.get_collection().update_one(
             {"_id": username}, {"$set": {"password": password_hash}}
-        ):
+        )
+        self.adapter.identity_cache.bump()
+        if result:
             flash("Password updated", "green")
         else:
             flash("Failed to update password", "red")
@@ -108,7 +118,9 @@ class UsersHandler(BaseHandler):
         Returns:
             None
         """
-        return self.get_collection().insert_one(user_data)
+        result = self.get_collection().insert_one(user_data)
+        self.adapter.identity_cache.bump()
+        return result
 
     def get_all_users(self) -> list:
         """
@@ -126,7 +138,9 @@ class UsersHandler(BaseHandler):
         Returns:
             None
         """
-        return self.get_collection().delete_one({"_id": user_id})
+        result = self.get_collection().delete_one({"_id": user_id})
+        self.adapter.identity_cache.bump()
+        return result
 
     def update_user(self, user_id, user_data) -> None:
         """
@@ -137,7 +151,9 @@ class UsersHandler(BaseHandler):
         Returns:
             None
         """
-        return self.get_collection().replace_one({"_id": user_id}, user_data)
+        result = self.get_collection().replace_one({"_id": user_id}, user_data)
+        self.adapter.identity_cache.bump()
+        return result
 
     def update_user_last_login(self, user_id: str):
         """
@@ -149,6 +165,8 @@ class UsersHandler(BaseHandler):
         self.get_collection().update_one(
             {"_id": user_id}, {"$set": {"last_login": datetime.utcnow()}}
         )
+        # `last_login` is not used by the cached session user model, so the identity
+        # stamp is left alone (bumping it on every login drops every cached user)
 
     def toggle_user_active(self, user_id: str, active_status: bool) -> bool:
         """
@@ -159,4 +177,6 @@ class UsersHandler(BaseHandler):
         Returns:
             bool: True if the update was successful, False otherwise.
         """
-        return self.toggle_active(user_id, active_status)
+        result = self.toggle_active(user_id, active_status)
+        self.adapter.identity_cache.bump()
+        return result
@@ -0,0 +1,247 @@
+#  Copyright (c) 2025 Coyote3 Project Authors
+#  All rights reserved.
+#
+#  This source file is part of the Coyote3 codebase.
+#  The Coyote3 project provides a framework for genomic data analysis,
+#  interpretation, reporting, and clinical diagnostics.
+#
+#  Unauthorized use, distribution, or modification of this software or its
+#  components is strictly prohibited without prior written permission from
+#  the copyright holders.
+#
+
+"""
+VariantOccurrencesHandler module for Coyote3
+============================================
+
+This module defines the `VariantOccurrencesHandler` class used for maintaining the
+cross-sample occurrence index of SNVs in MongoDB.
+
+One document per `simple_id` holds the total number of samples carrying the variant,
+the count per assay and the most recent sample references:
+
+    {
+        "_id": "9_5073770_G_T",
+        "total": 412,
+        "assays": {"myeloid_GMSv1": 398, "solid_GMSv3": 14},
+        "samples": [
+            {"sample_id": "...", "sample_name": "...", "assay": "...",
+             "time_added": ISODate(...), "GT": [...]},
+            ...
+        ],
+        "updated": ISODate(...)
+    }
+
+The index is updated incrementally when a sample is recorded (after loading) and when
+it is removed (before its variants are deleted). A sample is marked with
+`occurrences_indexed` so recording and removal are idempotent.
+
+It is part of the `coyote.db` package and extends the base handler functionality.
+MongoDB 3.4 compatible.
+"""
+
+# -------------------------------------------------------------------------
+# Imports
+# -------------------------------------------------------------------------
+from bson.objectid import ObjectId
+from pymongo import UpdateOne
+from coyote.db.base import BaseHandler
+from coyote.util.common_utility import CommonUtility
+
+
+# -------------------------------------------------------------------------
+# Class Definition
+# -------------------------------------------------------------------------
+class VariantOccurrencesHandler(BaseHandler):
+    """
+    The `VariantOccurrencesHandler` class maintains and serves the `variant_occurrences`
+    collection, the per-`simple_id` recurrence counts and sample references used by the
+    variant detail page.
+
+    Documents are keyed by `simple_id`, so every read is a single `_id` lookup.
+    """
+
+    def __init__(self, adapter):
+        """
+        Initialize the handler with a given adapter and bind the collection.
+        """
+        super().__init__(adapter)
+        self.set_collection(self.adapter.variant_occurrences_collection)
+
+    @staticmethod
+    def _assay_key(assay: str | None) -> str:
+        """
+        Return the assay name as a safe field name for the `assays` counter map.
+        """
+        return (assay or "unknown").replace(".", "_").replace("$", "_")
+
+    def _bulk(self, operations: list) -> None:
+        """
+        Apply update operations unordered in batches of `VARIANT_OCCURRENCE_BATCH_SIZE`.
+        """
+        batch_size = self.app.config.get("VARIANT_OCCURRENCE_BATCH_SIZE", 1000)
+        for start in range(0, len(operations), batch_size):
+            self.get_collection().bulk_write(operations[start : start + batch_size], ordered=False)
+
+    def record_sample(self, sample_id: str, force: bool = False) -> int:
+        """
+        Add the SNVs of a sample to the occurrence index.
+
+        Call after the variants of a sample have been loaded. Samples already recorded
+        are skipped unless `force` is set.
+
+        Args:
+            sample_id (str): The sample ObjectId as a string (the `SAMPLE_ID` of its variants).
+            force (bool): Record again even if the sample is marked as indexed.
+
+        Returns:
+            int: The number of variants recorded, 0 if the sample was skipped.
+        """
+        sample = self.adapter.samples_collection.find_one(
+            {"_id": ObjectId(sample_id)},
+            {"name": 1, "assay": 1, "time_added": 1, "occurrences_indexed": 1},
+        )
+        if not sample or (sample.get("occurrences_indexed") and not force):
+            return 0
+
+        recent = self.app.config.get("VARIANT_OCCURRENCE_RECENT_SAMPLES", 200)
+        assay_key = self._assay_key(sample.get("assay"))
+        now = CommonUtility.utc_now()
+        operations = []
+        simple_ids = set()
+        for variant in self.adapter.variants_collection.find(
+            {"SAMPLE_ID": sample_id}, {"simple_id": 1, "GT": 1}
+        ):
+            simple_id = variant.get("simple_id")
+            if not simple_id or simple_id in simple_ids:
+                continue
+            simple_ids.add(simple_id)
+            operations.append(
+                UpdateOne(
+                    {"_id": simple_id},
+                    {
+                        "$inc": {"total": 1, f"assays.{assay_key}": 1},
+                        "$push": {
+                            "samples": {
+                                "$each": [
+                                    {
+                                        "sample_id": sample_id,
+                                        "sample_name": sample.get("name", "unknown"),
+                                        "assay": sample.get("assay", "unknown"),
+                                        "time_added": sample.get("time_added"),
+                                        "GT": variant.get("GT"),
+                                    }
+                                ],
+                                "$sort": {"time_added": -1},
+                                "$slice": recent,
+                            }
+                        },
+                        "$set": {"updated": now},
+                    },
+                    upsert=True,
+                )
+            )
+
+        if force and sample.get("occurrences_indexed"):
+            self.remove_sample(sample_id)
+        else:
+            self.adapter.dashboard_stats_handler.record_sample(sample_id)
+        self._bulk(operations)
+        self.adapter.samples_collection.update_one(
+            {"_id": sample["_id"]}, {"$set": {"occurrences_indexed": now}}
+        )
+        # Recording is the last ingest step; show the new sample on the home lists
+        self.adapter.sample_handler.bump_samples_stamp(sample.get("assay"))
+        return len(operations)
+
+    def remove_sample(self, sample_id: str) -> int:
+        """
+        Remove the SNVs of a sample from the occurrence index.
+
+        Call before the variants of the sample are deleted. Samples that were never
+        recorded are skipped.
+
+        Args:
+            sample_id (str): The sample ObjectId as a string.
+
+        Returns:
+            int: The number of variants removed, 0 if the sample was not indexed.
+        """
+        sample = self.adapter.samples_collection.find_one(
+            {"_id": ObjectId(sample_id), "occurrences_indexed": {"$exists": True}},
+            {"assay": 1},
+        )
+        if not sample:
+            return 0
+
+        assay_key = self._assay_key(sample.get("assay"))
+        simple_ids = self.adapter.variants_collection.distinct(
+            "simple_id", {"SAMPLE_ID": sample_id}
+        )
+        operations = [
+            UpdateOne(
+                {"_id": simple_id},
+                {
+                    "$inc": {"total": -1, f"assays.{assay_key}": -1},
+                    "$pull": {"samples": {"sample_id": sample_id}},
+                    "$set": {"updated": CommonUtility.utc_now()},
+                },
+            )
+            for simple_id in simple_ids
+            if simple_id
+        ]
+        self._bulk(operations)
+        self.get_collection().delete_many({"_id": {"$in": simple_ids}, "total": {"$lte": 0}})
+        self.adapter.samples_collection.update_one(
+            {"_id": sample["_id"]}, {"$unset": {"occurrences_indexed": ""}}
+        )
+        return len(operations)
+
+    def get_occurrences(
+        self, simple_id: str, exclude_sample: dict | None = None, page: int = 0, limit: int = 20
+    ) -> dict | None:
+        """
+        Return the recurrence count and one page of the most recent samples carrying a variant.
+
+        The count, the per-assay counts and the page are read with a single `_id` lookup.
+
+        Args:
+            simple_id (str): The variant `simple_id`.
+            exclude_sample (dict | None): The sample document being viewed; it is left out of
+                the counts (if recorded) and of the page.
+            page (int): Zero-based page of the recent sample list.
+            limit (int): Samples per page.
+
+        Returns:
+            dict | None: `total`, `assays`, `samples`, `page`, `limit` and `has_more`, or
+            None if the variant is not in the index.
+        """
+        doc = self.get_collection().find_one(
+            {"_id": simple_id},
+            {"total": 1, "assays": 1, "samples": {"$slice": [page * limit, limit + 1]}},
+        )
+        if not doc:
+            return None
+
+        total = doc.get("total", 0)
+        assays = dict(doc.get("assays") or {})
+        refs = doc.get("samples") or []
+        has_more = len(refs) > limit
+        refs = refs[:limit]
+        if exclude_sample:
+            exclude_id = str(exclude_sample.get("_id"))
+            if exclude_sample.get("occurrences_indexed"):
+                total -= 1
+                assay_key = self._assay_key(exclude_sample.get("assay"))
+                if assays.get(assay_key):
+                    assays[assay_key] -= 1
+            refs = [ref for ref in refs if ref.get("sample_id") != exclude_id]
+
+        return {
+            "total": max(total, 0),
+            "assays": {assay: count for assay, count in assays.items() if count > 0},
+            "samples": refs,
+            "page": page,
+            "limit": limit,
+            "has_more": has_more,
+        }
@@ -23,6 +23,7 @@ It is part of the `coyote.db` package and extends the base handler functionality
 # Imports
 # -------------------------------------------------------------------------
 from bson.objectid import ObjectId
+from pymongo import ASCENDING
 from coyote.db.base import BaseHandler
 from flask import current_app as app
 from typing import Any
@@ -41,6 +42,75 @@ class VariantsHandler(BaseHandler):
     and deleting variants associated with a sample.
     """
 
+    # Fields shared by the list and report views: identifiers, genotypes, flags and the
+    # selected transcript only (the full INFO.CSQ transcript list is never needed there).
+    # `transcripts`, `HGVSp` and `HGVSc` are the flattened lists matched by
+    # `get_additional_classifications_bulk` in `add_global_annotations`.
+    _LEAN_FIELDS = (
+        "_id",
+        "SAMPLE_ID",
+        "CHROM",
+        "POS",
+        "REF",
+        "ALT",
+        "FILTER",
+        "GT",
+        "simple_id",
+        "simple_id_hash",
+        "variant_class",
+        "genes",
+        "hotspots",
+        "fp",
+        "interesting",
+        "irrelevant",
+        "comments",
+        "transcripts",
+        "HGVSp",
+        "HGVSc",
+        "INFO.selected_CSQ",
+        "INFO.HOTSPOT",
+    )
+
+    # Named projections per view; `None` fetches the full document
+    PROJECTION_PROFILES: dict[str, dict | None] = {
+        # list_variants_vep.html, blacklist, global annotations, hotspots and OncoKB
+        "list": {
+            **dict.fromkeys(_LEAN_FIELDS, 1),
+            "gnomad_frequency": 1,
+            "override_blacklist": 1,
+            "INFO.PANEL": 1,
+        },
+        # Report filtering, report rows and the reported variants snapshot
+        "report": {
+            **dict.fromkeys(_LEAN_FIELDS, 1),
+            "INFO.SVTYPE": 1,
+            "INFO.SVLEN": 1,
+            "INFO.MYELOID_GERMLINE": 1,
+            "gene": 1,
+            "selected_csq_feature": 1,
+            "hgvsp": 1,
+            "hgvsc": 1,
+        },
+        # Summary tiers of the variant list: the global annotation keys, blacklist, flags and
+        # the fields of the summary text only
+        "tier": {
+            "_id": 1,
+            "CHROM": 1,
+            "POS": 1,
+            "REF": 1,
+            "ALT": 1,
+            "GT": 1,
+            "simple_id": 1,
+            "fp": 1,
+            "irrelevant": 1,
+            "INFO.selected_CSQ.SYMBOL": 1,
+            "INFO.selected_CSQ.HGVSp": 1,
+            "INFO.selected_CSQ.HGVSc": 1,
+        },
+        # show_variant renders every transcript and annotation source
+        "detail": None,
+    }
+
     def __init__(self, adapter):
         """
         Initialize the handler with a given adapter and bind the collection.
@@ -48,6 +118,22 @@ class VariantsHandler(BaseHandler):
         super().__init__(adapter)
         self.set_collection(self.adapter.variants_collection)
 
+    def ensure_indexes(self) -> None:
+        """
+        Create indexes for per-sample variant lists and cross-sample variant lookups.
+        """
+        # Variant list and bulk actions for one sample
+        self.create_index([("SAMPLE_ID", ASCENDING)], name="ix_sample_id")
+
+        # Same variant in other samples
+        self.create_index(
+            [("simple_id", ASCENDING), ("SAMPLE_ID", ASCENDING)],
+            name="ix_simple_id_sample_id",
+        )
+
+        # Gene level variant lookups
+        self.create_index([("genes", ASCENDING)], name="ix_genes")
+
     # TODO: This will be removed once the sample ids are set in the sample doc
     def get_sample_ids(self, sample_id: str) -> dict:
         """
@@ -67,7 +153,27 @@ class VariantsHandler(BaseHandler):
                 ids[gt.get("type")] = gt.get("sample")
         return ids
 
-    def get_case_variants(self, query: dict):
+    def get_projection(self, profile: str | None) -> dict | None:
+        """
+        Return the projection of a named profile (`list`, `report`, `tier` or `detail`).
+
+        Args:
+            profile (str | None): The profile name, or None for the full document.
+
+        Returns:
+            dict | None: The projection, or None to fetch every field. The dictionary is
+                shared and must not be modified.
+
+        Raises:
+            ValueError: If `profile` is not a known profile name.
+        """
+        if profile is None:
+            return None
+        if profile not in self.PROJECTION_PROFILES:
+            raise ValueError(f"Unknown variant projection profile: {profile}")
+        return self.PROJECTION_PROFILES[profile]
+
+    def get_case_variants(self, query: dict, profile: str | None = None):
         """
         Retrieve variants based on a constructed query.
 
@@ -75,11 +181,40 @@ class VariantsHandler(BaseHandler):
 
         Args:
             query (dict): A dictionary representing the query to execute.
+            profile (str | None): Projection profile to fetch (see `PROJECTION_PROFILES`).
+                Defaults to the full document.
 
         Returns:
             pymongo.cursor.Cursor: A cursor to the documents that match the query.
         """
-        return self.get_collection().find(query)
+        return self.get_collection().find(query, self.get_projection(profile))
+
+    def aggregate_case_variants(self, pipeline: list) -> list:
+        """
+        Retrieve variants with an aggregation pipeline.
+
+        Used with `build_query_pipeline`, which matches the variant filter query and
+        projects only the fields a view needs.
+
+        Args:
+            pipeline (list): The aggregation pipeline to run on the variants collection.
+
+        Returns:
+            list: The matching (projected) variant documents.
+        """
+        return list(self.get_collection().aggregate(pipeline))
+
+    def count_case_variants(self, query: dict) -> int:
+        """
+        Count the variants matching a constructed query.
+
+        Args:
+            query (dict): A dictionary representing the query, as built by `build_query`.
+
+        Returns:
+            int: The number of matching variants.
+        """
+        return self.get_collection().count_documents(query)
 
     def get_variant(self, id: str) -> dict:
         """
@@ -96,6 +231,57 @@ class VariantsHandler(BaseHandler):
         """
         return self.get_collection().find_one({"_id": ObjectId(id)})
 
+    def get_variants_by_ids(self, variant_ids: list[str], projection: dict | None = None) -> dict:
+        """
+        Retrieve several variants by their unique IDs with one query.
+
+        Args:
+            variant_ids (list[str]): Variant ObjectIds as strings; invalid IDs are ignored.
+            projection (dict | None): Optional projection, see `get_projection`.
+
+        Returns:
+            dict: Variant documents keyed by their string ID. Missing variants are absent.
+        """
+        object_ids = [ObjectId(vid) for vid in variant_ids if ObjectId.is_valid(str(vid))]
+        if not object_ids:
+            return {}
+        return {
+            str(doc["_id"]): doc
+            for doc in self.get_collection().find({"_id": {"$in": object_ids}}, projection)
+        }
+
+    def set_flag(self, doc_ids: list, field: str, value: Any) -> dict[str, int]:
+        """
+        Set a flag field on a batch of variants, see `BaseHandler.set_flag`.
+
+        Changes of the `fp` flag are counted into the dashboard statistics.
+        """
+        unmarked = 0
+        if field == "fp" and not value:
+            object_ids = [d if isinstance(d, ObjectId) else ObjectId(d) for d in doc_ids]
+            unmarked = self.get_collection().count_documents(
+                {"_id": {"$in": object_ids}, "fp": True}
+            )
+        counts = super().set_flag(doc_ids, field, value)
+        if field == "fp":
+            delta = counts["modified"] if value is True else -unmarked
+            self.adapter.dashboard_stats_handler.increment({"variants.fps": delta})
+        return counts
+
+    def set_variant_flags_bulk(self, variant_ids: list[str], flags: dict) -> Any:
+        """
+        Set flag fields (e.g. `fp`, `irrelevant`) on several variants without flashing.
+
+        Args:
+            variant_ids (list[str]): Variant ObjectIds as strings; invalid IDs are ignored.
+            flags (dict): The fields to set, e.g. `{"irrelevant": True}`.
+
+        Returns:
+            dict: The update counts of each field, see `set_flag`.
+        """
+        object_ids = [ObjectId(vid) for vid in variant_ids if ObjectId.is_valid(str(vid))]
+        return {field: self.set_flag(object_ids, field, value) for field, value in flags.items()}
+
     def get_variant_in_other_samples(self, variant: dict) -> list:
         """
         Retrieve the same variant from other samples using a fast 2-query method.
@@ -161,6 +347,66 @@ class VariantsHandler(BaseHandler):
 
         return results
 
+    def get_variant_occurrences(
+        self, variant: dict, sample: dict, page: int = 0, limit: int = 20
+    ) -> dict:
+        """
+        Retrieve the recurrence of a variant in other samples from the occurrence index.
+
+        The full count, per-assay counts and one page of the most recent samples come from
+        one `_id` read on the occurrence index; the current `fp`, `interesting` and
+        `irrelevant` flags of the page are added with one indexed variants query. Variants
+        not in the index fall back to `get_variant_in_other_samples`.
+
+        Args:
+            variant (dict): The variant document.
+            sample (dict): The sample document being viewed.
+            page (int): Zero-based page of the sample list.
+            limit (int): Samples per page.
+
+        Returns:
+            dict: `total` (None when not indexed), `assays`, `samples` (as returned by
+            `get_variant_in_other_samples`), `page`, `limit` and `has_more`.
+        """
+        occurrences = self.adapter.variant_occurrences_handler.get_occurrences(
+            variant["simple_id"], exclude_sample=sample, page=page, limit=limit
+        )
+        if occurrences is None:
+            return {
+                "total": None,
+                "assays": {},
+                "samples": self.get_variant_in_other_samples(variant),
+                "page": 0,
+                "limit": limit,
+                "has_more": False,
+            }
+
+        flags = {
+            doc["SAMPLE_ID"]: doc
+            for doc in self.get_collection().find(
+                {
+                    "simple_id": variant["simple_id"],
+                    "SAMPLE_ID": {"$in": [ref["sample_id"] for ref in occurrences["samples"]]},
+                },
+                {"SAMPLE_ID": 1, "fp": 1, "interesting": 1, "irrelevant": 1},
+            )
+        }
+        samples = []
+        for ref in occurrences["samples"]:
+            doc = flags.get(ref["sample_id"], {})
+            samples.append(
+                {
+                    "sample_name": ref.get("sample_name", "unknown"),
+                    "assay": ref.get("assay", "unknown"),
+                    "GT": ref.get("GT"),
+                    "fp": doc.get("fp", False),
+                    "interesting": doc.get("interesting", False),
+                    "irrelevant": doc.get("irrelevant", False),
+                }
+            )
+        occurrences["samples"] = samples
+        return occurrences
+
     def get_variants_by_gene(self, gene: str) -> Any:
         """
         Retrieve variants associated with a specific gene.
@@ -439,7 +685,7 @@ class VariantsHandler(BaseHandler):
         Returns:
             int: The total number of variants in the collection.
         """
-        return self.get_collection().find().count()
+        return self.get_collection().estimated_document_count()
 
     def get_unique_total_variant_counts(self) -> int:
         """
@@ -464,7 +710,7 @@ class VariantsHandler(BaseHandler):
         Returns:
             int: The total number of SNP variants in the collection.
         """
-        return self.get_collection().find({"variant_class": "SNV"}).count()
+        return self.get_collection().count_documents({"variant_class": "SNV"})
 
     def get_fp_counts(self):
         """
@@ -476,7 +722,7 @@ class VariantsHandler(BaseHandler):
         Returns:
             int: The total number of false positive variants in the collection.
         """
-        return self.get_collection().find({"fp": True}).count()
+        return self.get_collection().count_documents({"fp": True})
 
     def get_unique_snp_count(self) -> int:
         """
@@ -51,9 +51,24 @@ class VEPMetaHandler(BaseHandler):
         """
         Retrieve metadata for a specific VEP version, logging a warning if not found.
 
+        The metadata is served from the reference data cache and only loaded from
+        MongoDB on a cache miss.
+
         Parameters:
             vep_version (str): The version of VEP to retrieve metadata for.
 
+        Returns:
+            dict: The metadata document if found, otherwise an empty dictionary.
+        """
+        return self.adapter.reference_cache.get("vep_metadata", vep_version, self._load_metadata)
+
+    def _load_metadata(self, vep_version: str) -> dict:
+        """
+        Load the metadata document for a specific VEP version from MongoDB.
+
+        Parameters:
+            vep_version (str): The version of VEP to load metadata for.
+
         Returns:
             dict: The metadata document if found, otherwise an empty dictionary.
         """
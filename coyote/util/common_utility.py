@@ -31,9 +31,10 @@ from typing import Any, Literal, Dict, Tuple, List, Optional
 from bson import ObjectId
 from datetime import datetime, timezone, timedelta
 from hashlib import md5
-import base64, json
+import json
 from flask_login import current_user
 from werkzeug.security import generate_password_hash
+from coyote.util import plot_assets
 
 
 class CommonUtility:
@@ -769,12 +770,13 @@ class CommonUtility:
         Args:
             image_path (str): The file path to the image.
 
+        Encodings are memoized by path and modification time, see
+        `coyote.util.plot_assets.base64_image`.
+
         Returns:
             str: The base64-encoded string of the image content.
         """
-        with open(image_path, "rb") as image_file:
-            base64_image = base64.b64encode(image_file.read()).decode("utf-8")
-        return base64_image
+        return plot_assets.base64_image(image_path)
 
     @staticmethod
     def get_plot(fn: str, assay_config: dict = None) -> bool:
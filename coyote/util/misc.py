@@ -170,6 +170,10 @@ def get_sample_and_assay_config(sample_id: str) -> tuple:
 
     schema_name = assay_config.get("schema_name")
     assay_config_schema = store.schema_handler.get_schema(schema_name)
-    formatted_config = util.common.format_assay_config(deepcopy(assay_config), assay_config_schema)
+    formatted_config = store.request_cache.get_or_load(
+        store.aspc_handler.REQUEST_CACHE_NAMESPACE,
+        ("formatted", assay_config.get("_id"), schema_name),
+        lambda: util.common.format_assay_config(deepcopy(assay_config), assay_config_schema),
+    )
 
     return sample, formatted_config, assay_config_schema
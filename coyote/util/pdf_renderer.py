@@ -0,0 +1,180 @@
+#  Copyright (c) 2025 Coyote3 Project Authors
+#  All rights reserved.
+#
+#  This source file is part of the Coyote3 codebase.
+#  The Coyote3 project provides a framework for genomic data analysis,
+#  interpretation, reporting, and clinical diagnostics.
+#
+#  Unauthorized use, distribution, or modification of this software or its
+#  components is strictly prohibited without prior written permission from
+#  the copyright holders.
+#
+
+
+"""
+Coyote3 PDF Renderer
+=====================================
+
+This module converts rendered report HTML to PDF with WeasyPrint in a bounded,
+process-wide process pool, so the CPU-bound layout work runs outside the request
+threads (and outside the GIL).
+
+Every PDF is rendered once and stored in `PDF_CACHE_DIR` under the SHA-256 of its
+HTML and base URL; later requests for the same HTML are served from the stored file.
+Concurrent requests for the same HTML in one process share a single render. After each
+render the cache is pruned to `PDF_CACHE_MAX_FILES` files not older than
+`PDF_CACHE_MAX_AGE` (cache hits refresh a file's age).
+"""
+
+# -------------------------------------------------------------------------
+# Imports
+# -------------------------------------------------------------------------
+from concurrent.futures import Future, ProcessPoolExecutor
+import hashlib
+import multiprocessing
+import os
+import threading
+from flask import current_app as app
+from flask import has_request_context, request
+import time
+
+
+_executor: ProcessPoolExecutor | None = None
+_executor_lock = threading.Lock()
+_inflight: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    """
+    Return the process-wide PDF render pool, creating it on first use.
+
+    Workers are spawned rather than forked, so they do not inherit the MongoDB client
+    or the threads of the web worker.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ProcessPoolExecutor(
+                max_workers=app.config.get("PDF_RENDER_MAX_WORKERS", 2),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def _write_pdf(
+    html: str, base_url: str | None, static_prefix: str, static_dir: str, target: str
+) -> str:
+    """
+    Render HTML to a PDF file. Runs in a pool process.
+
+    URLs below `static_prefix` are read from `static_dir` on disk instead of being
+    fetched back from the web server.
+    """
+    from weasyprint import HTML, default_url_fetcher
+
+    def url_fetcher(url: str) -> dict:
+        if static_prefix and url.startswith(static_prefix):
+            path = os.path.realpath(os.path.join(static_dir, url[len(static_prefix) :]))
+            if path.startswith(os.path.realpath(static_dir) + os.sep) and os.path.isfile(path):
+                return {"file_obj": open(path, "rb"), "filename": path}
+        return default_url_fetcher(url)
+
+    partial = f"{target}.{os.getpid()}.part"
+    HTML(string=html, base_url=base_url, url_fetcher=url_fetcher).write_pdf(partial)
+    os.replace(partial, target)
+    return target
+
+
+def html_key(html: str, base_url: str | None = None) -> str:
+    """
+    Return the cache key of a report HTML document.
+    """
+    return hashlib.sha256(f"{base_url or ''}\n{html}".encode("utf-8")).hexdigest()
+
+
+def render_pdf_file(html: str, base_url: str | None = None) -> str:
+    """
+    Return the path of the PDF for a report HTML document, rendering it if needed.
+
+    Args:
+        html (str): The rendered report HTML.
+        base_url (str | None): Base URL for relative links; defaults to the URL root of the
+            current request.
+
+    Returns:
+        str: Path of the stored PDF file.
+
+    Raises:
+        concurrent.futures.TimeoutError: If the render takes longer than `PDF_RENDER_TIMEOUT`.
+        Exception: Any error raised by WeasyPrint in the pool process.
+    """
+    if base_url is None and has_request_context():
+        base_url = request.url_root
+    key = html_key(html, base_url)
+    cache_dir = os.path.abspath(app.config.get("PDF_CACHE_DIR", "pdf_cache"))
+    os.makedirs(cache_dir, exist_ok=True)
+    target = os.path.join(cache_dir, f"{key}.pdf")
+    if os.path.isfile(target):
+        app.logger.debug(f"[PDF] cache hit {key}")
+        try:
+            os.utime(target)
+        except OSError:
+            pass
+        return target
+
+    with _inflight_lock:
+        future = _inflight.get(key)
+        if future is None:
+            static_prefix = f"{base_url.rstrip('/')}{app.static_url_path}/" if base_url else ""
+            future = _get_executor().submit(
+                _write_pdf, html, base_url, static_prefix, app.static_folder, target
+            )
+            _inflight[key] = future
+            future.add_done_callback(lambda _: _inflight.pop(key, None))
+
+    path = future.result(timeout=app.config.get("PDF_RENDER_TIMEOUT", 120))
+    app.logger.info(f"[PDF] rendered {key}")
+    prune_cache(cache_dir, keep=path)
+    return path
+
+
+def prune_cache(cache_dir: str, keep: str | None = None) -> int:
+    """
+    Remove cached PDFs older than `PDF_CACHE_MAX_AGE`, then the least recently used ones
+    above `PDF_CACHE_MAX_FILES`.
+
+    Args:
+        cache_dir (str): The PDF cache directory.
+        keep (str | None): A path that is never removed (the PDF about to be served).
+
+    Returns:
+        int: The number of files removed.
+    """
+    max_age = app.config.get("PDF_CACHE_MAX_AGE", 30 * 86400)
+    max_files = app.config.get("PDF_CACHE_MAX_FILES", 1000)
+    entries = []
+    with os.scandir(cache_dir) as scan:
+        for entry in scan:
+            if entry.name.endswith(".pdf") and entry.path != keep:
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    continue
+    entries.sort(reverse=True)
+
+    cutoff = time.time() - max_age if max_age else None
+    # `keep` counts towards the limit
+    limit = max(0, max_files - 1) if max_files else None
+    removed = 0
+    for index, (mtime, path) in enumerate(entries):
+        if (cutoff is None or mtime >= cutoff) and (limit is None or index < limit):
+            continue
+        try:
+            os.remove(path)
+            removed += 1
+        except OSError:
+            continue
+    if removed:
+        app.logger.info(f"[PDF] pruned {removed} cached PDFs")
+    return removed
@@ -0,0 +1,138 @@
+#  Copyright (c) 2025 Coyote3 Project Authors
+#  All rights reserved.
+#
+#  This source file is part of the Coyote3 codebase.
+#  The Coyote3 project provides a framework for genomic data analysis,
+#  interpretation, reporting, and clinical diagnostics.
+#
+#  Unauthorized use, distribution, or modification of this software or its
+#  components is strictly prohibited without prior written permission from
+#  the copyright holders.
+#
+
+
+"""
+Coyote3 Plot Assets
+=====================================
+
+This module serves plot images (CNV profiles and other sample plots) without
+re-reading or re-processing them on every request:
+
+- Responses carry an ETag derived from the file path, modification time and size;
+  a matching `If-None-Match` is answered with `304 Not Modified` before the file is touched.
+- Rotated renditions are written once to `PLOT_CACHE_DIR` and served from there.
+- Base64 encodings used in reports are memoized in process by path and modification time.
+"""
+
+# -------------------------------------------------------------------------
+# Imports
+# -------------------------------------------------------------------------
+from collections import OrderedDict
+import base64
+import hashlib
+import os
+import threading
+from flask import Response
+from flask import current_app as app
+from flask import request, send_file
+from PIL import Image
+
+
+_base64_cache: OrderedDict[tuple, str] = OrderedDict()
+_base64_lock = threading.Lock()
+BASE64_CACHE_ENTRIES = 16
+
+
+def plot_etag(path: str) -> str:
+    """
+    Return the ETag of a plot file, derived from its path, modification time and size.
+    """
+    stat = os.stat(path)
+    return hashlib.sha1(f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode()).hexdigest()
+
+
+def _private(response: Response) -> Response:
+    """
+    Mark a plot response as cacheable by the browser only; plots are access controlled.
+    """
+    response.cache_control.no_cache = None
+    response.cache_control.public = False
+    response.cache_control.private = True
+    response.cache_control.max_age = app.config.get("PLOT_CACHE_MAX_AGE", 3600)
+    return response
+
+
+def _rotated_path(path: str, file_etag: str, angle: int) -> str:
+    """
+    Return the cached rotated rendition of a plot, creating it on first use.
+    """
+    cache_dir = app.config.get("PLOT_CACHE_DIR", "plot_cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    target = os.path.join(cache_dir, f"{file_etag}-r{angle}.png")
+    if not os.path.isfile(target):
+        partial = f"{target}.{os.getpid()}.{threading.get_ident()}.part"
+        with Image.open(path) as img:
+            img.rotate(-angle, expand=True).save(partial, format="PNG")
+        os.replace(partial, target)
+    return target
+
+
+def send_plot(path: str, angle: int = 0) -> Response:
+    """
+    Send a plot image with conditional GET support, optionally rotated.
+
+    Args:
+        path (str): Path of the plot file.
+        angle (int): Clockwise rotation in degrees; `0` sends the file as is.
+
+    Returns:
+        Response: `304 Not Modified` if the client already has this version, otherwise
+        the image.
+    """
+    file_etag = plot_etag(path)
+    etag = f"{file_etag}-r{angle}" if angle else file_etag
+    if request.if_none_match.contains(etag):
+        response = Response(status=304)
+        response.set_etag(etag)
+        return _private(response)
+
+    if angle:
+        path = _rotated_path(path, file_etag, angle)
+    response = send_file(
+        os.path.abspath(path),
+        mimetype="image/png" if angle else None,
+        etag=etag,
+        conditional=True,
+    )
+    return _private(response)
+
+
+def base64_image(path: str) -> str:
+    """
+    Return the base64 encoding of an image file, memoized by path and modification time.
+
+    The most recent `BASE64_CACHE_ENTRIES` encodings are kept in process, so repeated report
+    builds for a sample do not re-read and re-encode its plots.
+
+    Args:
+        path (str): Path of the image file.
+
+    Returns:
+        str: The base64-encoded file content.
+    """
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    with _base64_lock:
+        encoded = _base64_cache.get(key)
+        if encoded is not None:
+            _base64_cache.move_to_end(key)
+            return encoded
+
+    with open(path, "rb") as image_file:
+        encoded = base64.b64encode(image_file.read()).decode("utf-8")
+
+    with _base64_lock:
+        _base64_cache[key] = encoded
+        while len(_base64_cache) > BASE64_CACHE_ENTRIES:
+            _base64_cache.popitem(last=False)
+    return encoded
@@ -0,0 +1,224 @@
+#  Copyright (c) 2025 Coyote3 Project Authors
+#  All rights reserved.
+#
+#  This source file is part of the Coyote3 codebase.
+#  The Coyote3 project provides a framework for genomic data analysis,
+#  interpretation, reporting, and clinical diagnostics.
+#
+#  Unauthorized use, distribution, or modification of this software or its
+#  components is strictly prohibited without prior written permission from
+#  the copyright holders.
+#
+
+
+"""
+Coyote3 Report Queue
+=====================================
+
+This module renders reports in the background. Save endpoints submit a job to the
+`report_jobs` collection and return immediately; a small process-wide thread pool
+claims queued jobs and runs them through the runner registered for the job kind.
+
+The pool is bounded by `REPORT_JOB_MAX_WORKERS` and separate from the request
+threads, so many queued reports never starve interactive requests. Jobs are claimed
+atomically, so every web worker process can drain the same queue. Each job runs in a
+fresh application and request context logged in as the submitting user, so report
+templates and handlers can use `url_for` and `current_user` as in the request, and no
+`flask.g` state carries over from one job to the next. While a job runs its heartbeat is
+refreshed, so other workers only claim it again once its worker is gone.
+
+With `REPORT_JOBS_ENABLED` switched off jobs run inline in the submitting request.
+"""
+
+# -------------------------------------------------------------------------
+# Imports
+# -------------------------------------------------------------------------
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+import os
+import threading
+from flask import Flask
+from flask import current_app as app
+from flask import has_request_context, request
+from flask_login import current_user, login_user
+from coyote.errors.exceptions import AppError
+from coyote.extensions import store
+
+
+_runners: dict[str, Callable[[dict], dict]] = {}
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+
+def register_runner(kind: str, runner: Callable[[dict], dict]) -> None:
+    """
+    Register the function that processes jobs of a kind.
+
+    The runner receives the job document, runs inside a request context logged in as the
+    submitting user and returns a small result dict stored on the job (e.g. the report id).
+    Raising `AppError` fails the job with its message. A job can be claimed again after its
+    worker died, so runners record their progress with
+    `store.report_jobs_handler.save_checkpoint` and resume from `job["checkpoint"]`.
+
+    Args:
+        kind (str): The job kind, e.g. `dna_report`.
+        runner (Callable[[dict], dict]): The job runner.
+    """
+    _runners[kind] = runner
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide report worker pool, creating it on first use.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=app.config.get("REPORT_JOB_MAX_WORKERS", 2),
+                thread_name_prefix="coyote-reports",
+            )
+        return _executor
+
+
+def submit(kind: str, job_key: str, sample: dict, params: dict | None = None) -> tuple[dict, bool]:
+    """
+    Submit a report job and return without waiting for it.
+
+    Args:
+        kind (str): The job kind; a runner must be registered for it.
+        job_key (str): The idempotent job key, e.g. `dna_report:<sample_oid>:<report_num>`.
+        sample (dict): The sample document the report belongs to.
+        params (dict | None): Runner specific parameters.
+
+    Returns:
+        tuple[dict, bool]: The job document and whether a new render was queued. With
+        `REPORT_JOBS_ENABLED` off a newly queued job has already finished.
+    """
+    authenticated = current_user.is_authenticated
+    job, created = store.report_jobs_handler.enqueue(
+        job_key,
+        kind,
+        sample,
+        params=params,
+        created_by=current_user.username if authenticated else None,
+        user_id=current_user.get_id() if authenticated else None,
+        base_url=request.host_url if has_request_context() else None,
+    )
+    if not created:
+        return job, False
+
+    if not app.config.get("REPORT_JOBS_ENABLED", True):
+        claimed = store.report_jobs_handler.claim_next(_worker_name(), job_key=job_key)
+        if claimed:
+            _run_job(claimed, in_request=True)
+        return store.report_jobs_handler.get_job(job_key), True
+
+    wake()
+    return job, True
+
+
+def wake() -> None:
+    """
+    Start draining the queue on the worker pool.
+
+    Called on submit and when a job status is polled, so jobs left queued by a restarted
+    process are picked up again.
+    """
+    if not app.config.get("REPORT_JOBS_ENABLED", True):
+        return
+    _get_executor().submit(_drain, app._get_current_object())
+
+
+def _worker_name() -> str:
+    return f"{os.uname().nodename}:{os.getpid()}:{threading.current_thread().name}"
+
+
+def _drain(flask_app: Flask) -> None:
+    """
+    Claim and run queued jobs until none are left.
+    """
+    with flask_app.app_context():
+        stale_after = flask_app.config.get("REPORT_JOB_STALE_SECONDS", 600)
+        max_attempts = flask_app.config.get("REPORT_JOB_MAX_ATTEMPTS", 3)
+        handler = store.report_jobs_handler
+        try:
+            handler.fail_abandoned(stale_after, max_attempts)
+            while True:
+                job = handler.claim_next(_worker_name(), stale_after, max_attempts)
+                if job is None:
+                    break
+                with (
+                    flask_app.app_context(),
+                    flask_app.test_request_context(base_url=job.get("base_url")),
+                ):
+                    _run_job(job)
+        except Exception as exc:
+            flask_app.logger.exception(f"[REPORT JOBS] Queue drain failed: {exc}")
+
+
+def _run_job(job: dict, in_request: bool = False) -> None:
+    """
+    Run a claimed job and record its outcome.
+
+    Args:
+        job (dict): The claimed job document.
+        in_request (bool): True when running inline in the submitting request, which is
+            already logged in as the job user.
+    """
+    job_key = job["_id"]
+    worker = job["worker"]
+    handler = store.report_jobs_handler
+    runner = _runners.get(job.get("kind"))
+    stop_heartbeat = threading.Event()
+    threading.Thread(
+        target=_heartbeat,
+        args=(app._get_current_object(), job_key, worker, stop_heartbeat),
+        name=f"{threading.current_thread().name}-heartbeat",
+        daemon=True,
+    ).start()
+    try:
+        if runner is None:
+            raise AppError(500, f"No report runner registered for '{job.get('kind')}'.")
+        if not in_request:
+            _login_job_user(job)
+        result = runner(job)
+        handler.mark_done(job_key, worker, result)
+        app.logger.info(f"[REPORT JOBS] {job_key} done: {result}")
+    except AppError as app_err:
+        handler.mark_failed(job_key, worker, app_err.message)
+        app.logger.error(f"[REPORT JOBS] {job_key} failed: {app_err.message} | {app_err.details}")
+    except Exception as exc:
+        handler.mark_failed(
+            job_key, worker, "An unexpected error occurred while rendering the report."
+        )
+        app.logger.exception(f"[REPORT JOBS] {job_key} failed: {exc}")
+    finally:
+        stop_heartbeat.set()
+
+
+def _heartbeat(flask_app: Flask, job_key: str, worker: str, stop: threading.Event) -> None:
+    """
+    Refresh the heartbeat of a running job until `stop` is set or the job is lost.
+    """
+    interval = max(1, flask_app.config.get("REPORT_JOB_STALE_SECONDS", 600) / 3)
+    with flask_app.app_context():
+        while not stop.wait(interval):
+            try:
+                if not store.report_jobs_handler.heartbeat(job_key, worker):
+                    flask_app.logger.warning(f"[REPORT JOBS] {job_key} no longer held by {worker}")
+                    return
+            except Exception as exc:
+                flask_app.logger.warning(f"[REPORT JOBS] Heartbeat of {job_key} failed: {exc}")
+
+
+def _login_job_user(job: dict) -> None:
+    """
+    Log the submitting user into the job request context.
+    """
+    from coyote.blueprints.login.views import load_user
+
+    user = load_user(job["user_id"]) if job.get("user_id") else None
+    if user is None:
+        raise AppError(403, f"User '{job.get('created_by')}' of the report job not found.")
+    login_user(user)
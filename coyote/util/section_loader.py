@@ -0,0 +1,186 @@
+#  Copyright (c) 2025 Coyote3 Project Authors
+#  All rights reserved.
+#
+#  This source file is part of the Coyote3 codebase.
+#  The Coyote3 project provides a framework for genomic data analysis,
+#  interpretation, reporting, and clinical diagnostics.
+#
+#  Unauthorized use, distribution, or modification of this software or its
+#  components is strictly prohibited without prior written permission from
+#  the copyright holders.
+#
+
+
+"""
+Coyote3 Section Loader
+=====================================
+
+This module provides the `SectionLoader` class, which runs the independent
+data fetches of a view (variant sections, BAM lookups, metadata) concurrently
+on a bounded, process-wide thread pool and joins them before rendering.
+
+Each section runs inside a copy of the current request context, so handlers
+can use `current_app` as usual. Pushing that copy gives the pool thread a new,
+empty `flask.g`, so the attributes of the request's `g` (the request cache, the
+BAM path memo, the logged in user) are attached to it before the section runs;
+sections and the view then share the same memoized lookups. Per-section timings
+are logged and kept on `flask.g.section_timings` for the rest of the request.
+"""
+
+# -------------------------------------------------------------------------
+# Imports
+# -------------------------------------------------------------------------
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable
+import threading
+import time
+from flask import current_app as app
+from flask import copy_current_request_context, g, has_request_context
+from coyote.db.request_cache import RequestCache
+
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
+
+# Memo dictionaries on `flask.g` that sections fill for the view (and each other). They are
+# created before the sections start, so entries added by a section land in the request's dict.
+SHARED_G_CONTAINERS = (RequestCache.G_ATTR, "sample_bams")
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """
+    Return the process-wide section thread pool, creating it on first use.
+
+    The pool size comes from `SECTION_LOADER_MAX_WORKERS`; it bounds the number of
+    concurrent MongoDB operations the section loaders of all requests can start.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=app.config.get("SECTION_LOADER_MAX_WORKERS", 8),
+                thread_name_prefix="coyote-sections",
+            )
+        return _executor
+
+
+# -------------------------------------------------------------------------
+# Class Definition
+# -------------------------------------------------------------------------
+class SectionLoader:
+    """
+    Collects independent section fetches and runs them concurrently.
+
+    Sections must not depend on each other's results. With `SECTION_LOADER_ENABLED`
+    switched off the sections run one after another in the calling thread.
+
+    Example:
+        loader = SectionLoader("list_variants")
+        loader.add("biomarkers", store.biomarker_handler.get_sample_biomarkers, sample_id=sid)
+        sections = loader.run()
+    """
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name (str): Name of the view, used in the timing log line.
+        """
+        self.name = name
+        self.timings: dict[str, float] = {}
+        self._sections: dict[str, tuple[Callable, tuple, dict]] = {}
+
+    def add(self, section: str, func: Callable, *args, **kwargs) -> None:
+        """
+        Register a section fetch.
+
+        Args:
+            section (str): Unique section name, the key of the result.
+            func (Callable): The fetch function; should return materialized data (lists,
+                not cursors) so the round trips happen on the pool.
+            *args: Positional arguments for `func`.
+            **kwargs: Keyword arguments for `func`.
+        """
+        self._sections[section] = (func, args, kwargs)
+
+    @staticmethod
+    def _request_g_state() -> dict[str, Any]:
+        """
+        Return the attributes of the request's `flask.g` to attach in the section threads.
+
+        The shared memo dictionaries are created first; other attributes a section sets on
+        `g` stay in its thread.
+        """
+        for name in SHARED_G_CONTAINERS:
+            g.setdefault(name, {})
+        return dict(g.__dict__)
+
+    def _timed(
+        self,
+        section: str,
+        func: Callable,
+        args: tuple,
+        kwargs: dict,
+        g_state: dict[str, Any] | None = None,
+    ) -> Any:
+        for name, value in (g_state or {}).items():
+            setattr(g, name, value)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self.timings[section] = (time.perf_counter() - start) * 1000
+
+    def run(self) -> dict[str, Any]:
+        """
+        Run all registered sections and wait for them.
+
+        Returns:
+            dict[str, Any]: The result of each section, keyed by section name.
+
+        Raises:
+            Exception: The first exception raised by a section, after all sections finished.
+        """
+        start = time.perf_counter()
+        results: dict[str, Any] = {}
+
+        if not app.config.get("SECTION_LOADER_ENABLED", True) or len(self._sections) < 2:
+            for section, (func, args, kwargs) in self._sections.items():
+                results[section] = self._timed(section, func, args, kwargs)
+        else:
+            executor = _get_executor()
+            futures: dict[str, Future] = {}
+            g_state = None
+            if has_request_context():
+                g_state = self._request_g_state()
+            for section, (func, args, kwargs) in self._sections.items():
+                task = self._timed
+                if g_state is not None:
+                    task = copy_current_request_context(task)
+                futures[section] = executor.submit(task, section, func, args, kwargs, g_state)
+
+            error = None
+            for section, future in futures.items():
+                try:
+                    results[section] = future.result()
+                except Exception as exc:
+                    error = error or exc
+            if error is not None:
+                raise error
+
+        total = (time.perf_counter() - start) * 1000
+        self._log_timings(total)
+        return results
+
+    def _log_timings(self, total: float) -> None:
+        """
+        Log the per-section timing breakdown and keep it on `flask.g.section_timings`.
+        """
+        breakdown = ", ".join(
+            f"{section}={ms:.1f}ms"
+            for section, ms in sorted(self.timings.items(), key=lambda item: -item[1])
+        )
+        app.logger.info(f"[SECTIONS] {self.name} {total:.1f}ms total: {breakdown}")
+        if has_request_context():
+            g.setdefault("section_timings", {}).update(
+                {f"{self.name}.{section}": ms for section, ms in self.timings.items()}
+            )
@@ -311,6 +311,20 @@ def get_custom_config(log_dir: str, is_production: bool) -> Dict[str, Any]:
             "days_to_keep": 180,
             "delete_old": True,
         },
+        "query_stats": {
+            "level": "INFO",
+            "()": CustomTimedRotatingFileHandler,
+            "filters": ["request_filter"],
+            "formatter": "standard",
+            "level_name": "query_stats",
+            "log_dir": log_dir,
+            "subdir": "query_stats",
+            "flat": True,
+            "when": "midnight",
+            "interval": 1,
+            "days_to_keep": 30,
+            "delete_old": True,
+        },
         "werkzeug": {
             "level": "INFO",
             "()": CustomTimedRotatingFileHandler,
@@ -412,6 +426,11 @@ def get_custom_config(log_dir: str, is_production: bool) -> Dict[str, Any]:
             "handlers": ["audit", "console"],
             "propagate": False,
         },
+        "query_stats": {
+            "level": "INFO",
+            "handlers": ["query_stats"],
+            "propagate": False,
+        },
     }
 
     return {
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+
+#  Copyright (c) 2025 Coyote3 Project Authors
+#  All rights reserved.
+#
+#  This source file is part of the Coyote3 codebase.
+#  The Coyote3 project provides a framework for genomic data analysis,
+#  interpretation, reporting, and clinical diagnostics.
+#
+#  Unauthorized use, distribution, or modification of this software or its
+#  components is strictly prohibited without prior written permission from
+#  the copyright holders.
+#
+
+"""
+build_variant_occurrences.py
+
+Maintain the cross-sample variant occurrence index (`variant_occurrences` collection)
+used by the variant detail page for recurrence counts and the recent sample list.
+
+- Record named samples after loading them:         --sample-names "name1,name2"
+- Backfill every sample not yet in the index:      (no arguments)
+- Drop and rebuild the whole index:                --rebuild
+
+Samples are marked with `occurrences_indexed`, so running the script again only records
+samples loaded since the last run. Sample deletion through the admin UI removes the
+sample from the index.
+
+The script boots the app the same way as wsgi.py (DEVELOPMENT / TESTING env vars) so it
+uses the configured databases and collection names.
+
+MongoDB 3.4 compatible.
+
+Example Commands
+
+python scripts/build_variant_occurrences.py --sample-names "25MD17060p-2"
+
+DEVELOPMENT=1 python scripts/build_variant_occurrences.py
+
+python scripts/build_variant_occurrences.py --rebuild
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ["MONGO_ENSURE_INDEXES"] = "false"
+
+from coyote import init_app  # noqa: E402
+from coyote.extensions import store  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build the Coyote3 variant occurrence index.")
+    parser.add_argument("--sample-names", help="Comma separated sample names to record")
+    parser.add_argument(
+        "--rebuild", action="store_true", help="Drop the index and record every sample again"
+    )
+    args = parser.parse_args()
+
+    app = init_app(
+        testing=bool(int(os.getenv("TESTING", 0))),
+        development=bool(int(os.getenv("DEVELOPMENT", 0))),
+    )
+    with app.app_context():
+        handler = store.variant_occurrences_handler
+        if args.rebuild:
+            handler.get_collection().delete_many({})
+            store.samples_collection.update_many({}, {"$unset": {"occurrences_indexed": ""}})
+
+        query = {"occurrences_indexed": {"$exists": False}}
+        if args.sample_names:
+            query = {
+                "name": {"$in": [n.strip() for n in args.sample_names.split(",") if n.strip()]}
+            }
+
+        samples = list(store.samples_collection.find(query, {"name": 1}).sort("time_added", 1))
+        recorded = 0
+        for sample in samples:
+            count = handler.record_sample(str(sample["_id"]))
+            recorded += 1 if count else 0
+            print(f"{sample.get('name')}: {count} variants")
+
+        print(f"Recorded {recorded} of {len(samples)} samples.")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+
+#  Copyright (c) 2025 Coyote3 Project Authors
+#  All rights reserved.
+#
+#  This source file is part of the Coyote3 codebase.
+#  The Coyote3 project provides a framework for genomic data analysis,
+#  interpretation, reporting, and clinical diagnostics.
+#
+#  Unauthorized use, distribution, or modification of this software or its
+#  components is strictly prohibited without prior written permission from
+#  the copyright holders.
+#
+
+"""
+import_blacklist.py
+
+Bulk import blacklisted positions for one assay group into the `blacklist` collection.
+
+The input is a tab separated file with one position per line:
+
+    <simple_id>[<TAB><in_normal_perc>]
+
+e.g. `12_6593408_T_G	0.35`. Lines starting with `#` are skipped; a missing
+`in_normal_perc` defaults to 1. Positions are upserted on (assay, pos) and the assay
+blacklist stamp is bumped, so every worker reloads its in-process blacklist snapshot.
+Always import through this script (or the UI) rather than writing to the collection
+directly, otherwise running workers keep serving the previous snapshot.
+
+The script boots the app the same way as wsgi.py (DEVELOPMENT / TESTING env vars).
+
+MongoDB 3.4 compatible.
+
+Example Commands
+
+python scripts/import_blacklist.py --assay myeloid --file /data/blacklist/myeloid.tsv
+
+python scripts/import_blacklist.py --assay solid --file solid.tsv --replace
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import Iterator
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ["MONGO_ENSURE_INDEXES"] = "false"
+
+from coyote import init_app  # noqa: E402
+from coyote.extensions import store  # noqa: E402
+
+
+def read_entries(path: str) -> Iterator[tuple[str, float]]:
+    """
+    Yield `(simple_id, in_normal_perc)` pairs from a blacklist TSV file.
+    """
+    with open(path) as handle:
+        for line in handle:
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            fields = line.split("\t")
+            yield fields[0], float(fields[1]) if len(fields) > 1 and fields[1] else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Bulk import blacklisted positions.")
+    parser.add_argument("--assay", required=True, help="Assay group the positions belong to")
+    parser.add_argument("--file", required=True, help="TSV file with simple_id and in_normal_perc")
+    parser.add_argument(
+        "--replace",
+        action="store_true",
+        help="Remove positions of the assay that are not in the file",
+    )
+    args = parser.parse_args()
+
+    app = init_app(
+        testing=bool(int(os.getenv("TESTING", 0))),
+        development=bool(int(os.getenv("DEVELOPMENT", 0))),
+    )
+    with app.app_context():
+        counts = store.blacklist_handler.import_blacklist(
+            read_entries(args.file), args.assay, replace=args.replace
+        )
+        print(
+            f"{args.assay}: {counts['upserted']} added, {counts['modified']} updated, "
+            f"{counts['removed']} removed"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+
+#  Copyright (c) 2025 Coyote3 Project Authors
+#  All rights reserved.
+#
+#  This source file is part of the Coyote3 codebase.
+#  The Coyote3 project provides a framework for genomic data analysis,
+#  interpretation, reporting, and clinical diagnostics.
+#
+#  Unauthorized use, distribution, or modification of this software or its
+#  components is strictly prohibited without prior written permission from
+#  the copyright holders.
+#
+
+"""
+index_audit.py
+
+Report index health for the collections used by the Coyote3 handlers:
+- missing:  indexes declared in a handler's `ensure_indexes` that do not exist yet
+- unused:   existing indexes without any recorded access ($indexStats, counted since
+            the last mongod restart)
+- collscan: probe queries (the query shapes the hot handlers issue, filled with values
+            from the newest sample) whose winning plan contains a COLLSCAN
+
+The script boots the app the same way as wsgi.py (DEVELOPMENT / TESTING env vars) so it
+audits the configured databases and collection names. Index creation at startup is
+switched off for the audit; pass --create to create the missing indexes afterwards.
+
+MongoDB 3.4 compatible.
+
+Example Commands
+
+DEVELOPMENT=1 python scripts/index_audit.py
+
+python scripts/index_audit.py --json > /tmp/index_audit.json
+
+python scripts/index_audit.py --create
+"""
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ["MONGO_ENSURE_INDEXES"] = "false"
+
+from pymongo.errors import OperationFailure  # noqa: E402
+
+from coyote import init_app  # noqa: E402
+from coyote.extensions import store  # noqa: E402
+
+
+def planned_indexes() -> list[dict[str, Any]]:
+    """
+    Collect the indexes every handler would create, without creating them.
+    """
+    plan = []
+    for handler_name, handler in store.handlers().items():
+
+        def _record(keys, name, collection=None, _handler=handler, _name=handler_name, **kwargs):
+            col = collection if collection is not None else _handler.get_collection()
+            plan.append(
+                {
+                    "handler": _name,
+                    "collection": col,
+                    "name": name,
+                    "keys": [(field, direction) for field, direction in keys],
+                }
+            )
+
+        handler.create_index = _record
+        try:
+            handler.ensure_indexes()
+        finally:
+            del handler.create_index
+    return plan
+
+
+def find_missing(plan: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Return planned indexes whose key pattern does not exist on the collection.
+    """
+    existing: dict[str, list] = {}
+    missing = []
+    for index in plan:
+        col = index["collection"]
+        if col.full_name not in existing:
+            existing[col.full_name] = [
+                list(info["key"]) for info in col.index_information().values()
+            ]
+        if [tuple(key) for key in index["keys"]] not in [
+            [tuple(key) for key in keys] for keys in existing[col.full_name]
+        ]:
+            missing.append(
+                {
+                    "handler": index["handler"],
+                    "collection": col.full_name,
+                    "name": index["name"],
+                    "keys": index["keys"],
+                }
+            )
+    return missing
+
+
+def find_unused(collections: list) -> list[dict[str, Any]]:
+    """
+    Return indexes (other than `_id_`) that have not been used since the server started.
+    """
+    unused = []
+    for col in collections:
+        try:
+            stats = list(col.aggregate([{"$indexStats": {}}]))
+        except OperationFailure as exc:
+            print(f"[WARN] $indexStats not available for {col.full_name}: {exc}", file=sys.stderr)
+            continue
+        for stat in stats:
+            if stat["name"] != "_id_" and stat.get("accesses", {}).get("ops", 0) == 0:
+                unused.append(
+                    {
+                        "collection": col.full_name,
+                        "name": stat["name"],
+                        "keys": list(stat.get("key", {}).items()),
+                        "since": str(stat.get("accesses", {}).get("since")),
+                    }
+                )
+    return unused
+
+
+def build_probes() -> list[tuple[str, str, Any, dict, list | None]]:
+    """
+    Build representative queries for the hot handler query paths.
+
+    Values are taken from the newest sample and one of its variants so the planner
+    sees realistic selectivity.
+
+    Returns:
+        list[tuple]: `(handler, label, collection, query, sort)` tuples.
+    """
+    sample = store.samples_collection.find_one({}, sort=[("time_added", -1)]) or {}
+    sample_id = str(sample.get("_id", ""))
+    variant = store.variants_collection.find_one({"SAMPLE_ID": sample_id}) or {}
+    csq = variant.get("INFO", {}).get("selected_CSQ", {})
+    gene = csq.get("SYMBOL", "")
+    simple_id = variant.get("simple_id", "")
+    assay = sample.get("assay", "")
+
+    return [
+        (
+            "variant_handler",
+            "variants of a sample",
+            store.variants_collection,
+            {"SAMPLE_ID": sample_id},
+            None,
+        ),
+        (
+            "variant_handler",
+            "variant in other samples",
+            store.variants_collection,
+            {"simple_id": simple_id, "SAMPLE_ID": {"$ne": sample_id}},
+            None,
+        ),
+        (
+            "annotation_handler",
+            "global annotations",
+            store.annotations_collection,
+            {"gene": gene, "nomenclature": "p", "variant": csq.get("HGVSp", "")},
+            [("time_created", 1)],
+        ),
+        (
+            "annotation_handler",
+            "annotations by variant",
+            store.annotations_collection,
+            {"variant": csq.get("HGVSc", "")},
+            [("time_created", 1)],
+        ),
+        (
+            "blacklist_handler",
+            "blacklisted positions",
+            store.blacklist_collection,
+            {"assay": assay, "pos": {"$in": [simple_id]}},
+            None,
+        ),
+        (
+            "groupcov_handler",
+            "gene blacklist",
+            store.groupcov_collection,
+            {"gene": gene, "group": assay, "region": "gene"},
+            None,
+        ),
+        ("cnv_handler", "CNVs of a sample", store.cnvs_collection, {"SAMPLE_ID": sample_id}, None),
+        (
+            "transloc_handler",
+            "translocations of a sample",
+            store.transloc_collection,
+            {"SAMPLE_ID": sample_id},
+            None,
+        ),
+        (
+            "fusion_handler",
+            "fusions of a sample",
+            store.fusions_collection,
+            {"SAMPLE_ID": sample_id},
+            None,
+        ),
+        (
+            "biomarker_handler",
+            "biomarkers of a sample",
+            store.biomarkers_collection,
+            {"SAMPLE_ID": sample_id},
+            None,
+        ),
+        (
+            "sample_handler",
+            "samples home (live)",
+            store.samples_collection,
+            {
+                "assay": {"$in": [assay]},
+                "profile": {"$in": [sample.get("profile", "")]},
+                "$or": [{"report_num": {"$exists": False}}, {"report_num": 0}],
+            },
+            [("time_added", -1)],
+        ),
+        (
+            "sample_handler",
+            "sample by name",
+            store.samples_collection,
+            {"name": sample.get("name", "")},
+            None,
+        ),
+        (
+            "hgnc_handler",
+            "gene metadata by symbol",
+            store.hgnc_collection,
+            {"hgnc_symbol": gene},
+            None,
+        ),
+        (
+            "oncokb_handler",
+            "OncoKB annotation",
+            store.oncokb_collection,
+            {"Gene": gene, "Alteration": {"$in": [csq.get("HGVSp", "")]}},
+            None,
+        ),
+        (
+            "reported_variants_handler",
+            "reported variants of a sample",
+            store.reported_variants_collection,
+            {"sample_oid": sample.get("_id")},
+            None,
+        ),
+    ]
+
+
+def _stages(plan: dict) -> list[str]:
+    """
+    Flatten the stage names of an explain plan tree.
+    """
+    stages = [plan.get("stage", "")]
+    for key in ("inputStage", "queryPlan"):
+        if key in plan:
+            stages.extend(_stages(plan[key]))
+    for child in plan.get("inputStages", []):
+        stages.extend(_stages(child))
+    return stages
+
+
+def find_collscans() -> list[dict[str, Any]]:
+    """
+    Explain every probe query and return the ones planned as collection scans.
+    """
+    collscans = []
+    for handler, label, col, query, sort in build_probes():
+        cursor = col.find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        try:
+            explain = cursor.explain()
+        except OperationFailure as exc:
+            print(f"[WARN] explain failed for {label}: {exc}", file=sys.stderr)
+            continue
+        stages = _stages(explain.get("queryPlanner", {}).get("winningPlan", {}))
+        if "COLLSCAN" in stages:
+            collscans.append(
+                {
+                    "handler": handler,
+                    "probe": label,
+                    "collection": col.full_name,
+                    "plan": " <- ".join(stages),
+                }
+            )
+    return collscans
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Audit MongoDB indexes used by Coyote3 handlers.")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument(
+        "--create", action="store_true", help="Create missing indexes after the audit"
+    )
+    args = parser.parse_args()
+
+    app = init_app(
+        testing=bool(int(os.getenv("TESTING", 0))),
+        development=bool(int(os.getenv("DEVELOPMENT", 0))),
+    )
+    with app.app_context():
+        plan = planned_indexes()
+        collections = list(
+            {index["collection"].full_name: index["collection"] for index in plan}.values()
+        )
+        report = {
+            "missing": find_missing(plan),
+            "unused": find_unused(collections),
+            "collscan": find_collscans(),
+        }
+
+        if args.json:
+            print(json.dumps(report, indent=2, default=str))
+        else:
+            for section, rows in report.items():
+                print(f"== {section} ({len(rows)}) ==")
+                for row in rows:
+                    print("  " + ", ".join(f"{k}={v}" for k, v in row.items()))
+
+        if args.create:
+            store.ensure_indexes()
+            print("Index creation started (background builds).")
+
+    return 1 if report["missing"] or report["collscan"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
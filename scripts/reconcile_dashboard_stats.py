@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+#  Copyright (c) 2025 Coyote3 Project Authors
+#  All rights reserved.
+#
+#  This source file is part of the Coyote3 codebase.
+#  The Coyote3 project provides a framework for genomic data analysis,
+#  interpretation, reporting, and clinical diagnostics.
+#
+#  Unauthorized use, distribution, or modification of this software or its
+#  components is strictly prohibited without prior written permission from
+#  the copyright holders.
+#
+
+"""
+reconcile_dashboard_stats.py
+
+Recompute the materialized dashboard statistics (`dashboard_stats` collection) from the
+source collections.
+
+The dashboard counters are kept up to date incrementally by the ingest, report, delete
+and false positive paths. Data written outside the app (e.g. samples loaded without
+recording their variant occurrences, or manual database fixes) is only picked up by a
+reconcile. The app reconciles by itself once the statistics are older than
+`DASHBOARD_STATS_RECONCILE_SECONDS`; run this script from cron (e.g. nightly) or right
+after bulk loads or cleanups.
+
+The script boots the app the same way as wsgi.py (DEVELOPMENT / TESTING env vars).
+
+MongoDB 3.4 compatible.
+
+Example Commands
+
+python scripts/reconcile_dashboard_stats.py
+
+DEVELOPMENT=1 python scripts/reconcile_dashboard_stats.py
+"""
+
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+os.environ["MONGO_ENSURE_INDEXES"] = "false"
+
+from coyote import init_app  # noqa: E402
+from coyote.extensions import store  # noqa: E402
+
+
+def main() -> int:
+    app = init_app(
+        testing=bool(int(os.getenv("TESTING", 0))),
+        development=bool(int(os.getenv("DEVELOPMENT", 0))),
+    )
+    with app.app_context():
+        stats = store.dashboard_stats_handler.reconcile()
+        print(
+            f"samples: {stats['samples']['total']} ({stats['samples']['analysed']} analysed), "
+            f"variants: {stats['variants']['total_variants']}, "
+            f"false positives: {stats['variants']['fps']}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())